@@ -2,13 +2,59 @@
 System Resource Monitoring Package
 
 시스템 리소스를 모니터링하고 PDF 리포트를 생성하는 패키지입니다.
+클래스는 처음 사용할 때 불러오므로 수집기만 쓰는 경우 matplotlib, reportlab을 불러오지 않습니다.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 __author__ = "System Monitor"
 
-from .resource_collector import ResourceCollector
-from .graph_generator import GraphGenerator
-from .pdf_reporter import PDFReporter
+# 공개 클래스: 정의된 모듈 (PEP 562 지연 로딩)
+_LAZY_ATTRIBUTES = {
+    'ResourceCollector': 'resource_collector',
+    'AsyncResourceCollector': 'async_collector',
+    'CollectorRegistry': 'collector_registry',
+    'HistoryStore': 'history_store',
+    'MetricStats': 'metric_stats',
+    'MetricSeries': 'metric_series',
+    'ProcfsBackend': 'procfs_backend',
+    'ProcessSampler': 'process_sampler',
+    'SamplingScheduler': 'scheduler',
+    'AdaptiveScheduler': 'scheduler',
+    'SamplingSession': 'sampling_session',
+    'GraphGenerator': 'graph_generator',
+    'PDFReporter': 'pdf_reporter',
+}
+
+if TYPE_CHECKING:
+    from .resource_collector import ResourceCollector
+    from .async_collector import AsyncResourceCollector
+    from .collector_registry import CollectorRegistry
+    from .history_store import HistoryStore
+    from .metric_stats import MetricStats
+    from .metric_series import MetricSeries
+    from .procfs_backend import ProcfsBackend
+    from .process_sampler import ProcessSampler
+    from .scheduler import SamplingScheduler, AdaptiveScheduler
+    from .sampling_session import SamplingSession
+    from .graph_generator import GraphGenerator
+    from .pdf_reporter import PDFReporter
+
+
+def __getattr__(name: str):
+    """공개 클래스를 처음 사용할 때 해당 모듈을 불러옴"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
-__all__ = ['ResourceCollector', 'GraphGenerator', 'PDFReporter']
+__all__ = ['ResourceCollector', 'AsyncResourceCollector', 'CollectorRegistry', 'HistoryStore', 'MetricStats', 'MetricSeries', 'ProcfsBackend', 'ProcessSampler', 'SamplingScheduler', 'AdaptiveScheduler', 'SamplingSession', 'GraphGenerator', 'PDFReporter']
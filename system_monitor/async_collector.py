@@ -0,0 +1,226 @@
+"""
+비동기 수집 모듈
+asyncio 서비스에서 이벤트 루프를 막지 않고 시스템 리소스를 수집합니다.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+try:
+    from .resource_collector import (ResourceCollector, CPU_SAMPLING_BLOCKING, CPU_SAMPLING_DELTA,
+                                     CPU_SAMPLING_MODES)
+    from .history_store import HistoryView
+    from .scheduler import SamplingScheduler
+except ImportError:
+    from resource_collector import (ResourceCollector, CPU_SAMPLING_BLOCKING, CPU_SAMPLING_DELTA,
+                                    CPU_SAMPLING_MODES)
+    from history_store import HistoryView
+    from scheduler import SamplingScheduler
+
+# 'blocking' 방식의 CPU 측정 구간 (초)
+CPU_SAMPLING_WINDOW = 1.0
+
+# 소비자가 샘플을 가져가는 속도가 느릴 때의 처리 방식
+BACKPRESSURE_DROP_OLDEST = 'drop-oldest'  # 버퍼가 가득 차면 가장 오래된 샘플을 버림
+BACKPRESSURE_BLOCK = 'block'              # 소비자가 가져갈 때까지 수집을 멈춤 (지나간 시점은 누락 처리)
+BACKPRESSURE_POLICIES = (BACKPRESSURE_DROP_OLDEST, BACKPRESSURE_BLOCK)
+
+# 수집 종료를 알리는 표시
+_END = object()
+
+
+class AsyncResourceCollector:
+    """
+    asyncio용 시스템 리소스 수집기
+
+    내부의 ResourceCollector를 전용 작업 스레드 하나에서 실행하므로 GPU 조회 등
+    블로킹 작업이 이벤트 루프를 막지 않고, 수집기 상태는 한 스레드에서만 변경됩니다.
+    'blocking' CPU 측정의 1초 대기는 asyncio.sleep으로 대신합니다.
+    """
+
+    def __init__(self, cpu_sampling: str = CPU_SAMPLING_BLOCKING, **kwargs):
+        """
+        초기화
+
+        Args:
+            cpu_sampling: CPU 사용률 측정 방식 ('blocking' 또는 'delta')
+            **kwargs: ResourceCollector에 전달할 나머지 설정
+        """
+        if cpu_sampling not in CPU_SAMPLING_MODES:
+            raise ValueError(f"지원하지 않는 CPU 측정 방식입니다: {cpu_sampling}")
+
+        self.cpu_sampling = cpu_sampling
+        # 측정 구간의 시작 CPU 시간을 직접 기록하므로 내부 수집기는 항상 delta 방식 사용
+        self.collector = ResourceCollector(cpu_sampling=CPU_SAMPLING_DELTA, **kwargs)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='async-collector')
+        self._lock = asyncio.Lock()
+
+    async def _run(self, func: Callable):
+        """작업 스레드에서 함수 실행"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+    async def collect_all(self) -> Dict:
+        """
+        모든 시스템 리소스 정보 수집 (이벤트 루프를 막지 않음)
+
+        취소되면 1초 대기 중인 경우 바로 중단됩니다. 이미 작업 스레드에서 시작된
+        수집은 끝까지 실행되어 히스토리에 기록되며, 다음 수집은 그 뒤에 실행됩니다.
+        """
+        async with self._lock:
+            if self.cpu_sampling == CPU_SAMPLING_BLOCKING:
+                self.collector.cpu_times_last = await self._run(self.collector.backend.cpu_times)
+                await asyncio.sleep(CPU_SAMPLING_WINDOW)
+            return await self._run(self.collector.collect_all)
+
+    def sample(self, interval: float, count: Optional[int] = None, duration: Optional[float] = None,
+               buffer_size: int = 1, backpressure: str = BACKPRESSURE_DROP_OLDEST) -> 'SampleStream':
+        """
+        일정 간격으로 수집하는 비동기 이터레이터 생성
+
+        Example:
+            async with collector.sample(1.0) as samples:
+                async for data in samples:
+                    ...
+
+        Args:
+            interval: 수집 간격 (초)
+            count: 최대 수집 횟수 (None이면 제한 없음)
+            duration: 최대 수집 시간 (초, None이면 제한 없음)
+            buffer_size: 소비자가 가져가지 않은 샘플을 보관할 개수
+            backpressure: 버퍼가 가득 찼을 때의 처리 방식 ('drop-oldest' 또는 'block')
+        """
+        return SampleStream(self, interval, count, duration, buffer_size, backpressure)
+
+    @property
+    def history(self):
+        """수집된 데이터 저장소 (HistoryStore)"""
+        return self.collector.history
+
+    @property
+    def stats(self):
+        """수집 중 갱신되는 지표 통계 (MetricStats)"""
+        return self.collector.stats
+
+    def get_history(self) -> HistoryView:
+        """수집된 데이터 히스토리 반환"""
+        return self.collector.get_history()
+
+    async def close(self):
+        """진행 중인 수집이 끝나기를 기다린 뒤 수집기와 작업 스레드 정리"""
+        async with self._lock:
+            await self._run(self.collector.close)
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> 'AsyncResourceCollector':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class SampleStream:
+    """
+    AsyncResourceCollector.sample()이 반환하는 비동기 이터레이터
+
+    수집 작업(producer)이 deadline마다 수집하여 크기가 제한된 큐에 넣고, 소비자는
+    async for로 꺼내 갑니다. async with 블록을 벗어나거나 aclose()를 호출하면
+    수집 작업이 취소됩니다.
+    """
+
+    def __init__(self, collector: AsyncResourceCollector, interval: float, count: Optional[int],
+                 duration: Optional[float], buffer_size: int, backpressure: str):
+        if buffer_size <= 0:
+            raise ValueError("버퍼 크기는 1 이상이어야 합니다.")
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"지원하지 않는 처리 방식입니다: {backpressure}")
+
+        self.collector = collector
+        self.scheduler = SamplingScheduler(interval)
+        self.count = count
+        self.duration = duration
+        self.buffer_size = buffer_size
+        self.backpressure = backpressure
+        self.dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._finished = False
+
+    async def _put(self, item):
+        """큐에 넣기 (drop-oldest 방식이면 가득 찼을 때 가장 오래된 샘플을 버림)"""
+        if self.backpressure == BACKPRESSURE_DROP_OLDEST and self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        await self._queue.put(item)
+
+    async def _produce(self):
+        """deadline마다 수집하여 큐에 넣는 작업"""
+        try:
+            async for _ in self.scheduler.aticks(self.count, self.duration):
+                await self._put(await self.collector.collect_all())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 소비자 쪽에서 다시 발생시키도록 전달 (종료 표시는 샘플을 밀어내지 않고 대기)
+            await self._queue.put(e)
+            return
+        await self._queue.put(_END)
+
+    def __aiter__(self) -> 'SampleStream':
+        return self
+
+    async def __anext__(self) -> Dict:
+        if self._finished:
+            raise StopAsyncIteration
+        if self._task is None:
+            self._queue = asyncio.Queue(self.buffer_size)
+            self._task = asyncio.get_running_loop().create_task(self._produce())
+
+        item = await self._queue.get()
+        if item is _END:
+            self._finished = True
+            raise StopAsyncIteration
+        if isinstance(item, Exception):
+            self._finished = True
+            raise item
+        return item
+
+    async def aclose(self):
+        """수집 작업 취소"""
+        self._finished = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> Dict:
+        """스케줄러 통계에 버려진 샘플 수 추가"""
+        stats = self.scheduler.get_stats()
+        stats['dropped_samples'] = self.dropped
+        return stats
+
+    async def __aenter__(self) -> 'SampleStream':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+
+if __name__ == "__main__":
+    # 테스트 코드 (수집 중에도 이벤트 루프가 다른 작업을 계속 실행하는지 확인)
+    async def heartbeat():
+        while True:
+            await asyncio.sleep(0.1)
+            print('.', end='', flush=True)
+
+    async def main():
+        beat = asyncio.create_task(heartbeat())
+        async with AsyncResourceCollector() as collector:
+            async with collector.sample(1.0, count=3) as samples:
+                async for data in samples:
+                    print(f"\nCPU {data['cpu']['percent']}% | 메모리 {data['memory']['percent']}%")
+        beat.cancel()
+
+    asyncio.run(main())
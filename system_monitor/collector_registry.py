@@ -0,0 +1,137 @@
+"""
+수집기 레지스트리 모듈
+수집기별 수집 간격과 비용 등급을 관리하고, 수집 시점마다 실행할 수집기를 고릅니다.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+
+# 수집기 비용 등급
+COST_CHEAP = 'cheap'          # 매 수집 시점마다 실행
+COST_EXPENSIVE = 'expensive'  # 간격을 지정하지 않으면 expensive_interval마다 실행
+COST_CLASSES = (COST_CHEAP, COST_EXPENSIVE)
+
+# 비싼 수집기의 기본 수집 간격 (초)
+DEFAULT_EXPENSIVE_INTERVAL = 10.0
+
+# 수집 시점의 jitter로 한 번씩 건너뛰지 않도록 간격에서 빼 주는 비율
+DUE_TOLERANCE = 0.05
+
+
+class CollectorSpec:
+    """등록된 수집기 정보"""
+
+    def __init__(self, name: str, func: Callable, key: str, interval: Optional[float], cost: str):
+        """
+        초기화
+
+        Args:
+            name: 수집기 이름 (collection_time의 키)
+            func: 수집 함수
+            key: 결과를 저장할 데이터 키 (여러 수집기가 같은 키를 쓰면 결과를 병합)
+            interval: 수집 간격 (초, None이면 비용 등급에 따라 결정)
+            cost: 비용 등급 ('cheap' 또는 'expensive')
+        """
+        self.name = name
+        self.func = func
+        self.key = key
+        self.interval = interval
+        self.cost = cost
+        self.next_run = 0.0
+        self.last_result = None
+
+
+class CollectorRegistry:
+    """
+    수집기 레지스트리
+
+    각 수집기는 자신의 수집 간격과 비용 등급을 선언합니다. 간격이 없는 cheap
+    수집기는 매번, 간격이 없는 expensive 수집기는 expensive_interval마다 실행되며,
+    실행되지 않은 수집기는 마지막 결과를 그대로 사용하여 같은 타임라인에 병합됩니다.
+    """
+
+    def __init__(self, expensive_interval: float = DEFAULT_EXPENSIVE_INTERVAL):
+        """
+        초기화
+
+        Args:
+            expensive_interval: 간격을 지정하지 않은 expensive 수집기의 수집 간격 (초)
+        """
+        self.expensive_interval = expensive_interval
+        self._specs: Dict[str, CollectorSpec] = {}
+
+    def register(self, name: str, func: Callable, key: Optional[str] = None,
+                 interval: Optional[float] = None, cost: str = COST_CHEAP):
+        """
+        수집기 등록 (같은 이름이 있으면 교체)
+
+        Args:
+            name: 수집기 이름
+            func: 인자 없이 호출되는 수집 함수
+            key: 결과를 저장할 데이터 키 (기본값: name)
+            interval: 수집 간격 (초, 0이면 매번 실행)
+            cost: 비용 등급 ('cheap' 또는 'expensive')
+        """
+        if cost not in COST_CLASSES:
+            raise ValueError(f"지원하지 않는 비용 등급입니다: {cost}")
+        if interval is not None and interval < 0:
+            raise ValueError("수집 간격은 0 이상이어야 합니다.")
+        self._specs[name] = CollectorSpec(name, func, key or name, interval, cost)
+
+    def unregister(self, name: str):
+        """수집기 등록 해제"""
+        self._specs.pop(name, None)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def specs(self) -> List[CollectorSpec]:
+        """등록 순서대로 수집기 목록"""
+        return list(self._specs.values())
+
+    def interval_of(self, spec: CollectorSpec) -> float:
+        """수집기의 실제 수집 간격 (초, 0이면 매번 실행)"""
+        if spec.interval is not None:
+            return spec.interval
+        return self.expensive_interval if spec.cost == COST_EXPENSIVE else 0.0
+
+    def due(self, now: Optional[float] = None) -> List[CollectorSpec]:
+        """
+        이번 수집 시점에 실행할 수집기 목록
+
+        Args:
+            now: monotonic 시각 (기본값: 현재 시각)
+        """
+        now = time.monotonic() if now is None else now
+        return [spec for spec in self._specs.values() if now >= spec.next_run]
+
+    def record(self, spec: CollectorSpec, result, now: Optional[float] = None):
+        """수집 결과 저장 및 다음 실행 시각 계산"""
+        now = time.monotonic() if now is None else now
+        spec.last_result = result
+        spec.next_run = now + self.interval_of(spec) * (1 - DUE_TOLERANCE)
+
+    def merged_results(self) -> Dict:
+        """
+        수집기별 마지막 결과를 데이터 키 기준으로 병합
+
+        같은 키를 쓰는 수집기의 딕셔너리 결과는 등록 순서대로 합쳐집니다.
+        """
+        data = {}
+        for spec in self._specs.values():
+            result = spec.last_result
+            current = data.get(spec.key)
+            if isinstance(current, dict) and isinstance(result, dict):
+                data[spec.key] = {**current, **result}
+            elif spec.key not in data or result is not None:
+                data[spec.key] = result
+        return data
+
+    def reset(self):
+        """다음 수집에서 모든 수집기가 실행되도록 초기화"""
+        for spec in self._specs.values():
+            spec.next_run = 0.0
+            spec.last_result = None
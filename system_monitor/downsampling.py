@@ -0,0 +1,111 @@
+"""
+다운샘플링 모듈
+그래프의 픽셀 너비보다 많은 샘플을 모양을 유지한 채 줄여서 그립니다.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# 기본 목표 점 개수 (그래프 너비 12인치 × 150 dpi)
+DEFAULT_MAX_POINTS = 1800
+
+
+def _as_float(x: np.ndarray) -> np.ndarray:
+    """datetime64 시각도 면적 계산에 쓸 수 있도록 실수 배열로 변환"""
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('int64').astype(np.float64)
+    return x.astype(np.float64, copy=False)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets 방식으로 남길 점의 인덱스 선택
+
+    첫 점과 마지막 점을 남기고, 나머지를 threshold - 2개 구간으로 나눠 구간마다
+    이전에 고른 점, 다음 구간의 평균점과 만드는 삼각형이 가장 큰 점을 고릅니다.
+
+    Args:
+        x: x 값 배열 (실수 또는 datetime64, 오름차순)
+        y: y 값 배열 (NaN 없음)
+        threshold: 남길 점 개수
+
+    Returns:
+        오름차순 인덱스 배열 (점이 threshold개 이하이면 전체)
+    """
+    count = len(y)
+    if threshold >= count or threshold < 3:
+        return np.arange(count)
+
+    x = _as_float(x)
+    y = y.astype(np.float64, copy=False)
+    edges = np.linspace(1, count - 1, threshold - 1).astype(np.int64)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = count - 1
+
+    selected = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # 다음 구간의 평균점 (마지막 구간은 마지막 점)
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = count - 1, count
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs((x[selected] - avg_x) * (y[start:end] - y[selected])
+                      - (x[selected] - x[start:end]) * (avg_y - y[selected]))
+        selected = start + int(np.argmax(area))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def downsample(x: np.ndarray, y: np.ndarray, max_points: int = DEFAULT_MAX_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    LTTB 다운샘플링 (NaN 구간은 끊어진 채로 유지)
+
+    Args:
+        x: x 값 배열
+        y: y 값 배열 (값이 없는 샘플은 NaN)
+        max_points: 남길 점 개수 (0 또는 None이면 그대로 반환)
+
+    Returns:
+        (x, y) 다운샘플링된 배열
+    """
+    if not max_points or len(y) <= max_points:
+        return x, y
+
+    finite = np.isfinite(y)
+    positions = np.flatnonzero(finite)
+    keep = positions[lttb_indices(x[positions], y[positions], max_points)]
+
+    # 각 NaN 구간의 첫 샘플을 남겨 선이 이어지지 않도록 함
+    gap_starts = np.flatnonzero(~finite & np.concatenate(([True], finite[:-1])))
+    if len(gap_starts):
+        keep = np.union1d(keep, gap_starts)
+    return x[keep], y[keep]
+
+
+def min_max_envelope(x: np.ndarray, y: np.ndarray,
+                     buckets: int = DEFAULT_MAX_POINTS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    구간별 최솟값/최댓값 범위 (다운샘플링으로 빠진 순간 최고치를 음영으로 표시할 때 사용)
+
+    Args:
+        x: x 값 배열
+        y: y 값 배열 (NaN은 무시)
+        buckets: 구간 개수
+
+    Returns:
+        (구간 시작 x, 최솟값, 최댓값) 배열 (점이 buckets개 이하이면 원본)
+    """
+    if not buckets or len(y) <= buckets:
+        return x, y, y
+
+    starts = np.linspace(0, len(y), buckets, endpoint=False).astype(np.int64)
+    with np.errstate(invalid='ignore'):
+        lower = np.fmin.reduceat(y, starts)
+        upper = np.fmax.reduceat(y, starts)
+    return x[starts], lower, upper
@@ -0,0 +1,260 @@
+"""
+GPU 정보 스트리밍 모듈
+nvidia-smi를 루프 모드로 한 번만 실행해 두고 출력되는 값을 계속 받아옵니다.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# nvidia-smi --query-gpu 필드 (출력 순서와 동일)
+QUERY_FIELDS = ('index', 'name', 'utilization.gpu', 'memory.used', 'memory.total', 'temperature.gpu')
+
+# 처음 시작할 때 첫 측정값을 기다리는 최대 시간 (초, 재시작 후에는 기다리지 않음)
+FIRST_READING_TIMEOUT = 3.0
+
+# 프로세스가 종료된 경우 재시작 최소 간격 (초)
+RESTART_INTERVAL = 10.0
+
+# 이 측정 주기 수(최소 MIN_STALE_SECONDS초)보다 오래 갱신되지 않은 GPU 값은 버림
+STALE_READING_PERIODS = 3
+MIN_STALE_SECONDS = 1.0
+
+
+def _parse_number(value: str) -> Optional[float]:
+    """nvidia-smi 숫자 필드 변환 ('[N/A]', '[Not Supported]' 등은 None)"""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_query_line(line: str) -> Optional[Dict]:
+    """
+    nvidia-smi CSV 출력 한 줄을 collect_gpu_info와 같은 형식으로 변환
+
+    Args:
+        line: 'index, name, utilization.gpu, memory.used, memory.total, temperature.gpu'
+    """
+    # GPU 이름에 쉼표가 들어가도 되도록 앞의 index와 뒤의 숫자 필드를 먼저 분리
+    index, _, rest = line.partition(',')
+    fields = [index.strip()] + [field.strip() for field in rest.rsplit(',', len(QUERY_FIELDS) - 2)]
+    if len(fields) != len(QUERY_FIELDS) or not fields[0].isdigit():
+        return None
+
+    memory_used = _parse_number(fields[3]) or 0.0
+    memory_total = _parse_number(fields[4]) or 0.0
+    return {
+        'id': int(fields[0]),
+        'name': fields[1],
+        # 사용률을 지원하지 않는 GPU('[N/A]')는 0%가 아니라 값 없음으로 기록
+        'load': _parse_number(fields[2]),
+        'memory_used': memory_used,
+        'memory_total': memory_total,
+        'memory_percent': (memory_used / memory_total * 100) if memory_total > 0 else 0,
+        'temperature': _parse_number(fields[5])
+    }
+
+
+class NvidiaSmiStream:
+    """
+    상주하는 nvidia-smi 프로세스에서 GPU 측정값을 받아오는 클래스
+
+    'nvidia-smi --query-gpu=... --format=csv,noheader,nounits --loop-ms=N' 을
+    한 번 실행하고, 백그라운드 스레드가 출력 줄을 읽어 GPU별 최신 값을 보관합니다.
+    command에 같은 형식으로 출력하는 스크립트를 지정하면 실제 nvidia-smi 대신
+    사용할 수 있습니다.
+    """
+
+    def __init__(self, command: str = 'nvidia-smi', interval_ms: int = 1000):
+        """
+        초기화
+
+        Args:
+            command: nvidia-smi 실행 파일 경로
+            interval_ms: nvidia-smi 측정 간격 (밀리초)
+        """
+        self.command = command
+        self.interval_ms = interval_ms
+        self.available = True
+        self._process: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        # GPU 번호별 (받은 시각, 측정값)
+        self._latest: Dict[int, Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+        self._first_reading = threading.Event()
+        # 출력이 EOF에 도달하면 (프로세스 종료) 설정됨
+        self._exited = threading.Event()
+        self._waited_first_reading = False
+        self._last_start = 0.0
+
+    def start(self):
+        """nvidia-smi 루프 프로세스 및 출력 읽기 스레드 시작"""
+        self._last_start = time.monotonic()
+        self._first_reading.clear()
+        self._exited.clear()
+        try:
+            self._process = subprocess.Popen(
+                [self.command,
+                 f"--query-gpu={','.join(QUERY_FIELDS)}",
+                 '--format=csv,noheader,nounits',
+                 f'--loop-ms={self.interval_ms}'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, bufsize=1)
+        except OSError as e:
+            # nvidia-smi가 없는 시스템에서는 다시 시도하지 않음
+            print(f"nvidia-smi 실행 오류: {e}")
+            self.available = False
+            self._process = None
+            return
+
+        self._reader = threading.Thread(target=self._read_loop, args=(self._process,),
+                                        name='nvidia-smi-reader', daemon=True)
+        self._reader.start()
+
+    def _read_loop(self, process: subprocess.Popen):
+        """nvidia-smi 출력 줄을 읽어 GPU별 최신 값 갱신"""
+        try:
+            for line in process.stdout:
+                gpu = parse_query_line(line)
+                if gpu is None:
+                    continue
+                with self._lock:
+                    self._latest[gpu['id']] = (time.monotonic(), gpu)
+                self._first_reading.set()
+        except (OSError, ValueError):
+            # close()가 출력 파이프를 닫은 경우
+            pass
+        finally:
+            # 아무것도 출력하지 않고 종료한 경우에도 첫 측정값을 기다리는 read()를 깨움
+            self._exited.set()
+            self._first_reading.set()
+
+    def read(self) -> Optional[List[Dict]]:
+        """GPU별 최신 측정값 목록 반환 (측정값이 없으면 None)"""
+        if not self.available:
+            return None
+
+        if self._process is None:
+            self.start()
+        elif self._exited.is_set() or self._process.poll() is not None:
+            # 프로세스가 종료된 경우 (드라이버 재시작 등) 일정 간격으로 재시작
+            if time.monotonic() - self._last_start < RESTART_INTERVAL:
+                return None
+            self.close()
+            with self._lock:
+                self._latest = {}
+            self.start()
+        if self._process is None:
+            return None
+
+        # 처음 시작할 때만 첫 측정값을 기다림 (재시작 후에는 값이 들어올 때까지 None)
+        if not self._waited_first_reading:
+            self._waited_first_reading = True
+            self._first_reading.wait(FIRST_READING_TIMEOUT)
+        # 스트림에서 빠진 GPU나 멈춘 스트림의 오래된 값은 버림
+        cutoff = time.monotonic() - max(self.interval_ms / 1000 * STALE_READING_PERIODS, MIN_STALE_SECONDS)
+        with self._lock:
+            for gpu_id in [gpu_id for gpu_id, (received, _) in self._latest.items() if received < cutoff]:
+                del self._latest[gpu_id]
+            if not self._latest:
+                return None
+            return [dict(self._latest[gpu_id][1]) for gpu_id in sorted(self._latest)]
+
+    def close(self):
+        """nvidia-smi 프로세스 및 출력 읽기 스레드 종료"""
+        if self._process is None:
+            return
+
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+        # 프로세스가 끝나면 출력이 EOF가 되어 읽기 스레드도 종료됨
+        if self._reader is not None:
+            self._reader.join(timeout=2)
+            self._reader = None
+        self._process.stdout.close()
+        self._process = None
+
+
+def _write_fake_nvidia_smi(directory: str, name: str, body: str) -> str:
+    """nvidia-smi 대신 실행할 셸 스크립트 작성"""
+    path = os.path.join(directory, name)
+    with open(path, 'w') as f:
+        f.write('#!/bin/sh\n' + body)
+    os.chmod(path, 0o755)
+    return path
+
+
+def self_test():
+    """가짜 nvidia-smi 스크립트로 파서와 스트림 수명 주기 확인"""
+    # 파서: 쉼표가 들어간 이름, 지원하지 않는 필드, 잘못된 줄
+    gpu = parse_query_line('0, NVIDIA A100, PCIe, 40GB, 37, 1024, 40960, 51')
+    assert gpu['name'] == 'NVIDIA A100, PCIe, 40GB' and gpu['load'] == 37.0 and gpu['temperature'] == 51.0
+    gpu = parse_query_line('1, Tesla K80, [N/A], 0, 11441, [Not Supported]')
+    assert gpu['load'] is None and gpu['temperature'] is None and gpu['memory_percent'] == 0
+    assert parse_query_line('index, name, utilization.gpu') is None
+    print("  parse_query_line: OK")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 정상 스트림: 첫 측정값을 기다렸다가 반환
+        script = _write_fake_nvidia_smi(directory, 'ok.sh',
+                                        'while true; do echo "0, Fake GPU, 12, 100, 1000, 40"; sleep 0.1; done\n')
+        stream = NvidiaSmiStream(script, interval_ms=100)
+        try:
+            readings = stream.read()
+            assert readings and readings[0]['load'] == 12.0
+        finally:
+            stream.close()
+        print("  running stream: OK")
+
+        # GPU 1이 첫 줄 이후 빠지는 스트림: 오래된 값은 버려짐
+        script = _write_fake_nvidia_smi(directory, 'dropout.sh',
+                                        'echo "0, Fake GPU, 1, 1, 10, 30"; echo "1, Fake GPU, 2, 1, 10, 30"\n'
+                                        'while true; do echo "0, Fake GPU, 3, 1, 10, 30"; sleep 0.1; done\n')
+        stream = NvidiaSmiStream(script, interval_ms=100)
+        try:
+            assert stream.read() is not None
+            time.sleep(MIN_STALE_SECONDS + 0.3)
+            assert [gpu['id'] for gpu in stream.read()] == [0]
+        finally:
+            stream.close()
+        print("  stale GPU expiry: OK")
+
+        # 아무것도 출력하지 않고 종료하는 nvidia-smi: 기다리지 않고 None
+        script = _write_fake_nvidia_smi(directory, 'fail.sh', 'exit 9\n')
+        stream = NvidiaSmiStream(script, interval_ms=100)
+        try:
+            for _ in range(3):
+                start = time.monotonic()
+                assert stream.read() is None
+                assert time.monotonic() - start < 1.0
+        finally:
+            stream.close()
+        print("  exited process: OK")
+
+
+if __name__ == "__main__":
+    if '--self-test' in sys.argv:
+        # 가짜 nvidia-smi로 확인 (GPU가 없는 시스템에서도 실행 가능)
+        print("NvidiaSmiStream 자체 테스트...")
+        self_test()
+        sys.exit(0)
+
+    # 테스트 코드
+    stream = NvidiaSmiStream(interval_ms=500)
+    print("nvidia-smi 스트리밍 테스트...")
+    try:
+        for i in range(3):
+            print(f"\n[{i+1}회] {stream.read()}")
+            time.sleep(1)
+    finally:
+        stream.close()
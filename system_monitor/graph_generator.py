@@ -3,231 +3,455 @@
 수집된 데이터를 시각화하여 그래프로 생성합니다.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from datetime import datetime
-from typing import List, Dict
+import matplotlib
+from matplotlib.figure import Figure
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import BinaryIO, Callable, List, Dict, Optional, Tuple, Union
+import numpy as np
+import io
 import os
 
+try:
+    from .metric_series import MetricSeries
+    from .downsampling import DEFAULT_MAX_POINTS, downsample, min_max_envelope
+except ImportError:
+    from metric_series import MetricSeries
+    from downsampling import DEFAULT_MAX_POINTS, downsample, min_max_envelope
+
+# 그래프 입력: 수집 히스토리(딕셔너리 목록 또는 HistoryView) 또는 변환된 MetricSeries
+History = Union[List[Dict], MetricSeries]
+
+# 그래프 출력: 파일 경로 또는 메모리 버퍼 (BytesIO)
+GraphOutput = Union[str, BinaryIO]
+
+COLORS = ['b', 'r', 'g', 'orange', 'purple']
+
+# 그래프 출력 형식
+GRAPH_FORMAT_PNG = 'png'  # 150 dpi 래스터 이미지
+GRAPH_FORMAT_SVG = 'svg'  # 벡터 이미지 (점이 많은 선만 래스터로 포함)
+GRAPH_FORMATS = (GRAPH_FORMAT_PNG, GRAPH_FORMAT_SVG)
+
+# 이보다 점이 많은 선은 벡터 출력에서도 래스터로 그림 (파일 크기와 PDF 생성 시간 제한)
+DENSE_LINE_POINTS = 1000
+
+# 이보다 점이 많은 선은 점 마커를 생략 (마커가 겹쳐 선이 뭉개지고 그리기가 느려짐)
+MARKER_MAX_POINTS = 50
+
+
+def configure_matplotlib():
+    """폰트 설정 (작업 프로세스에서도 같은 설정을 사용하도록 함수로 분리)"""
+    # 한글 폰트 설정 (Linux 환경)
+    matplotlib.rcParams['font.family'] = 'DejaVu Sans'
+    matplotlib.rcParams['axes.unicode_minus'] = False
+
+
+def _savefig(fig: Figure, output: GraphOutput, graph_format: str) -> GraphOutput:
+    """PNG 또는 SVG로 저장 (버퍼이면 바로 읽을 수 있도록 처음으로 되돌림)"""
+    # SVG에서 래스터로 그리는 선도 150 dpi로 포함됨
+    fig.savefig(output, format=graph_format, dpi=150, bbox_inches='tight')
+    if not isinstance(output, str):
+        output.seek(0)
+    return output
+
+
+def _save(fig: Figure, output: GraphOutput, graph_format: str) -> GraphOutput:
+    """그래프 저장"""
+    fig.tight_layout()
+    return _savefig(fig, output, graph_format)
+
+
+def _plot(ax, timestamps: np.ndarray, values: np.ndarray, *args, max_points: int = DEFAULT_MAX_POINTS,
+          envelope: bool = False, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    목표 점 개수로 다운샘플링한 뒤 선 그리기
+
+    Args:
+        ax: 그릴 Axes
+        timestamps: 시각 배열
+        values: 값 배열
+        max_points: 남길 점 개수 (0이면 다운샘플링 안 함)
+        envelope: 다운샘플링된 경우 구간별 최솟값~최댓값 범위를 음영으로 표시할지 여부
+
+    점이 DENSE_LINE_POINTS개보다 많은 선은 벡터 출력에서 래스터로 그리고,
+    MARKER_MAX_POINTS개보다 많은 선은 marker를 지정해도 마커 없이 그립니다.
+
+    Returns:
+        실제로 그린 (x, y) 배열
+    """
+    x, y = downsample(timestamps, values, max_points)
+    dense = len(x) > DENSE_LINE_POINTS
+    if len(x) > MARKER_MAX_POINTS:
+        kwargs.pop('marker', None)
+        kwargs.pop('markersize', None)
+    line, = ax.plot(x, y, *args, rasterized=dense, **kwargs)
+    if envelope and len(x) < len(timestamps):
+        env_x, lower, upper = min_max_envelope(timestamps, values, max_points)
+        ax.fill_between(env_x, lower, upper, step='post', color=line.get_color(), alpha=0.2, linewidth=0,
+                        rasterized=len(env_x) > DENSE_LINE_POINTS)
+    return x, y
+
+
+def _render_message(output_path: GraphOutput, message: str, title: str, graph_format: str) -> GraphOutput:
+    """데이터가 없을 때 안내 문구만 있는 그래프 저장"""
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+    ax.text(0.5, 0.5, message, ha='center', va='center', transform=ax.transAxes, fontsize=14)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    return _savefig(fig, output_path, graph_format)
+
+
+def render_cpu_graph(series: MetricSeries, output_path: GraphOutput, max_points: int = DEFAULT_MAX_POINTS,
+                     envelope: bool = False, graph_format: str = GRAPH_FORMAT_PNG) -> GraphOutput:
+    """CPU 사용률 및 온도 그래프 생성"""
+    timestamps = series.timestamps
+    plot = partial(_plot, max_points=max_points, envelope=envelope)
+    cpu_percent = series.get('cpu', 'percent')
+    cpu_temp = series.get('cpu', 'temperature')
+
+    fig = Figure(figsize=(12, 8))
+    ax1, ax2 = fig.subplots(2, 1)
+
+    # CPU 사용률 그래프
+    plot(ax1, timestamps, cpu_percent, 'b-', linewidth=2, label='CPU Usage')
+    ax1.set_ylabel('CPU Usage (%)', fontsize=12)
+    ax1.set_title('CPU Usage Over Time', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    ax1.set_ylim(0, 100)
+    ax1.legend()
+
+    # CPU 온도 그래프
+    # 온도를 읽지 못한 샘플은 NaN으로 비워 둠
+    if series.has('cpu', 'temperature'):
+        plot(ax2, timestamps, cpu_temp, 'r-', linewidth=2, label='CPU Temperature')
+        ax2.set_ylabel('Temperature (°C)', fontsize=12)
+        ax2.set_title('CPU Temperature Over Time', fontsize=14, fontweight='bold')
+        ax2.grid(True, alpha=0.3)
+        ax2.legend()
+    else:
+        ax2.text(0.5, 0.5, 'CPU Temperature Data Not Available',
+                 ha='center', va='center', transform=ax2.transAxes, fontsize=12)
+        ax2.set_title('CPU Temperature Over Time', fontsize=14, fontweight='bold')
+
+    ax2.set_xlabel('Time', fontsize=12)
+    return _save(fig, output_path, graph_format)
+
+
+def render_memory_graph(series: MetricSeries, output_path: GraphOutput, max_points: int = DEFAULT_MAX_POINTS,
+                        envelope: bool = False, graph_format: str = GRAPH_FORMAT_PNG) -> GraphOutput:
+    """메모리 사용률 그래프 생성"""
+    timestamps = series.timestamps
+    plot = partial(_plot, max_points=max_points, envelope=envelope)
+    mem_percent = series.get('memory', 'percent')
+    swap_percent = series.get('memory', 'swap_percent')
+
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+
+    plot(ax, timestamps, mem_percent, 'b-', linewidth=2, label='Memory Usage', marker='o', markersize=3)
+    plot(ax, timestamps, swap_percent, 'orange', linewidth=2, label='Swap Usage', marker='s', markersize=3)
+
+    ax.set_xlabel('Time', fontsize=12)
+    ax.set_ylabel('Usage (%)', fontsize=12)
+    ax.set_title('Memory and Swap Usage Over Time', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.set_ylim(0, 100)
+    ax.legend(fontsize=10)
+
+    return _save(fig, output_path, graph_format)
+
+
+def render_disk_graph(series: MetricSeries, output_path: GraphOutput, max_points: int = DEFAULT_MAX_POINTS,
+                      envelope: bool = False, graph_format: str = GRAPH_FORMAT_PNG) -> GraphOutput:
+    """디스크 사용률 그래프 생성"""
+    timestamps = series.timestamps
+    plot = partial(_plot, max_points=max_points, envelope=envelope)
+    disk_percent = series.get('disk', 'percent')
+
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+
+    x, y = plot(ax, timestamps, disk_percent, 'g-', linewidth=2, label='Disk Usage', marker='o', markersize=3)
+    ax.fill_between(x, y, alpha=0.3, color='g')
+
+    ax.set_xlabel('Time', fontsize=12)
+    ax.set_ylabel('Usage (%)', fontsize=12)
+    ax.set_title('Disk Usage Over Time', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    ax.set_ylim(0, 100)
+    ax.legend(fontsize=10)
+
+    return _save(fig, output_path, graph_format)
+
+
+def render_disk_io_graph(series: MetricSeries, output_path: GraphOutput, max_points: int = DEFAULT_MAX_POINTS,
+                         envelope: bool = False, graph_format: str = GRAPH_FORMAT_PNG) -> GraphOutput:
+    """디스크 장치별 I/O 처리량 및 사용률 그래프 생성"""
+    timestamps = series.timestamps
+    plot = partial(_plot, max_points=max_points, envelope=envelope)
+
+    # 수집 중에 추가/제거된 장치 포함 (없던 구간은 NaN)
+    devices = series.children('disk', 'devices')
+
+    fig = Figure(figsize=(12, 8))
+    ax1, ax2 = fig.subplots(2, 1)
+
+    if not devices:
+        ax1.text(0.5, 0.5, 'Disk I/O Data Not Available',
+                 ha='center', va='center', transform=ax1.transAxes, fontsize=12)
+        ax2.text(0.5, 0.5, 'Disk I/O Data Not Available',
+                 ha='center', va='center', transform=ax2.transAxes, fontsize=12)
+
+    for index, name in enumerate(devices):
+        color = COLORS[index % len(COLORS)]
+        read_mb = series.get('disk', 'devices', name, 'read_bytes_per_sec') / 1_000_000
+        write_mb = series.get('disk', 'devices', name, 'write_bytes_per_sec') / 1_000_000
+        util = series.get('disk', 'devices', name, 'util_percent')
+
+        # 처리량 (읽기: 실선, 쓰기: 점선)
+        plot(ax1, timestamps, read_mb, color=color, linestyle='-', linewidth=2, label=f'{name} Read')
+        plot(ax1, timestamps, write_mb, color=color, linestyle='--', linewidth=2, label=f'{name} Write')
+
+        # 사용률
+        plot(ax2, timestamps, util, color=color, linewidth=2, label=name)
+
+    ax1.set_ylabel('Throughput (MB/s)', fontsize=12)
+    ax1.set_title('Disk I/O Throughput Over Time', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    if devices:
+        ax1.legend(fontsize=9)
 
-class GraphGenerator:
-    """시스템 리소스 데이터를 그래프로 생성하는 클래스"""
+    ax2.set_xlabel('Time', fontsize=12)
+    ax2.set_ylabel('Utilization (%)', fontsize=12)
+    ax2.set_title('Disk Utilization Over Time', fontsize=14, fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+    ax2.set_ylim(0, 100)
+    if devices:
+        ax2.legend(fontsize=9)
 
-    def __init__(self, output_dir: str = "output"):
-        """
-        초기화
+    return _save(fig, output_path, graph_format)
 
-        Args:
-            output_dir: 그래프를 저장할 디렉토리
-        """
-        self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
 
-        # 한글 폰트 설정 (Linux 환경)
-        plt.rcParams['font.family'] = 'DejaVu Sans'
-        plt.rcParams['axes.unicode_minus'] = False
+def render_network_graph(series: MetricSeries, output_path: GraphOutput, max_points: int = DEFAULT_MAX_POINTS,
+                         envelope: bool = False, graph_format: str = GRAPH_FORMAT_PNG) -> GraphOutput:
+    """네트워크 트래픽 그래프 생성 (인터페이스별)"""
+    timestamps = series.timestamps
+    plot = partial(_plot, max_points=max_points, envelope=envelope)
+
+    # 루프백을 제외한 인터페이스 목록 (수집 중 추가/제거된 인터페이스 포함)
+    interfaces = [name for name in series.children('network', 'interfaces') if name != 'lo']
+
+    fig = Figure(figsize=(12, 8))
+    ax1, ax2 = fig.subplots(2, 1)
 
-    def _extract_timestamps(self, data_history: List[Dict]) -> List[datetime]:
-        """타임스탬프 추출"""
-        return [entry['timestamp'] for entry in data_history]
+    if interfaces:
+        for index, name in enumerate(interfaces):
+            color = COLORS[index % len(COLORS)]
+            upload_speed = series.get('network', 'interfaces', name, 'upload_speed_mbps')
+            download_speed = series.get('network', 'interfaces', name, 'download_speed_mbps')
 
-    def generate_cpu_graph(self, data_history: List[Dict]) -> str:
-        """CPU 사용률 및 온도 그래프 생성"""
-        timestamps = self._extract_timestamps(data_history)
-        cpu_percent = [entry['cpu']['percent'] for entry in data_history]
-        cpu_temp = [entry['cpu']['temperature'] for entry in data_history if entry['cpu']['temperature'] is not None]
-
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-
-        # CPU 사용률 그래프
-        ax1.plot(timestamps, cpu_percent, 'b-', linewidth=2, label='CPU Usage')
-        ax1.set_ylabel('CPU Usage (%)', fontsize=12)
-        ax1.set_title('CPU Usage Over Time', fontsize=14, fontweight='bold')
-        ax1.grid(True, alpha=0.3)
-        ax1.set_ylim(0, 100)
-        ax1.legend()
-
-        # CPU 온도 그래프
-        if cpu_temp and len(cpu_temp) == len(timestamps):
-            ax2.plot(timestamps, cpu_temp, 'r-', linewidth=2, label='CPU Temperature')
-            ax2.set_ylabel('Temperature (°C)', fontsize=12)
-            ax2.set_title('CPU Temperature Over Time', fontsize=14, fontweight='bold')
-            ax2.grid(True, alpha=0.3)
-            ax2.legend()
-        else:
-            ax2.text(0.5, 0.5, 'CPU Temperature Data Not Available',
-                     ha='center', va='center', transform=ax2.transAxes, fontsize=12)
-            ax2.set_title('CPU Temperature Over Time', fontsize=14, fontweight='bold')
-
-        ax2.set_xlabel('Time', fontsize=12)
-        plt.tight_layout()
-
-        output_path = os.path.join(self.output_dir, 'cpu_graph.png')
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return output_path
-
-    def generate_memory_graph(self, data_history: List[Dict]) -> str:
-        """메모리 사용률 그래프 생성"""
-        timestamps = self._extract_timestamps(data_history)
-        mem_percent = [entry['memory']['percent'] for entry in data_history]
-        swap_percent = [entry['memory']['swap_percent'] for entry in data_history]
+            plot(ax1, timestamps, upload_speed, color=color, linewidth=2, label=name, marker='^', markersize=4)
+            plot(ax2, timestamps, download_speed, color=color, linewidth=2, label=name, marker='v', markersize=4)
+    else:
+        # 인터페이스별 데이터가 없는 경우 전체 합계 사용
+        upload_speed = series.get('network', 'upload_speed_mbps')
+        download_speed = series.get('network', 'download_speed_mbps')
+        plot(ax1, timestamps, upload_speed, 'r-', linewidth=2, label='Total', marker='^', markersize=4)
+        plot(ax2, timestamps, download_speed, 'b-', linewidth=2, label='Total', marker='v', markersize=4)
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+    ax1.set_ylabel('Upload (Mbps)', fontsize=12)
+    ax1.set_title('Network Upload Speed by Interface', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend(fontsize=9)
 
-        ax.plot(timestamps, mem_percent, 'b-', linewidth=2, label='Memory Usage', marker='o', markersize=3)
-        ax.plot(timestamps, swap_percent, 'orange', linewidth=2, label='Swap Usage', marker='s', markersize=3)
+    ax2.set_xlabel('Time', fontsize=12)
+    ax2.set_ylabel('Download (Mbps)', fontsize=12)
+    ax2.set_title('Network Download Speed by Interface', fontsize=14, fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+    ax2.legend(fontsize=9)
 
-        ax.set_xlabel('Time', fontsize=12)
-        ax.set_ylabel('Usage (%)', fontsize=12)
-        ax.set_title('Memory and Swap Usage Over Time', fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.3)
-        ax.set_ylim(0, 100)
-        ax.legend(fontsize=10)
+    return _save(fig, output_path, graph_format)
 
-        plt.tight_layout()
 
-        output_path = os.path.join(self.output_dir, 'memory_graph.png')
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
+def render_gpu_graph(series: MetricSeries, output_path: GraphOutput, max_points: int = DEFAULT_MAX_POINTS,
+                     envelope: bool = False, graph_format: str = GRAPH_FORMAT_PNG) -> GraphOutput:
+    """GPU 사용률 및 온도 그래프 생성"""
+    # GPU 데이터가 있는지 확인
+    if not series.children('gpu'):
+        # GPU가 없는 경우 빈 그래프 생성
+        return _render_message(output_path, 'GPU Not Available or No Data', 'GPU Usage and Temperature', graph_format)
 
-        return output_path
+    timestamps = series.timestamps
+    plot = partial(_plot, max_points=max_points, envelope=envelope)
 
-    def generate_disk_graph(self, data_history: List[Dict]) -> str:
-        """디스크 사용률 그래프 생성"""
-        timestamps = self._extract_timestamps(data_history)
-        disk_percent = [entry['disk']['percent'] for entry in data_history]
+    # GPU 목록 확인 (수집 중 한 번이라도 나타난 GPU)
+    gpu_ids = sorted(series.children('gpu', 'gpus'), key=int)
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+    if not gpu_ids:
+        return _render_message(output_path, 'No GPU Detected', 'GPU Usage and Temperature', graph_format)
 
-        ax.plot(timestamps, disk_percent, 'g-', linewidth=2, label='Disk Usage', marker='o', markersize=3)
-        ax.fill_between(timestamps, disk_percent, alpha=0.3, color='g')
+    fig = Figure(figsize=(12, 8))
+    ax1, ax2 = fig.subplots(2, 1)
 
-        ax.set_xlabel('Time', fontsize=12)
-        ax.set_ylabel('Usage (%)', fontsize=12)
-        ax.set_title('Disk Usage Over Time', fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.3)
-        ax.set_ylim(0, 100)
-        ax.legend(fontsize=10)
+    # 각 GPU에 대한 데이터 플롯
+    for index, gpu_id in enumerate(gpu_ids):
+        gpu_load = series.get('gpu', 'gpus', gpu_id, 'load')
+        gpu_temp = series.get('gpu', 'gpus', gpu_id, 'temperature')
+        gpu_name = series.text('gpu', 'gpus', gpu_id, 'name')
 
-        plt.tight_layout()
+        color = COLORS[index % len(COLORS)]
 
-        output_path = os.path.join(self.output_dir, 'disk_graph.png')
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
+        # GPU 사용률
+        plot(ax1, timestamps, gpu_load, color=color, linewidth=2,
+                 label=f'GPU {gpu_id} ({gpu_name})', marker='o', markersize=3)
 
-        return output_path
+        # GPU 온도
+        plot(ax2, timestamps, gpu_temp, color=color, linewidth=2,
+                 label=f'GPU {gpu_id} ({gpu_name})', marker='s', markersize=3)
 
-    def generate_network_graph(self, data_history: List[Dict]) -> str:
-        """네트워크 트래픽 그래프 생성"""
-        timestamps = self._extract_timestamps(data_history)
-        upload_speed = [entry['network']['upload_speed_mbps'] for entry in data_history]
-        download_speed = [entry['network']['download_speed_mbps'] for entry in data_history]
+    ax1.set_ylabel('GPU Load (%)', fontsize=12)
+    ax1.set_title('GPU Usage Over Time', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    ax1.set_ylim(0, 100)
+    ax1.legend(fontsize=9)
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+    ax2.set_xlabel('Time', fontsize=12)
+    ax2.set_ylabel('Temperature (°C)', fontsize=12)
+    ax2.set_title('GPU Temperature Over Time', fontsize=14, fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+    ax2.legend(fontsize=9)
 
-        ax.plot(timestamps, upload_speed, 'r-', linewidth=2, label='Upload Speed', marker='^', markersize=4)
-        ax.plot(timestamps, download_speed, 'b-', linewidth=2, label='Download Speed', marker='v', markersize=4)
+    return _save(fig, output_path, graph_format)
 
-        ax.set_xlabel('Time', fontsize=12)
-        ax.set_ylabel('Speed (Mbps)', fontsize=12)
-        ax.set_title('Network Traffic Over Time', fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.3)
-        ax.legend(fontsize=10)
 
-        plt.tight_layout()
+# 그래프 이름: (그리기 함수, 파일 이름 (확장자 제외), 필요한 지표 경로)
+# 작업 프로세스에는 필요한 경로의 배열만 전달합니다.
+GRAPHS: Dict[str, Tuple[Callable[..., GraphOutput], str, Tuple[Tuple[str, ...], ...]]] = {
+    'cpu': (render_cpu_graph, 'cpu_graph', (('cpu', 'percent'), ('cpu', 'temperature'))),
+    'memory': (render_memory_graph, 'memory_graph', (('memory', 'percent'), ('memory', 'swap_percent'))),
+    'disk': (render_disk_graph, 'disk_graph', (('disk', 'percent'),)),
+    'disk_io': (render_disk_io_graph, 'disk_io_graph', (('disk', 'devices'),)),
+    'network': (render_network_graph, 'network_graph',
+                (('network', 'interfaces'), ('network', 'upload_speed_mbps'), ('network', 'download_speed_mbps'))),
+    'gpu': (render_gpu_graph, 'gpu_graph', (('gpu',),)),
+}
+
+
+def _render_bytes(render: Callable[..., GraphOutput], series: MetricSeries, options: Dict) -> bytes:
+    """작업 프로세스에서 그래프를 메모리에 그려 바이트로 반환"""
+    buffer = io.BytesIO()
+    render(series, buffer, **options)
+    return buffer.getvalue()
 
-        output_path = os.path.join(self.output_dir, 'network_graph.png')
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
 
-        return output_path
+class GraphGenerator:
+    """시스템 리소스 데이터를 그래프로 생성하는 클래스"""
 
-    def generate_gpu_graph(self, data_history: List[Dict]) -> str:
-        """GPU 사용률 및 온도 그래프 생성"""
-        # GPU 데이터가 있는지 확인
-        has_gpu = any(entry['gpu'] is not None for entry in data_history)
-
-        if not has_gpu:
-            # GPU가 없는 경우 빈 그래프 생성
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.text(0.5, 0.5, 'GPU Not Available or No Data',
-                    ha='center', va='center', transform=ax.transAxes, fontsize=14)
-            ax.set_title('GPU Usage and Temperature', fontsize=14, fontweight='bold')
-            output_path = os.path.join(self.output_dir, 'gpu_graph.png')
-            plt.savefig(output_path, dpi=150, bbox_inches='tight')
-            plt.close()
-            return output_path
-
-        timestamps = self._extract_timestamps(data_history)
-
-        # GPU 개수 확인
-        num_gpus = len(data_history[0]['gpu']['gpus']) if data_history[0]['gpu'] else 0
-
-        if num_gpus == 0:
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.text(0.5, 0.5, 'No GPU Detected',
-                    ha='center', va='center', transform=ax.transAxes, fontsize=14)
-            ax.set_title('GPU Usage and Temperature', fontsize=14, fontweight='bold')
-            output_path = os.path.join(self.output_dir, 'gpu_graph.png')
-            plt.savefig(output_path, dpi=150, bbox_inches='tight')
-            plt.close()
-            return output_path
-
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-
-        # 각 GPU에 대한 데이터 수집 및 플롯
-        colors = ['b', 'r', 'g', 'orange', 'purple']
-        for gpu_id in range(num_gpus):
-            gpu_load = [entry['gpu']['gpus'][gpu_id]['load'] for entry in data_history if entry['gpu']]
-            gpu_temp = [entry['gpu']['gpus'][gpu_id]['temperature'] for entry in data_history if entry['gpu']]
-            gpu_name = data_history[0]['gpu']['gpus'][gpu_id]['name']
-
-            color = colors[gpu_id % len(colors)]
-
-            # GPU 사용률
-            ax1.plot(timestamps, gpu_load, color=color, linewidth=2,
-                     label=f'GPU {gpu_id} ({gpu_name})', marker='o', markersize=3)
-
-            # GPU 온도
-            ax2.plot(timestamps, gpu_temp, color=color, linewidth=2,
-                     label=f'GPU {gpu_id} ({gpu_name})', marker='s', markersize=3)
-
-        ax1.set_ylabel('GPU Load (%)', fontsize=12)
-        ax1.set_title('GPU Usage Over Time', fontsize=14, fontweight='bold')
-        ax1.grid(True, alpha=0.3)
-        ax1.set_ylim(0, 100)
-        ax1.legend(fontsize=9)
+    def __init__(self, output_dir: str = "output", parallel: bool = False, max_workers: Optional[int] = None,
+                 max_points: int = DEFAULT_MAX_POINTS, envelope: bool = False, in_memory: bool = False,
+                 graph_format: str = GRAPH_FORMAT_PNG):
+        """
+        초기화
 
-        ax2.set_xlabel('Time', fontsize=12)
-        ax2.set_ylabel('Temperature (°C)', fontsize=12)
-        ax2.set_title('GPU Temperature Over Time', fontsize=14, fontweight='bold')
-        ax2.grid(True, alpha=0.3)
-        ax2.legend(fontsize=9)
+        Args:
+            output_dir: 그래프를 저장할 디렉토리
+            parallel: True이면 generate_all_graphs에서 그래프마다 작업 프로세스를 사용
+            max_workers: 작업 프로세스 수 (기본값: 그래프 수와 CPU 코어 수 중 작은 값)
+            max_points: 선마다 그릴 최대 점 개수 (초과하면 LTTB 다운샘플링, 0이면 사용 안 함)
+            envelope: 다운샘플링된 선에 구간별 최솟값~최댓값 음영을 표시할지 여부
+            in_memory: True이면 파일 대신 BytesIO 버퍼를 반환 (출력 디렉토리를 만들지 않음)
+            graph_format: 출력 형식 ('png' 또는 'svg', svg는 점이 많은 선만 래스터로 포함)
+        """
+        if graph_format not in GRAPH_FORMATS:
+            raise ValueError(f"지원하지 않는 그래프 형식입니다: {graph_format}")
+
+        self.output_dir = output_dir
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.max_points = max_points
+        self.envelope = envelope
+        self.in_memory = in_memory
+        self.graph_format = graph_format
+        if not in_memory:
+            os.makedirs(output_dir, exist_ok=True)
+        configure_matplotlib()
+
+    @staticmethod
+    def _series(data_history: History) -> MetricSeries:
+        """히스토리를 NumPy 배열 시계열로 변환 (이미 변환된 경우 그대로 사용)"""
+        return MetricSeries.from_history(data_history)
+
+    @property
+    def _options(self) -> Dict:
+        """그리기 함수에 전달할 설정"""
+        return {'max_points': self.max_points, 'envelope': self.envelope, 'graph_format': self.graph_format}
+
+    def _output(self, filename: str) -> GraphOutput:
+        """그래프 출력 대상 (파일 경로 또는 새 버퍼)"""
+        if self.in_memory:
+            return io.BytesIO()
+        return os.path.join(self.output_dir, f'{filename}.{self.graph_format}')
+
+    def _render(self, name: str, data_history: History) -> GraphOutput:
+        """현재 프로세스에서 그래프 하나 생성"""
+        render, filename, _ = GRAPHS[name]
+        return render(self._series(data_history), self._output(filename), **self._options)
+
+    def generate_cpu_graph(self, data_history: History) -> GraphOutput:
+        """CPU 사용률 및 온도 그래프 생성"""
+        return self._render('cpu', data_history)
 
-        plt.tight_layout()
+    def generate_memory_graph(self, data_history: History) -> GraphOutput:
+        """메모리 사용률 그래프 생성"""
+        return self._render('memory', data_history)
+
+    def generate_disk_graph(self, data_history: History) -> GraphOutput:
+        """디스크 사용률 그래프 생성"""
+        return self._render('disk', data_history)
 
-        output_path = os.path.join(self.output_dir, 'gpu_graph.png')
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
+    def generate_disk_io_graph(self, data_history: History) -> GraphOutput:
+        """디스크 장치별 I/O 처리량 및 사용률 그래프 생성"""
+        return self._render('disk_io', data_history)
 
-        return output_path
+    def generate_network_graph(self, data_history: History) -> GraphOutput:
+        """네트워크 트래픽 그래프 생성 (인터페이스별)"""
+        return self._render('network', data_history)
 
-    def generate_all_graphs(self, data_history: List[Dict]) -> Dict[str, str]:
-        """모든 그래프 생성"""
+    def generate_gpu_graph(self, data_history: History) -> GraphOutput:
+        """GPU 사용률 및 온도 그래프 생성"""
+        return self._render('gpu', data_history)
+
+    def _generate_parallel(self, series: MetricSeries) -> Dict[str, GraphOutput]:
+        """그래프마다 작업 프로세스에서 생성 (필요한 배열만 전달)"""
+        workers = self.max_workers or min(len(GRAPHS), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, initializer=configure_matplotlib) as executor:
+            futures = {}
+            for name, (render, filename, paths) in GRAPHS.items():
+                subset = series.subset(*paths)
+                if self.in_memory:
+                    futures[name] = executor.submit(_render_bytes, render, subset, self._options)
+                else:
+                    futures[name] = executor.submit(render, subset, self._output(filename), **self._options)
+            if self.in_memory:
+                return {name: io.BytesIO(future.result()) for name, future in futures.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    def generate_all_graphs(self, data_history: History) -> Dict[str, GraphOutput]:
+        """
+        모든 그래프 생성 (히스토리는 한 번만 배열로 변환)
+
+        Returns:
+            그래프 이름별 파일 경로 (in_memory이면 BytesIO 버퍼)
+        """
         if not data_history:
             raise ValueError("데이터가 없습니다.")
 
-        graphs = {
-            'cpu': self.generate_cpu_graph(data_history),
-            'memory': self.generate_memory_graph(data_history),
-            'disk': self.generate_disk_graph(data_history),
-            'network': self.generate_network_graph(data_history),
-            'gpu': self.generate_gpu_graph(data_history)
-        }
+        series = self._series(data_history)
+        if self.parallel:
+            return self._generate_parallel(series)
 
-        return graphs
+        return {name: render(series, self._output(filename), **self._options)
+                for name, (render, filename, _) in GRAPHS.items()}
 
 
 if __name__ == "__main__":
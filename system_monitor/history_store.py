@@ -0,0 +1,356 @@
+"""
+히스토리 저장 모듈
+수집된 데이터를 메트릭 경로별 열(column) 배열로 저장하는 링 버퍼입니다.
+"""
+
+import json
+import sys
+import zipfile
+from array import array
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# 기본 저장 용량 (5초 간격 기준 약 14시간)
+DEFAULT_CAPACITY = 10_000
+
+# 런 파일 형식 버전 (zip: meta.json + 열별 바이너리 배열)
+RUN_FILE_VERSION = 1
+
+# 값 종류: 실수, 정수, 불리언, 문자열, None, 리스트 컨테이너, 빈 딕셔너리
+KIND_FLOAT = 'f'
+KIND_INT = 'i'
+KIND_BOOL = 'b'
+KIND_STR = 's'
+KIND_NONE = 'n'
+KIND_LIST = 'L'
+KIND_EMPTY_DICT = 'D'
+
+NUMERIC_KINDS = (KIND_FLOAT, KIND_INT, KIND_BOOL)
+
+NAN = float('nan')
+
+
+def flatten_entry(entry: Dict, prefix: Tuple[str, ...] = ()) -> List[Tuple[Tuple[str, ...], str, object]]:
+    """
+    중첩된 수집 데이터를 (경로, 값 종류, 값) 목록으로 평탄화
+
+    리스트는 인덱스를 경로 요소로 사용하며, 복원을 위해 리스트 컨테이너 자체도
+    KIND_LIST 항목으로 기록합니다.
+    """
+    fields = []
+    for key, value in entry.items():
+        path = prefix + (str(key),)
+        if isinstance(value, dict):
+            if value:
+                fields.extend(flatten_entry(value, path))
+            else:
+                fields.append((path, KIND_EMPTY_DICT, None))
+        elif isinstance(value, (list, tuple)):
+            fields.append((path, KIND_LIST, None))
+            fields.extend(flatten_entry({str(i): item for i, item in enumerate(value)}, path))
+        elif value is None:
+            fields.append((path, KIND_NONE, None))
+        elif isinstance(value, bool):
+            fields.append((path, KIND_BOOL, value))
+        elif isinstance(value, int):
+            fields.append((path, KIND_INT, value))
+        elif isinstance(value, float):
+            fields.append((path, KIND_FLOAT, value))
+        else:
+            fields.append((path, KIND_STR, str(value)))
+    return fields
+
+
+def _unflatten_entry(fields: List[Tuple[Tuple[str, ...], str, object]]) -> Dict:
+    """flatten_entry의 결과를 중첩 딕셔너리/리스트로 복원"""
+    root: Dict = {}
+    list_paths = []
+
+    for path, kind, value in fields:
+        node = root
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        if kind == KIND_LIST:
+            node.setdefault(path[-1], {})
+            list_paths.append(path)
+        elif kind == KIND_EMPTY_DICT:
+            node[path[-1]] = {}
+        else:
+            node[path[-1]] = value
+
+    # 안쪽 리스트부터 변환해야 바깥 경로 탐색이 딕셔너리로 유지됨
+    for path in sorted(list_paths, key=len, reverse=True):
+        node = root
+        for part in path[:-1]:
+            node = node[part]
+        items = node[path[-1]]
+        node[path[-1]] = [items[str(i)] for i in range(len(items))]
+
+    return root
+
+
+def column_name(path: Tuple[str, ...]) -> str:
+    """경로 튜플을 'cpu.percent' 형식의 열 이름으로 변환"""
+    return '.'.join(path)
+
+
+class HistoryStore:
+    """
+    메트릭 경로별 열 배열을 사용하는 고정 용량 링 버퍼
+
+    숫자 값은 용량만큼 미리 할당된 array('d') 열에 저장되고(None은 NaN),
+    타임스탬프는 epoch 초(float) 열에 저장됩니다. 용량을 초과하면 가장
+    오래된 샘플부터 덮어씁니다.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        초기화
+
+        Args:
+            capacity: 보관할 최대 샘플 수
+        """
+        if capacity <= 0:
+            raise ValueError("히스토리 용량은 0보다 커야 합니다.")
+
+        self.capacity = capacity
+        self._timestamps = array('d', [NAN]) * capacity
+        self._schema_ids = array('i', [0]) * capacity
+        self._columns: Dict[str, array] = {}
+        self._text_columns: Dict[str, List[Optional[str]]] = {}
+        # 샘플 구조(경로, 값 종류) 목록. 대부분의 실행에서 몇 개뿐입니다.
+        self._schemas: List[Tuple[Tuple[Tuple[str, ...], str], ...]] = []
+        self._schema_index: Dict[Tuple, int] = {}
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _row(self, index: int) -> int:
+        """논리 인덱스(0 = 가장 오래된 샘플)를 버퍼 위치로 변환"""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("히스토리 인덱스가 범위를 벗어났습니다.")
+        return (self._start + index) % self.capacity
+
+    def _intern_schema(self, schema: Tuple) -> int:
+        """샘플 구조를 등록하고 ID 반환"""
+        schema_id = self._schema_index.get(schema)
+        if schema_id is None:
+            schema_id = len(self._schemas)
+            self._schemas.append(schema)
+            self._schema_index[schema] = schema_id
+        return schema_id
+
+    def append(self, entry: Dict) -> List[Tuple[Tuple[str, ...], str, object]]:
+        """
+        수집 데이터 한 건 추가 (가득 찬 경우 가장 오래된 샘플을 제거)
+
+        Returns:
+            평탄화한 필드 목록 (통계 갱신 등에 다시 사용)
+        """
+        if self._size < self.capacity:
+            row = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            row = self._start
+            self._start = (self._start + 1) % self.capacity
+
+        timestamp = entry['timestamp']
+        self._timestamps[row] = timestamp.timestamp() if isinstance(timestamp, datetime) else float(timestamp)
+
+        fields = flatten_entry({key: value for key, value in entry.items() if key != 'timestamp'})
+        written = set()
+        for path, kind, value in fields:
+            if kind in (KIND_LIST, KIND_EMPTY_DICT):
+                continue
+            name = column_name(path)
+            if kind == KIND_STR:
+                column = self._text_columns.get(name)
+                if column is None:
+                    column = self._text_columns[name] = [None] * self.capacity
+                column[row] = value
+                written.add(name)
+                continue
+            if kind == KIND_NONE:
+                # None 값만으로는 열을 만들지 않음 (기존 열은 아래에서 NaN 처리)
+                continue
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = array('d', [NAN]) * self.capacity
+            column[row] = float(value)
+            written.add(name)
+
+        # 이번 샘플에 없는 열은 재사용되는 위치의 이전 값을 지움
+        for name, column in self._columns.items():
+            if name not in written:
+                column[row] = NAN
+        for name, column in self._text_columns.items():
+            if name not in written:
+                column[row] = None
+
+        self._schema_ids[row] = self._intern_schema(tuple((path, kind) for path, kind, _ in fields))
+        return fields
+
+    def get_entry(self, index: int) -> Dict:
+        """논리 인덱스의 샘플을 수집 시점과 같은 중첩 딕셔너리로 복원"""
+        row = self._row(index)
+        fields = []
+        for path, kind in self._schemas[self._schema_ids[row]]:
+            value = None
+            if kind == KIND_STR:
+                value = self._text_columns[column_name(path)][row]
+            elif kind in NUMERIC_KINDS:
+                value = self._columns[column_name(path)][row]
+                if kind == KIND_INT:
+                    value = int(value)
+                elif kind == KIND_BOOL:
+                    value = bool(value)
+            fields.append((path, kind, value))
+
+        entry = {'timestamp': datetime.fromtimestamp(self._timestamps[row])}
+        entry.update(_unflatten_entry(fields))
+        return entry
+
+    def _ordered(self, source):
+        """링 버퍼 열을 시간 순서의 새 배열로 복사"""
+        end = self._start + self._size
+        if end <= self.capacity:
+            return source[self._start:end]
+        return source[self._start:] + source[:end - self.capacity]
+
+    def timestamps(self) -> array:
+        """epoch 초 단위 타임스탬프 열 (시간 순서)"""
+        return self._ordered(self._timestamps)
+
+    def column(self, path: str) -> array:
+        """
+        숫자 메트릭 열 반환 (시간 순서, 값이 없는 샘플은 NaN)
+
+        Args:
+            path: 'cpu.percent', 'memory.swap_percent' 형식의 메트릭 경로
+        """
+        if path not in self._columns:
+            raise KeyError(path)
+        return self._ordered(self._columns[path])
+
+    def text_column(self, path: str) -> List[Optional[str]]:
+        """문자열 메트릭 열 반환 (시간 순서)"""
+        return self._ordered(self._text_columns[path])
+
+    def paths(self) -> List[str]:
+        """저장된 숫자 메트릭 경로 목록"""
+        return list(self._columns)
+
+    def field_kinds(self) -> Dict[Tuple[str, ...], str]:
+        """지금까지 저장된 모든 경로 튜플과 값 종류 (경로 요소에 '.'이 있어도 구분 가능)"""
+        kinds: Dict[Tuple[str, ...], str] = {}
+        for schema in self._schemas:
+            for path, kind in schema:
+                if kind in NUMERIC_KINDS or kind == KIND_STR:
+                    kinds.setdefault(path, kind)
+        return kinds
+
+    def save(self, path: str, metadata: Optional[Dict] = None):
+        """
+        저장된 샘플을 런 파일로 저장
+
+        zip 파일 안에 샘플 구조와 열 이름은 meta.json으로, 타임스탬프와 숫자 열은
+        시간 순서의 바이너리 배열로, 문자열 열은 JSON으로 저장합니다.
+
+        Args:
+            path: 저장할 파일 경로
+            metadata: 함께 저장할 실행 정보 (JSON으로 저장 가능한 딕셔너리)
+        """
+        numeric = list(self._columns)
+        text = list(self._text_columns)
+        meta = {
+            'version': RUN_FILE_VERSION,
+            'byteorder': sys.byteorder,
+            'samples': self._size,
+            'numeric_columns': numeric,
+            'text_columns': text,
+            'schemas': [[[list(path), kind] for path, kind in schema] for schema in self._schemas],
+            'metadata': metadata or {},
+        }
+        with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('meta.json', json.dumps(meta, ensure_ascii=False, indent=2))
+            archive.writestr('timestamps.f64', self.timestamps().tobytes())
+            archive.writestr('schema_ids.i32', self._ordered(self._schema_ids).tobytes())
+            for index, name in enumerate(numeric):
+                archive.writestr(f'columns/{index}.f64', self._ordered(self._columns[name]).tobytes())
+            archive.writestr('text_columns.json',
+                             json.dumps([self._ordered(self._text_columns[name]) for name in text], ensure_ascii=False))
+
+    @classmethod
+    def load(cls, path: str) -> Tuple['HistoryStore', Dict]:
+        """
+        런 파일 불러오기
+
+        Args:
+            path: save()로 저장한 파일 경로
+
+        Returns:
+            (샘플 수만큼의 용량을 가진 HistoryStore, 저장할 때의 실행 정보)
+        """
+        with zipfile.ZipFile(path) as archive:
+            meta = json.loads(archive.read('meta.json'))
+            if meta.get('version') != RUN_FILE_VERSION:
+                raise ValueError(f"지원하지 않는 런 파일 버전입니다: {meta.get('version')}")
+
+            size = meta['samples']
+            store = cls(max(size, 1))
+            if size == 0:
+                return store, meta['metadata']
+
+            swap = meta['byteorder'] != sys.byteorder
+
+            def read_array(typecode: str, name: str) -> array:
+                values = array(typecode)
+                values.frombytes(archive.read(name))
+                if swap:
+                    values.byteswap()
+                if len(values) != size:
+                    raise ValueError(f"런 파일이 손상되었습니다: {name}")
+                return values
+
+            store._timestamps = read_array('d', 'timestamps.f64')
+            store._schema_ids = read_array('i', 'schema_ids.i32')
+            store._columns = {name: read_array('d', f'columns/{index}.f64')
+                              for index, name in enumerate(meta['numeric_columns'])}
+            store._text_columns = dict(zip(meta['text_columns'], json.loads(archive.read('text_columns.json'))))
+            for schema in meta['schemas']:
+                store._intern_schema(tuple((tuple(path), kind) for path, kind in schema))
+            store._size = size
+        return store, meta['metadata']
+
+    def view(self) -> 'HistoryView':
+        """GraphGenerator, PDFReporter에서 사용하는 리스트 호환 뷰 반환"""
+        return HistoryView(self)
+
+    def clear(self):
+        """저장된 샘플 모두 제거 (할당된 열은 유지)"""
+        self._start = 0
+        self._size = 0
+
+
+class HistoryView(Sequence):
+    """HistoryStore를 기존 data_history(딕셔너리 리스트)처럼 읽기 위한 뷰"""
+
+    def __init__(self, store: HistoryStore):
+        self.store = store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.store.get_entry(i) for i in range(*index.indices(len(self.store)))]
+        return self.store.get_entry(index)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(len(self.store)):
+            yield self.store.get_entry(i)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+import 시간 측정 스크립트
+
+대상마다 새 인터프리터에서 import 시간을 여러 번 측정하고, 무거운 라이브러리
+(matplotlib, reportlab, numpy, GPUtil)가 함께 로드되었는지 표시합니다.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+# 측정 대상: 이름, import 문
+TARGETS = {
+    'ResourceCollector': 'from system_monitor import ResourceCollector',
+    'AsyncResourceCollector': 'from system_monitor import AsyncResourceCollector',
+    'MetricSeries': 'from system_monitor import MetricSeries',
+    'PDFReporter': 'from system_monitor import PDFReporter',
+    'GraphGenerator': 'from system_monitor import GraphGenerator',
+}
+
+# 로드 여부를 확인할 무거운 라이브러리
+HEAVY_MODULES = ('matplotlib', 'reportlab', 'numpy', 'GPUtil')
+
+# 새 인터프리터에서 실행할 측정 코드
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+def measure(statement: str, repeat: int = 5) -> Dict:
+    """
+    import 문 실행 시간 측정
+
+    Args:
+        statement: 측정할 import 문
+        repeat: 측정 횟수 (매번 새 인터프리터)
+
+    Returns:
+        median_ms, min_ms, 로드된 무거운 라이브러리 목록
+    """
+    # 패키지 상위 디렉토리에서 실행하여 설치 없이 system_monitor를 import
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    times: List[float] = []
+    loaded: List[str] = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True)
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        times.append(sample['seconds'])
+        loaded = sample['loaded']
+    return {
+        'median_ms': statistics.median(times) * 1000,
+        'min_ms': min(times) * 1000,
+        'loaded': loaded,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure system_monitor import time in fresh interpreters')
+    parser.add_argument('-n', '--repeat', type=int, default=5,
+                        help='Number of fresh interpreters per target (default: 5)')
+    parser.add_argument('targets', nargs='*', metavar='TARGET',
+                        help=f'Targets to measure: {", ".join(TARGETS)} (default: all)')
+    args = parser.parse_args()
+
+    if args.repeat <= 0:
+        print("Error: Repeat count must be greater than 0")
+        sys.exit(1)
+
+    unknown = [name for name in args.targets if name not in TARGETS]
+    if unknown:
+        print(f"Error: Unknown target: {', '.join(unknown)}")
+        sys.exit(1)
+
+    print(f"{'Target':<24} {'Median':>10} {'Min':>10}  Heavy modules loaded")
+    print("-" * 70)
+    for name in args.targets or TARGETS:
+        result = measure(TARGETS[name], args.repeat)
+        loaded = ', '.join(result['loaded']) or '-'
+        print(f"{name:<24} {result['median_ms']:>8.1f}ms {result['min_ms']:>8.1f}ms  {loaded}")
@@ -0,0 +1,146 @@
+"""
+지표 시계열 모듈
+수집 히스토리를 한 번에 NumPy 배열로 변환하여 그래프 생성에 사용합니다.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .history_store import KIND_STR, NUMERIC_KINDS, HistoryView, column_name, flatten_entry
+except ImportError:
+    from history_store import KIND_STR, NUMERIC_KINDS, HistoryView, column_name, flatten_entry
+
+Path = Tuple[str, ...]
+
+
+def _local_datetimes(epoch_seconds: np.ndarray) -> np.ndarray:
+    """epoch 초 배열을 로컬 시각의 datetime64[us] 배열로 변환 (그래프 축이 기존과 같도록)"""
+    if len(epoch_seconds) == 0:
+        return np.array([], dtype='datetime64[us]')
+    # 수집 기간 중 UTC 오프셋은 첫 샘플 기준으로 고정 (datetime.fromtimestamp와 같은 로컬 시각)
+    first = float(epoch_seconds[0])
+    offset = datetime.fromtimestamp(first).astimezone().utcoffset().total_seconds()
+    microseconds = np.round((epoch_seconds + offset) * 1_000_000).astype('int64')
+    return microseconds.astype('datetime64[us]')
+
+
+class MetricSeries:
+    """
+    경로별 NumPy 배열로 변환된 수집 히스토리
+
+    숫자 지표는 float64 배열(값이 없는 샘플은 NaN), 문자열 지표는 리스트로 보관하며
+    ('disk', 'devices', 'sda', 'read_bytes_per_sec')와 같은 경로 튜플로 조회합니다.
+    """
+
+    def __init__(self, timestamps: np.ndarray, columns: Dict[Path, np.ndarray],
+                 text_columns: Dict[Path, List[Optional[str]]]):
+        """
+        초기화
+
+        Args:
+            timestamps: datetime64 타임스탬프 배열
+            columns: 경로별 숫자 배열
+            text_columns: 경로별 문자열 목록
+        """
+        self.timestamps = timestamps
+        self.columns = columns
+        self.text_columns = text_columns
+        self._empty = np.full(len(timestamps), np.nan)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_history(cls, data_history: Iterable[Dict]) -> 'MetricSeries':
+        """
+        수집 히스토리 변환
+
+        HistoryView는 HistoryStore의 열 배열을 그대로 가져오고, 딕셔너리 목록은
+        한 번만 순회하며 모든 경로의 배열을 채웁니다.
+        """
+        if isinstance(data_history, HistoryView):
+            return cls._from_store(data_history.store)
+        if isinstance(data_history, MetricSeries):
+            return data_history
+        return cls._from_entries(list(data_history))
+
+    @classmethod
+    def _from_store(cls, store) -> 'MetricSeries':
+        """HistoryStore 열 배열에서 변환"""
+        timestamps = _local_datetimes(np.frombuffer(store.timestamps(), dtype=np.float64))
+        columns = {}
+        text_columns = {}
+        numeric_names = set(store.paths())
+        for path, kind in store.field_kinds().items():
+            name = column_name(path)
+            if kind == KIND_STR:
+                text_columns[path] = store.text_column(name)
+            elif name in numeric_names:
+                columns[path] = np.frombuffer(store.column(name), dtype=np.float64)
+        return cls(timestamps, columns, text_columns)
+
+    @classmethod
+    def _from_entries(cls, entries: List[Dict]) -> 'MetricSeries':
+        """딕셔너리 목록에서 변환"""
+        count = len(entries)
+        timestamps = np.array([entry['timestamp'] for entry in entries], dtype='datetime64[us]')
+        columns: Dict[Path, np.ndarray] = {}
+        text_columns: Dict[Path, List[Optional[str]]] = {}
+
+        for row, entry in enumerate(entries):
+            fields = flatten_entry({key: value for key, value in entry.items() if key != 'timestamp'})
+            for path, kind, value in fields:
+                if kind in NUMERIC_KINDS:
+                    column = columns.get(path)
+                    if column is None:
+                        column = columns[path] = np.full(count, np.nan)
+                    column[row] = value
+                elif kind == KIND_STR:
+                    column = text_columns.get(path)
+                    if column is None:
+                        column = text_columns[path] = [None] * count
+                    column[row] = value
+        return cls(timestamps, columns, text_columns)
+
+    def get(self, *path: str) -> np.ndarray:
+        """숫자 지표 배열 (없는 경로는 NaN 배열)"""
+        return self.columns.get(path, self._empty)
+
+    def has(self, *path: str) -> bool:
+        """경로에 유효한 값이 하나라도 있는지 여부"""
+        column = self.columns.get(path)
+        return column is not None and bool(np.isfinite(column).any())
+
+    def text(self, *path: str) -> Optional[str]:
+        """문자열 지표의 첫 번째 값 (GPU 이름 등)"""
+        return next((value for value in self.text_columns.get(path, ()) if value is not None), None)
+
+    def subset(self, *prefixes: Path) -> 'MetricSeries':
+        """
+        경로가 prefixes 중 하나로 시작하는 지표만 담은 시계열 (배열은 복사하지 않음)
+
+        예: subset(('cpu',), ('memory', 'percent'))
+        """
+        def selected(path: Path) -> bool:
+            return any(path[:len(prefix)] == prefix for prefix in prefixes)
+
+        return MetricSeries(self.timestamps,
+                            {path: column for path, column in self.columns.items() if selected(path)},
+                            {path: column for path, column in self.text_columns.items() if selected(path)})
+
+    def children(self, *prefix: str) -> List[str]:
+        """
+        경로 바로 아래 항목 이름 목록 (처음 나타난 순서)
+
+        예: children('disk', 'devices') -> ['sda', 'nvme0n1']
+        """
+        depth = len(prefix)
+        names = {}
+        for paths in (self.columns, self.text_columns):
+            for path in paths:
+                if len(path) > depth and path[:depth] == prefix:
+                    names.setdefault(path[depth], None)
+        return list(names)
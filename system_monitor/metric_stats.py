@@ -0,0 +1,405 @@
+"""
+지표 통계 모듈
+수집 간격이 일정하지 않은 시계열에서도 올바른 통계를 계산합니다.
+"""
+
+import math
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    from .history_store import KIND_FLOAT, KIND_INT, HistoryView, column_name, flatten_entry
+except ImportError:
+    from history_store import KIND_FLOAT, KIND_INT, HistoryView, column_name, flatten_entry
+
+Timestamp = Union[datetime, float]
+
+# 통계를 계산하는 값 종류 (불리언 플래그는 제외)
+STAT_KINDS = (KIND_FLOAT, KIND_INT)
+
+# 백분위수 스케치 기본 설정 (상대 오차 1%, 지표당 최대 버킷 수)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+
+# 이 값보다 절댓값이 작으면 0으로 집계
+SKETCH_MIN_VALUE = 1e-9
+
+# PDF 리포트와 CLI 요약에서 사용하는 지표 (ResourceCollector는 기본적으로 이 지표만 집계)
+REPORTED_METRICS = ('cpu.percent', 'memory.percent', 'disk.percent',
+                    'network.upload_speed_mbps', 'network.download_speed_mbps',
+                    'collection_time.total')
+
+
+def _seconds(timestamp: Timestamp) -> float:
+    """datetime 또는 초 단위 시각을 초 단위 실수로 변환"""
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
+def time_weighted_mean(timestamps: Sequence[Timestamp], values: Sequence[Optional[float]]) -> Optional[float]:
+    """
+    시간 가중 평균 (사다리꼴 적분 / 전체 시간)
+
+    수집 간격이 바뀌어도 촘촘하게 수집된 구간이 평균을 끌어가지 않도록
+    각 구간의 길이만큼 가중치를 둡니다. None 값은 건너뜁니다.
+
+    Args:
+        timestamps: 수집 시각 목록 (datetime 또는 초)
+        values: timestamps와 같은 길이의 값 목록
+
+    Returns:
+        시간 가중 평균 (값이 없으면 None, 전체 시간이 0이면 단순 평균)
+    """
+    points = [(_seconds(t), v) for t, v in zip(timestamps, values) if v is not None]
+    if not points:
+        return None
+
+    area = 0.0
+    for (t0, v0), (t1, v1) in zip(points, points[1:]):
+        area += (v0 + v1) / 2 * (t1 - t0)
+    span = points[-1][0] - points[0][0]
+    if span <= 0:
+        return sum(v for _, v in points) / len(points)
+    return area / span
+
+
+class QuantileSketch:
+    """
+    병합 가능한 백분위수 스케치 (DDSketch 방식)
+
+    값을 로그 간격 버킷(경계 비율 gamma = (1 + a) / (1 - a))에 세어 두므로 어떤
+    백분위수든 상대 오차 a 이내로 추정합니다. 버킷 수가 max_buckets를 넘으면 가장
+    작은 버킷들을 합쳐 메모리를 제한하며, 이 경우 낮은 백분위수의 정확도만 떨어집니다.
+    """
+
+    __slots__ = ('relative_accuracy', 'max_buckets', 'count', 'zero_count',
+                 '_gamma', '_log_gamma', '_positive', '_negative')
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 max_buckets: int = DEFAULT_MAX_BUCKETS):
+        """
+        초기화
+
+        Args:
+            relative_accuracy: 백분위수 추정의 상대 오차 (0 < a < 1)
+            max_buckets: 부호별 최대 버킷 수
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("상대 오차는 0과 1 사이여야 합니다.")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        self.zero_count = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+
+    def _key(self, magnitude: float) -> int:
+        """절댓값이 속하는 버킷 번호 (gamma^(k-1) < magnitude <= gamma^k)"""
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        """버킷의 대표값 (상대 오차가 가장 작은 지점)"""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _collapse(self, buckets: Dict[int, int]):
+        """버킷 수가 한도를 넘으면 가장 작은 버킷들을 하나로 합침"""
+        if len(buckets) <= self.max_buckets:
+            return
+        keys = sorted(buckets)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            buckets[target] += buckets.pop(key)
+
+    def add(self, value: float):
+        """값 추가 (NaN은 무시)"""
+        if value != value:
+            return
+        self.count += 1
+        if value > SKETCH_MIN_VALUE:
+            buckets = self._positive
+            key = self._key(value)
+        elif value < -SKETCH_MIN_VALUE:
+            buckets = self._negative
+            key = self._key(-value)
+        else:
+            self.zero_count += 1
+            return
+
+        if key in buckets:
+            buckets[key] += 1
+        else:
+            buckets[key] = 1
+            self._collapse(buckets)
+
+    def merge(self, other: 'QuantileSketch'):
+        """같은 상대 오차로 만든 다른 스케치를 합침"""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("상대 오차가 같은 스케치만 병합할 수 있습니다.")
+
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for mine, theirs in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+            self._collapse(mine)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        백분위수 추정
+
+        Args:
+            q: 0~1 사이의 분위 (예: 0.95)
+
+        Returns:
+            추정값 (값이 없으면 None)
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("분위는 0과 1 사이여야 합니다.")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+        # 음수는 절댓값이 큰 버킷부터가 작은 값
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self._positive)) if self._positive else 0.0
+
+    @property
+    def bucket_count(self) -> int:
+        """사용 중인 버킷 수"""
+        return len(self._positive) + len(self._negative)
+
+
+class RunningStats:
+    """
+    한 지표의 스트리밍 통계
+
+    값이 들어올 때마다 개수, 평균, 분산(Welford 방식), 최솟값, 최댓값과
+    시간 가중 평균을 위한 적분값을 갱신하므로 히스토리를 다시 읽지 않습니다.
+    """
+
+    __slots__ = ('count', 'mean', '_m2', 'min', 'max', '_area', '_span', '_last_time', '_last_value', 'sketch')
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._area = 0.0
+        self._span = 0.0
+        self._last_time: Optional[float] = None
+        self._last_value = 0.0
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float, timestamp: float):
+        """
+        값 추가
+
+        Args:
+            value: 측정값
+            timestamp: 수집 시각 (초)
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if self._last_time is not None and timestamp > self._last_time:
+            elapsed = timestamp - self._last_time
+            self._area += (self._last_value + value) / 2 * elapsed
+            self._span += elapsed
+        self._last_time = timestamp
+        self._last_value = value
+        self.sketch.add(value)
+
+    @property
+    def variance(self) -> float:
+        """모분산"""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        """표준편차"""
+        return math.sqrt(self.variance)
+
+    @property
+    def time_weighted_mean(self) -> float:
+        """시간 가중 평균 (time_weighted_mean()과 같은 사다리꼴 방식, 구간이 없으면 평균)"""
+        return self._area / self._span if self._span > 0 else self.mean
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """백분위수 추정 (예: percentile(95), 상대 오차 이내)"""
+        value = self.sketch.quantile(percent / 100)
+        if value is None:
+            return None
+        # 버킷 대표값이 실제 범위를 벗어나지 않도록 보정
+        return min(max(value, self.min), self.max)
+
+    def to_dict(self) -> Dict[str, float]:
+        """통계 딕셔너리"""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'time_weighted_mean': self.time_weighted_mean,
+            'variance': self.variance,
+            'std': self.std,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+
+class MetricStats:
+    """
+    모든 숫자 지표의 스트리밍 통계
+
+    ResourceCollector가 collect_all()마다 갱신하며, 지표는 HistoryStore와 같은
+    'cpu.percent' 형식의 이름으로 조회합니다. 링 버퍼에서 밀려난 샘플도 포함한
+    수집 전체 기간의 통계이며, 백분위수 스케치 덕분에 수집 기간과 관계없이
+    지표당 메모리 사용량이 제한됩니다. paths를 지정하면 그 지표만 집계하여
+    고빈도 수집에서 갱신 비용을 줄입니다.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+                 paths: Optional[Iterable[str]] = None):
+        """
+        초기화
+
+        Args:
+            relative_accuracy: 백분위수 추정의 상대 오차
+            paths: 통계를 계산할 지표 이름 목록 (None이면 모든 숫자 지표)
+        """
+        self.relative_accuracy = relative_accuracy
+        self.paths = frozenset(paths) if paths is not None else None
+        self._stats: Dict[str, RunningStats] = {}
+        # 경로별 지표 이름 캐시 (집계하지 않는 경로는 None)
+        self._names: Dict[Tuple[str, ...], Optional[str]] = {}
+        self.samples = 0
+
+    def update(self, timestamp: Timestamp, fields: Iterable[Tuple[Tuple[str, ...], str, object]]):
+        """
+        평탄화된 수집 데이터로 통계 갱신
+
+        Args:
+            timestamp: 수집 시각
+            fields: flatten_entry() 결과 (HistoryStore.append()의 반환값)
+        """
+        seconds = _seconds(timestamp)
+        self.samples += 1
+        names = self._names
+        for path, kind, value in fields:
+            if kind not in STAT_KINDS:
+                continue
+            try:
+                name = names[path]
+            except KeyError:
+                name = column_name(path)
+                if self.paths is not None and name not in self.paths:
+                    name = None
+                names[path] = name
+            if name is None:
+                continue
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = RunningStats(self.relative_accuracy)
+            stats.add(float(value), seconds)
+
+    def add(self, entry: Dict):
+        """수집 데이터 한 건으로 통계 갱신"""
+        self.update(entry['timestamp'],
+                    flatten_entry({key: value for key, value in entry.items() if key != 'timestamp'}))
+
+    @classmethod
+    def from_history(cls, data_history: Iterable[Dict], paths: Optional[Iterable[str]] = None,
+                     sources: Optional[Dict[str, List[str]]] = None) -> 'MetricStats':
+        """
+        수집 데이터 목록에서 통계 계산 (한 번만 순회, HistoryView는 열 배열에서 바로 계산)
+
+        Args:
+            data_history: 수집 히스토리
+            paths: 통계를 계산할 지표 이름 목록 (None이면 모든 숫자 지표)
+            sources: 매번 실행되지 않는 수집기별 결과 경로 (ResourceCollector.interval_sources()).
+                     HistoryView에서만 사용하며, 해당 경로는 collection_time.<수집기>가 있는
+                     (실제로 수집한) 샘플만 집계
+        """
+        if isinstance(data_history, HistoryView):
+            return cls._from_store(data_history.store, paths, sources)
+        stats = cls(paths=paths)
+        for entry in data_history:
+            stats.add(entry)
+        return stats
+
+    @classmethod
+    def _from_store(cls, store, paths: Optional[Iterable[str]] = None,
+                    sources: Optional[Dict[str, List[str]]] = None) -> 'MetricStats':
+        """HistoryStore 열 배열에서 통계 계산 (샘플마다 딕셔너리를 복원하지 않음)"""
+        stats = cls(paths=paths)
+        timestamps = store.timestamps()
+        numeric_names = set(store.paths())
+        prefixes = [(prefix, source) for source, source_prefixes in (sources or {}).items()
+                    for prefix in source_prefixes]
+        for path, kind in store.field_kinds().items():
+            name = column_name(path)
+            if kind not in STAT_KINDS or name not in numeric_names:
+                continue
+            if stats.paths is not None and name not in stats.paths:
+                continue
+            running = RunningStats(stats.relative_accuracy)
+            source = next((source for prefix, source in prefixes
+                           if name == prefix or name.startswith(prefix + '.')), None)
+            ran_name = f'collection_time.{source}'
+            if source is not None and ran_name in numeric_names:
+                # 수집기가 실행되지 않은 샘플은 이전 결과를 반복한 값이므로 제외
+                samples = ((timestamp, value) for timestamp, value, ran
+                           in zip(timestamps, store.column(name), store.column(ran_name)) if ran == ran)
+            else:
+                samples = zip(timestamps, store.column(name))
+            for timestamp, value in samples:
+                # 값이 없는 샘플은 NaN으로 저장되어 있음
+                if value == value:
+                    running.add(value, timestamp)
+            if running.count:
+                stats._stats[name] = running
+        stats.samples = len(store)
+        return stats
+
+    def get(self, name: str) -> Optional[RunningStats]:
+        """지표 이름의 통계 (없으면 None)"""
+        return self._stats.get(name)
+
+    def __getitem__(self, name: str) -> RunningStats:
+        return self._stats[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._stats
+
+    def names(self) -> List[str]:
+        """통계가 있는 지표 이름 목록"""
+        return list(self._stats)
+
+    def clear(self):
+        """통계 초기화"""
+        self._stats = {}
+        self.samples = 0
@@ -3,15 +3,39 @@
 시스템 리소스 모니터링 메인 스크립트
 
 5분간 시스템 리소스를 모니터링하고 결과를 PDF 리포트로 생성합니다.
+collect / render / report 하위 명령으로 수집 결과를 런 파일에 저장하고,
+저장된 런 파일로 그래프와 리포트를 다시 만들 수 있습니다.
 """
 
+import os
 import sys
 import time
 import argparse
 from datetime import datetime
-from resource_collector import ResourceCollector
-from graph_generator import GraphGenerator
-from pdf_reporter import PDFReporter
+from typing import Dict, Optional, Tuple
+from resource_collector import (ResourceCollector, CPU_SAMPLING_BLOCKING, CPU_SAMPLING_DELTA, CPU_SAMPLING_MODES,
+                                BACKEND_PSUTIL, BACKEND_PROCFS, BACKENDS, GPU_BACKEND_GPUTIL,
+                                GPU_BACKEND_NVIDIA_SMI, GPU_BACKENDS)
+from history_store import HistoryStore
+from metric_stats import MetricStats, REPORTED_METRICS
+from scheduler import SamplingScheduler, AdaptiveScheduler, CpuBudget
+
+# downsampling.DEFAULT_MAX_POINTS와 같은 값 (downsampling은 numpy를 불러오므로 그래프 단계에서만 import)
+DEFAULT_MAX_POINTS = 1800
+
+# 그래프 엔진 (matplotlib 그래프 또는 matplotlib 없이 PDF에 직접 그리는 reportlab 차트)
+CHART_ENGINE_MATPLOTLIB = 'matplotlib'
+CHART_ENGINE_REPORTLAB = 'reportlab'
+CHART_ENGINES = (CHART_ENGINE_MATPLOTLIB, CHART_ENGINE_REPORTLAB)
+
+# 고빈도 모드에서 허용하는 최소 수집 간격 (초)
+MIN_INTERVAL = 0.01
+
+# 진행 상황 표시 최소 간격 (초)
+PROGRESS_REFRESH_INTERVAL = 0.5
+
+# CPU 예산 초과 시 수집 간격을 늘리는 배율
+INTERVAL_BACKOFF = 1.5
 
 
 def print_progress_bar(iteration, total, prefix='', suffix='', length=50, fill='█'):
@@ -24,107 +48,478 @@ def print_progress_bar(iteration, total, prefix='', suffix='', length=50, fill='
         print()
 
 
-def monitor_system(duration_minutes: int = 5, interval_seconds: int = 5, output_dir: str = "output"):
+def apply_cpu_budget(scheduler: SamplingScheduler, budget: CpuBudget, requested_interval: float):
     """
-    시스템 리소스 모니터링 실행
+    CPU 예산에 맞춰 수집 간격 조절
+
+    예산을 넘으면 간격(적응형이면 최소 간격)을 늘리고, 사용률이 예산의 절반 미만이면
+    요청한 간격 쪽으로 되돌립니다.
+    """
+    adaptive = isinstance(scheduler, AdaptiveScheduler)
+    floor = scheduler.min_interval if adaptive else scheduler.interval
+    if budget.exceeded:
+        floor *= INTERVAL_BACKOFF
+    elif budget.last_percent < budget.budget_percent / 2 and floor > requested_interval:
+        floor = max(requested_interval, floor / INTERVAL_BACKOFF)
+    else:
+        return
+
+    if adaptive:
+        scheduler.min_interval = floor = min(floor, scheduler.max_interval)
+        if scheduler.interval >= floor:
+            return
+    scheduler.set_interval(floor, scheduler.current_tick + 1)
+
+
+def default_run_file(output_dir: str) -> str:
+    """출력 디렉토리 안의 런 파일 경로 (수집 시작 시각 기준 이름)"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return os.path.join(output_dir, f"system_monitor_run_{timestamp}.zip")
+
+
+def collect_data(duration_minutes: int = 5, interval_seconds: float = 5, output_dir: str = "output",
+                 cpu_sampling: str = CPU_SAMPLING_BLOCKING, parallel: bool = False,
+                 backend: str = BACKEND_PSUTIL, gpu_backend: str = GPU_BACKEND_GPUTIL,
+                 nvidia_smi_command: str = 'nvidia-smi', top_processes: int = 0,
+                 high_frequency: bool = False, cpu_budget: float = 5.0,
+                 adaptive: bool = False, min_interval: Optional[float] = None,
+                 max_interval: Optional[float] = None,
+                 expensive_interval: float = 10.0) -> Optional[Tuple[ResourceCollector, Dict]]:
+    """
+    시스템 리소스 수집 단계
 
     Args:
-        duration_minutes: 모니터링 지속 시간 (분)
-        interval_seconds: 데이터 수집 간격 (초)
-        output_dir: 출력 디렉토리
+        monitor_system()의 수집 관련 인자와 같음
+
+    Returns:
+        (수집기, 런 파일에 저장할 실행 정보), 수집된 데이터가 없으면 None
     """
+    if high_frequency:
+        # 수집 중 대기가 없는 delta 방식과 상주 nvidia-smi 사용
+        cpu_sampling = CPU_SAMPLING_DELTA
+        parallel = False
+        gpu_backend = GPU_BACKEND_NVIDIA_SMI
+        if sys.platform.startswith('linux'):
+            backend = BACKEND_PROCFS
+
+    if adaptive:
+        min_interval = min_interval if min_interval is not None else interval_seconds / 5
+        max_interval = max_interval if max_interval is not None else interval_seconds * 5
+
     print("=" * 70)
     print("         System Resource Monitoring System         ")
     print("=" * 70)
     print(f"\nMonitoring Configuration:")
     print(f"  - Duration: {duration_minutes} minutes")
-    print(f"  - Sampling Interval: {interval_seconds} seconds")
+    print(f"  - Sampling Interval: {interval_seconds:g} seconds")
+    if adaptive:
+        print(f"  - Adaptive Interval: {min_interval:g} - {max_interval:g} seconds")
+    print(f"  - High-Frequency Mode: {f'enabled (CPU budget {cpu_budget:g}%)' if high_frequency else 'disabled'}")
+    print(f"  - CPU Sampling: {cpu_sampling}")
+    print(f"  - Parallel Collection: {'enabled' if parallel else 'disabled'}")
+    print(f"  - Collector Backend: {backend}")
+    print(f"  - GPU Backend: {gpu_backend}")
+    print(f"  - Top Processes: {top_processes if top_processes > 0 else 'disabled'}")
+    print(f"  - Expensive Collector Interval: {expensive_interval:g} seconds")
     print(f"  - Output Directory: {output_dir}")
     print(f"  - Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("\n" + "=" * 70)
 
     # 수집기 초기화
-    collector = ResourceCollector()
-    total_iterations = (duration_minutes * 60) // interval_seconds
-
-    print(f"\nStarting data collection... ({total_iterations} data points)")
+    total_seconds = duration_minutes * 60
+    total_iterations = int(total_seconds / (min_interval if adaptive else interval_seconds))
+    collector = ResourceCollector(cpu_sampling=cpu_sampling, parallel=parallel,
+                                  history_capacity=max(total_iterations, 1), backend=backend,
+                                  gpu_backend=gpu_backend, nvidia_smi_command=nvidia_smi_command,
+                                  gpu_query_interval_ms=int(max(interval_seconds, 0.1) * 1000),
+                                  process_top_n=top_processes, expensive_interval=expensive_interval)
+
+    print(f"\nStarting data collection... ({'up to ' if adaptive else ''}{total_iterations} data points)")
     print("Please wait, this will take approximately", duration_minutes, "minutes.\n")
 
-    # 데이터 수집
-    for i in range(total_iterations):
-        try:
-            # 데이터 수집
-            data = collector.collect_all()
-
-            # 진행 상황 표시
-            elapsed_time = (i + 1) * interval_seconds
-            remaining_time = (total_iterations - i - 1) * interval_seconds
-            print_progress_bar(
-                i + 1, total_iterations,
-                prefix=f'Progress [{elapsed_time}s / {duration_minutes * 60}s]',
-                suffix=f'Remaining: {remaining_time}s | CPU: {data["cpu"]["percent"]:.1f}% | Mem: {data["memory"]["percent"]:.1f}%',
-                length=40
-            )
-
-            # 마지막 반복이 아니면 대기
-            if i < total_iterations - 1:
-                time.sleep(interval_seconds)
-
-        except KeyboardInterrupt:
-            print("\n\nMonitoring interrupted by user.")
-            if i > 0:
-                print(f"Collected {i + 1} data points. Generating report with available data...")
-                break
-            else:
-                print("No data collected. Exiting...")
-                return
-        except Exception as e:
-            print(f"\nError during data collection: {e}")
-            if i > 0:
-                print("Continuing with available data...")
-                break
-            else:
-                print("Failed to collect any data. Exiting...")
-                return
-
-    # 데이터 히스토리 가져오기
-    data_history = collector.get_history()
-
-    if not data_history:
+    # 데이터 수집 (예정 시각에 맞춰 수집하여 수집 시간이 간격에 누적되지 않음)
+    # 적응형 모드에서는 지표 변화량에 따라, 고빈도 모드에서는 CPU 예산에 따라 간격을 조절
+    if adaptive:
+        scheduler = AdaptiveScheduler(interval_seconds, min_interval, max_interval)
+    else:
+        scheduler = SamplingScheduler(interval_seconds)
+    budget = CpuBudget(cpu_budget) if high_frequency else None
+    overhead_percent = None
+    last_progress = 0.0
+    try:
+        for i in scheduler.ticks(None if adaptive else total_iterations, duration=total_seconds):
+            try:
+                # 데이터 수집
+                data = collector.collect_all()
+
+                if adaptive:
+                    scheduler.observe(data)
+                if budget is not None and budget.update() is not None:
+                    apply_cpu_budget(scheduler, budget, min_interval if adaptive else interval_seconds)
+
+                # 진행 상황 표시 (짧은 간격에서는 일정 주기로만 갱신)
+                now = time.monotonic()
+                if now - last_progress < PROGRESS_REFRESH_INTERVAL and i + 1 < total_iterations:
+                    continue
+                last_progress = now
+                elapsed_time = min(scheduler.elapsed, total_seconds)
+                print_progress_bar(
+                    elapsed_time, total_seconds,
+                    prefix=f'Progress [{elapsed_time:.0f}s / {total_seconds}s]',
+                    suffix=f'Remaining: {total_seconds - elapsed_time:.0f}s | CPU: {data["cpu"]["percent"]:.1f}% | Mem: {data["memory"]["percent"]:.1f}%',
+                    length=40
+                )
+
+            except Exception as e:
+                print(f"\nError during data collection: {e}")
+                if len(collector.get_history()) > 0:
+                    print("Continuing with available data...")
+                    break
+                else:
+                    print("Failed to collect any data. Exiting...")
+                    return None
+
+    except KeyboardInterrupt:
+        print("\n\nMonitoring interrupted by user.")
+        collected = len(collector.get_history())
+        if collected > 0:
+            print(f"Collected {collected} data points. Saving available data...")
+        else:
+            print("No data collected. Exiting...")
+            return None
+    finally:
+        collector.close()
+        if budget is not None:
+            overhead_percent = budget.overall_percent()
+
+    if not collector.get_history():
         print("\nNo data collected. Exiting...")
-        return
+        return None
 
-    print(f"\n\nData collection completed! Collected {len(data_history)} data points.")
+    print(f"\n\nData collection completed! Collected {len(collector.get_history())} data points.")
     print("\n" + "=" * 70)
 
-    # 그래프 생성
+    # 리포트와 요약을 다른 프로세스에서 다시 만들 때 필요한 실행 정보
+    metadata = {
+        'duration_minutes': duration_minutes,
+        'interval_seconds': interval_seconds,
+        'adaptive': adaptive,
+        'cpu_budget': cpu_budget if high_frequency else None,
+        'overhead_percent': overhead_percent,
+        'sampling': scheduler.get_stats(),
+        'sources': collector.interval_sources(),
+    }
+    return collector, metadata
+
+
+def save_run(store: HistoryStore, metadata: Dict, run_file: str) -> str:
+    """
+    수집 결과를 런 파일로 저장
+
+    Args:
+        store: 수집 히스토리 저장소
+        metadata: collect_data()가 반환한 실행 정보
+        run_file: 저장할 경로
+
+    Returns:
+        저장한 런 파일 경로
+    """
+    directory = os.path.dirname(run_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    store.save(run_file, metadata)
+    print(f"\nRun file saved to: {run_file}")
+    return run_file
+
+
+def load_run(run_file: str) -> Tuple[HistoryStore, Dict]:
+    """런 파일 불러오기 (파일이 없거나 손상되면 예외 발생)"""
+    store, metadata = HistoryStore.load(run_file)
+    if not len(store):
+        raise ValueError("run file contains no data points")
+    print(f"Loaded {len(store)} data points from {run_file}")
+    return store, metadata
+
+
+def render_graphs(data_history, output_dir: str, parallel_graphs: bool = False,
+                  max_points: int = DEFAULT_MAX_POINTS, envelope: bool = False,
+                  in_memory_graphs: bool = False, vector_graphs: bool = False) -> Dict:
+    """
+    matplotlib 그래프 생성 단계 (실패하면 예외 발생)
+
+    Args:
+        data_history: 수집 히스토리
+        output_dir: 그래프를 저장할 디렉토리
+        그 외: monitor_system()의 그래프 관련 인자와 같음
+
+    Returns:
+        그래프 이름별 파일 경로 또는 메모리 버퍼
+    """
     print("\nGenerating graphs...")
-    graph_generator = GraphGenerator(output_dir=output_dir)
+    # matplotlib은 이 단계에서만 불러옴
+    from graph_generator import GraphGenerator, GRAPH_FORMAT_PNG, GRAPH_FORMAT_SVG
+    from pdf_reporter import SVG_AVAILABLE
+
+    if vector_graphs and not SVG_AVAILABLE:
+        print("  svglib is not installed; falling back to PNG graphs (pip install svglib)")
+        vector_graphs = False
+    graph_generator = GraphGenerator(output_dir=output_dir, parallel=parallel_graphs,
+                                     max_points=max_points, envelope=envelope, in_memory=in_memory_graphs,
+                                     graph_format=GRAPH_FORMAT_SVG if vector_graphs else GRAPH_FORMAT_PNG)
+
+    graph_paths = graph_generator.generate_all_graphs(data_history)
+    print("  ✓ CPU graph generated")
+    print("  ✓ Memory graph generated")
+    print("  ✓ Disk graph generated")
+    print("  ✓ Disk I/O graph generated")
+    print("  ✓ Network graph generated")
+    print("  ✓ GPU graph generated")
+    return graph_paths
+
+
+def build_report(data_history, graph_paths: Optional[Dict], output_dir: str,
+                 duration_minutes: float, stats: MetricStats) -> str:
+    """
+    PDF 리포트 생성 단계 (실패하면 예외 발생)
+
+    Args:
+        data_history: 수집 히스토리
+        graph_paths: render_graphs() 결과 (None이면 reportlab 차트를 직접 그림)
+        output_dir: 리포트를 저장할 디렉토리
+        duration_minutes: 모니터링 지속 시간 (분)
+        stats: 지표별 누적 통계
+
+    Returns:
+        생성된 PDF 경로
+    """
+    print("\nGenerating PDF report...")
+    # reportlab은 수집이 끝난 뒤에 불러옴 (수집 시작 지연 방지)
+    from pdf_reporter import PDFReporter
+    pdf_reporter = PDFReporter(output_dir=output_dir)
+    pdf_path = pdf_reporter.generate_report(
+        data_history=data_history,
+        graph_paths=graph_paths,
+        monitoring_duration=duration_minutes,
+        stats=stats
+    )
+    print(f"  ✓ PDF report generated successfully!")
+    return pdf_path
+
+
+def print_summary(metadata: Dict, data_points: int, stats: MetricStats):
+    """
+    수집 요약 출력
 
+    Args:
+        metadata: collect_data()가 반환한 (또는 런 파일에서 읽은) 실행 정보
+        data_points: 수집된 데이터 개수
+        stats: 지표별 누적 통계
+    """
+    sampling_stats = metadata['sampling']
+    interval_seconds = metadata['interval_seconds']
+    overhead_percent = metadata.get('overhead_percent')
+    print("\nSummary:")
+    print(f"  - Total monitoring time: {sampling_stats['elapsed_seconds']:.1f} seconds")
+    print(f"  - Data points collected: {data_points}")
+    # 수집 간격이 일정하지 않을 수 있으므로 시간 가중 평균 사용
+    for label, name in (('CPU', 'cpu.percent'), ('memory', 'memory.percent'), ('disk', 'disk.percent')):
+        print(f"  - Average {label} usage: {stats[name].time_weighted_mean:.2f}% "
+              f"(std {stats[name].std:.2f} | p95 {stats[name].percentile(95):.2f}%)")
+    print(f"  - Missed sampling ticks: {sampling_stats['missed_ticks']}")
+    if sampling_stats['ticks'] > 1 and sampling_stats['elapsed_seconds'] > 0:
+        # 첫 수집은 시작 시각에 실행되므로 간격 수는 수집 횟수 - 1
+        print(f"  - Achieved sampling rate: {(sampling_stats['ticks'] - 1) / sampling_stats['elapsed_seconds']:.2f} Hz "
+              f"(requested {1 / interval_seconds:.2f} Hz)")
+    if metadata.get('adaptive'):
+        print(f"  - Interval changes: {sampling_stats['interval_changes']} "
+              f"(range {sampling_stats['min_interval']:g} - {sampling_stats['max_interval']:g} s)")
+    if metadata.get('adaptive') or overhead_percent is not None:
+        print(f"  - Final sampling interval: {sampling_stats['interval'] * 1000:.1f} ms "
+              f"(requested {interval_seconds * 1000:.1f} ms)")
+    if overhead_percent is not None:
+        print(f"  - Monitor CPU overhead: {overhead_percent:.2f}% (budget {metadata['cpu_budget']:g}%)")
+    print(f"  - Sampling jitter: mean {sampling_stats['jitter_mean_ms']:.2f} ms | "
+          f"std {sampling_stats['jitter_std_ms']:.2f} ms | max {sampling_stats['jitter_max_ms']:.2f} ms")
+    print(f"  - Average collection time per sample: "
+          f"{stats['collection_time.total'].mean * 1000:.1f} ms")
+    print("\n" + "=" * 70)
+
+
+def collect_run(run_file: Optional[str] = None, **collect_options) -> Optional[str]:
+    """
+    collect 하위 명령: 수집 후 런 파일만 저장 (그래프와 리포트는 만들지 않음)
+
+    Args:
+        run_file: 런 파일 경로 (None이면 출력 디렉토리에 자동 생성)
+        collect_options: collect_data() 인자
+
+    Returns:
+        저장한 런 파일 경로, 수집된 데이터가 없으면 None
+    """
+    result = collect_data(**collect_options)
+    if result is None:
+        return None
+    collector, metadata = result
+    output_dir = collect_options.get('output_dir', 'output')
     try:
-        graph_paths = graph_generator.generate_all_graphs(data_history)
-        print("  ✓ CPU graph generated")
-        print("  ✓ Memory graph generated")
-        print("  ✓ Disk graph generated")
-        print("  ✓ Network graph generated")
-        print("  ✓ GPU graph generated")
+        run_file = save_run(collector.history, metadata, run_file or default_run_file(output_dir))
+    except Exception as e:
+        print(f"\nError saving run file: {e}")
+        return None
+    print_summary(metadata, len(collector.get_history()), collector.stats)
+    return run_file
+
+
+def render_run(run_file: str, output_dir: str = "output", parallel_graphs: bool = False,
+               max_points: int = DEFAULT_MAX_POINTS, envelope: bool = False, vector_graphs: bool = False):
+    """
+    render 하위 명령: 저장된 런 파일로 그래프 파일만 다시 생성
+
+    Args:
+        run_file: collect로 저장한 런 파일
+        output_dir: 그래프를 저장할 디렉토리
+        그 외: monitor_system()의 그래프 관련 인자와 같음
+    """
+    try:
+        store, _ = load_run(run_file)
+    except Exception as e:
+        print(f"\nError reading run file: {e}")
+        return
+
+    try:
+        render_graphs(store.view(), output_dir, parallel_graphs=parallel_graphs, max_points=max_points,
+                      envelope=envelope, vector_graphs=vector_graphs)
     except Exception as e:
         print(f"\nError generating graphs: {e}")
         return
+    print(f"\nGraphs saved in: {output_dir}/")
 
-    # PDF 리포트 생성
-    print("\nGenerating PDF report...")
-    pdf_reporter = PDFReporter(output_dir=output_dir)
 
+def report_run(run_file: str, output_dir: str = "output", chart_engine: str = CHART_ENGINE_MATPLOTLIB,
+               parallel_graphs: bool = False, max_points: int = DEFAULT_MAX_POINTS, envelope: bool = False,
+               in_memory_graphs: bool = False, vector_graphs: bool = False) -> Optional[str]:
+    """
+    report 하위 명령: 저장된 런 파일로 그래프와 PDF 리포트를 다시 생성
+
+    Args:
+        run_file: collect로 저장한 런 파일
+        output_dir: 리포트와 그래프를 저장할 디렉토리
+        그 외: monitor_system()의 그래프 관련 인자와 같음
+
+    Returns:
+        생성된 PDF 경로, 실패하면 None
+    """
     try:
-        pdf_path = pdf_reporter.generate_report(
-            data_history=data_history,
-            graph_paths=graph_paths,
-            monitoring_duration=duration_minutes
-        )
-        print(f"  ✓ PDF report generated successfully!")
+        store, metadata = load_run(run_file)
+    except Exception as e:
+        print(f"\nError reading run file: {e}")
+        return None
+
+    data_history = store.view()
+    # 수집 때와 같은 통계를 열 배열에서 다시 계산
+    stats = MetricStats.from_history(data_history, paths=REPORTED_METRICS, sources=metadata.get('sources'))
+    try:
+        if chart_engine == CHART_ENGINE_MATPLOTLIB:
+            graph_paths = render_graphs(data_history, output_dir, parallel_graphs=parallel_graphs,
+                                        max_points=max_points, envelope=envelope,
+                                        in_memory_graphs=in_memory_graphs, vector_graphs=vector_graphs)
+        else:
+            graph_paths = None
+    except Exception as e:
+        print(f"\nError generating graphs: {e}")
+        return None
+
+    try:
+        pdf_path = build_report(data_history, graph_paths, output_dir, metadata['duration_minutes'], stats)
+    except Exception as e:
+        print(f"\nError generating PDF report: {e}")
+        return None
+
+    print(f"\nReport saved to: {pdf_path}")
+    print_summary(metadata, len(store), stats)
+    return pdf_path
+
+
+def monitor_system(duration_minutes: int = 5, interval_seconds: float = 5, output_dir: str = "output",
+                   cpu_sampling: str = CPU_SAMPLING_BLOCKING, parallel: bool = False,
+                   backend: str = BACKEND_PSUTIL, gpu_backend: str = GPU_BACKEND_GPUTIL,
+                   nvidia_smi_command: str = 'nvidia-smi', top_processes: int = 0,
+                   high_frequency: bool = False, cpu_budget: float = 5.0,
+                   adaptive: bool = False, min_interval: Optional[float] = None,
+                   max_interval: Optional[float] = None, expensive_interval: float = 10.0,
+                   parallel_graphs: bool = False, max_points: int = DEFAULT_MAX_POINTS,
+                   envelope: bool = False, in_memory_graphs: bool = False, vector_graphs: bool = False,
+                   chart_engine: str = CHART_ENGINE_MATPLOTLIB, run_file: Optional[str] = None):
+    """
+    시스템 리소스 모니터링 실행
+
+    수집이 끝나면 먼저 런 파일을 저장하므로, 그래프나 리포트 생성이 실패해도
+    'monitor.py report <런 파일>'로 수집 없이 다시 만들 수 있습니다.
+
+    Args:
+        duration_minutes: 모니터링 지속 시간 (분)
+        interval_seconds: 데이터 수집 간격 (초)
+        output_dir: 출력 디렉토리
+        cpu_sampling: CPU 사용률 측정 방식 ('blocking' 또는 'delta')
+        parallel: 각 수집기를 동시에 실행할지 여부
+        backend: 수집 백엔드 ('psutil' 또는 'procfs')
+        gpu_backend: GPU 수집 방식 ('gputil' 또는 'nvidia-smi')
+        nvidia_smi_command: 'nvidia-smi' 방식에서 실행할 nvidia-smi 경로
+        top_processes: 수집할 상위 프로세스 개수 (0이면 수집 안 함)
+        high_frequency: 고빈도 모드 (1초 미만 간격, 대기 없는 수집기 사용)
+        cpu_budget: 고빈도 모드에서 모니터 자체가 사용할 수 있는 CPU 사용률 (%)
+        adaptive: 지표 변화량에 따라 수집 간격을 조절할지 여부
+        min_interval: 적응형 수집의 최소 간격 (초, 기본값: interval_seconds / 5)
+        max_interval: 적응형 수집의 최대 간격 (초, 기본값: interval_seconds * 5)
+        expensive_interval: 비싼 수집기(GPUtil, 상위 프로세스)의 수집 간격 (초)
+        parallel_graphs: 그래프를 작업 프로세스에서 동시에 생성할지 여부
+        max_points: 그래프의 선마다 그릴 최대 점 개수 (0이면 다운샘플링 안 함)
+        envelope: 다운샘플링된 선에 최솟값~최댓값 음영을 표시할지 여부
+        in_memory_graphs: 그래프를 PNG 파일로 저장하지 않고 메모리에서 바로 PDF에 넣을지 여부
+        vector_graphs: 그래프를 SVG로 생성하여 PDF에 벡터 도형으로 넣을지 여부 (svglib 필요)
+        chart_engine: 그래프 엔진 ('matplotlib' 또는 matplotlib을 불러오지 않는 'reportlab')
+        run_file: 런 파일 경로 (None이면 출력 디렉토리에 자동 생성)
+    """
+    result = collect_data(duration_minutes=duration_minutes, interval_seconds=interval_seconds,
+                          output_dir=output_dir, cpu_sampling=cpu_sampling, parallel=parallel,
+                          backend=backend, gpu_backend=gpu_backend, nvidia_smi_command=nvidia_smi_command,
+                          top_processes=top_processes, high_frequency=high_frequency, cpu_budget=cpu_budget,
+                          adaptive=adaptive, min_interval=min_interval, max_interval=max_interval,
+                          expensive_interval=expensive_interval)
+    if result is None:
+        return
+    collector, metadata = result
+    data_history = collector.get_history()
+
+    # 그래프/리포트 단계보다 먼저 저장하여 실패해도 수집 데이터가 남도록 함
+    try:
+        run_file = save_run(collector.history, metadata, run_file or default_run_file(output_dir))
+    except Exception as e:
+        print(f"\nError saving run file: {e}")
+        run_file = None
+    retry = f"\nCollected data is kept in {run_file}; retry with: python monitor.py report {run_file}"
+
+    # 그래프 생성 (reportlab 차트는 PDF 리포트를 만들 때 직접 그림)
+    try:
+        if chart_engine == CHART_ENGINE_MATPLOTLIB:
+            graph_paths = render_graphs(data_history, output_dir, parallel_graphs=parallel_graphs,
+                                        max_points=max_points, envelope=envelope,
+                                        in_memory_graphs=in_memory_graphs, vector_graphs=vector_graphs)
+        else:
+            graph_paths = None
+    except Exception as e:
+        print(f"\nError generating graphs: {e}")
+        if run_file:
+            print(retry)
+        return
+
+    # PDF 리포트 생성
+    try:
+        pdf_path = build_report(data_history, graph_paths, output_dir, duration_minutes, collector.stats)
     except Exception as e:
         print(f"\nError generating PDF report: {e}")
+        if run_file:
+            print(retry)
         return
 
     # 완료 메시지
@@ -132,34 +527,14 @@ def monitor_system(duration_minutes: int = 5, interval_seconds: int = 5, output_
     print("         Monitoring Complete!         ")
     print("=" * 70)
     print(f"\nReport saved to: {pdf_path}")
-    print(f"Graphs saved in: {output_dir}/")
-    print("\nSummary:")
-    print(f"  - Total monitoring time: {len(data_history) * interval_seconds} seconds")
-    print(f"  - Data points collected: {len(data_history)}")
-    print(f"  - Average CPU usage: {sum(d['cpu']['percent'] for d in data_history) / len(data_history):.2f}%")
-    print(f"  - Average memory usage: {sum(d['memory']['percent'] for d in data_history) / len(data_history):.2f}%")
-    print(f"  - Average disk usage: {sum(d['disk']['percent'] for d in data_history) / len(data_history):.2f}%")
-    print("\n" + "=" * 70)
-
-
-def main():
-    """메인 함수"""
-    parser = argparse.ArgumentParser(
-        description='System Resource Monitoring Tool',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Monitor for 5 minutes (default)
-  python monitor.py
+    if chart_engine == CHART_ENGINE_MATPLOTLIB and not in_memory_graphs:
+        print(f"Graphs saved in: {output_dir}/")
+    # 수집 중 갱신된 통계 사용
+    print_summary(metadata, len(data_history), collector.stats)
 
-  # Monitor for 10 minutes with 10-second intervals
-  python monitor.py -d 10 -i 10
-
-  # Specify custom output directory
-  python monitor.py -o /path/to/output
-        """
-    )
 
+def add_collection_arguments(parser: argparse.ArgumentParser):
+    """수집 옵션 추가 (기본 실행과 collect 하위 명령)"""
     parser.add_argument(
         '-d', '--duration',
         type=int,
@@ -169,21 +544,198 @@ Examples:
 
     parser.add_argument(
         '-i', '--interval',
-        type=int,
+        type=float,
         default=5,
-        help='Data collection interval in seconds (default: 5)'
+        help='Data collection interval in seconds, fractions allowed (default: 5)'
+    )
+
+    parser.add_argument(
+        '--high-frequency', '--hf',
+        action='store_true',
+        help='High-frequency mode for sub-second intervals (10-100 ms): uses delta CPU sampling, '
+             'the procfs backend on Linux and a persistent nvidia-smi process'
+    )
+
+    parser.add_argument(
+        '--cpu-budget',
+        type=float,
+        default=5.0,
+        metavar='PERCENT',
+        help='Maximum CPU usage of the monitor itself in high-frequency mode; '
+             'the interval is widened when exceeded (default: 5.0)'
+    )
+
+    parser.add_argument(
+        '--cpu-sampling',
+        choices=CPU_SAMPLING_MODES,
+        default=CPU_SAMPLING_BLOCKING,
+        help='CPU usage sampling mode: "blocking" waits 1 second per sample, '
+             '"delta" compares against the previous sample without waiting (default: blocking)'
+    )
+
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='Run the CPU, memory, disk, network and GPU collectors concurrently'
+    )
+
+    parser.add_argument(
+        '--backend',
+        choices=BACKENDS,
+        default=BACKEND_PSUTIL,
+        help='Collector backend: "psutil" or "procfs" (Linux only, reads /proc and /sys directly) '
+             '(default: psutil)'
+    )
+
+    parser.add_argument(
+        '--gpu-backend',
+        choices=GPU_BACKENDS,
+        default=GPU_BACKEND_GPUTIL,
+        help='GPU collection method: "gputil" runs nvidia-smi on every sample, '
+             '"nvidia-smi" keeps one nvidia-smi process running in loop mode (default: gputil)'
+    )
+
+    parser.add_argument(
+        '--nvidia-smi',
+        type=str,
+        default='nvidia-smi',
+        help='Path to the nvidia-smi executable used by --gpu-backend nvidia-smi (default: nvidia-smi)'
+    )
+
+    parser.add_argument(
+        '--adaptive',
+        action='store_true',
+        help='Shorten the interval when CPU, memory or network metrics change quickly '
+             'and lengthen it when they are stable'
+    )
+
+    parser.add_argument(
+        '--min-interval',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help='Shortest interval used by --adaptive (default: interval / 5)'
+    )
+
+    parser.add_argument(
+        '--max-interval',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help='Longest interval used by --adaptive (default: interval * 5)'
+    )
+
+    parser.add_argument(
+        '--top-processes',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Record the top N processes by CPU, memory and I/O every --expensive-interval seconds '
+             '(default: 0, disabled)'
+    )
+
+    parser.add_argument(
+        '--expensive-interval',
+        type=float,
+        default=10.0,
+        metavar='SECONDS',
+        help='Interval for expensive collectors (GPUtil GPU queries, top processes); '
+             'filesystem capacity is collected every 60 seconds (default: 10)'
+    )
+
+    parser.add_argument(
+        '--run-file',
+        type=str,
+        default=None,
+        metavar='PATH',
+        help='Path of the run file that stores the collected samples '
+             '(default: <output>/system_monitor_run_<timestamp>.zip)'
+    )
+
+
+def add_graph_arguments(parser: argparse.ArgumentParser, report: bool = True):
+    """
+    그래프 옵션 추가
+
+    Args:
+        parser: 옵션을 추가할 파서
+        report: PDF 리포트를 만드는 명령인지 여부 (그래프 엔진과 메모리 그래프 옵션 추가)
+    """
+    if report:
+        parser.add_argument(
+            '--chart-engine',
+            choices=CHART_ENGINES,
+            default=CHART_ENGINE_MATPLOTLIB,
+            help='Graph engine: "matplotlib" renders graph images, "reportlab" draws native charts '
+                 'directly into the PDF without importing matplotlib (default: matplotlib)'
+        )
+
+    parser.add_argument(
+        '--parallel-graphs',
+        action='store_true',
+        help='Render each graph in a separate worker process (scales with CPU cores)'
+    )
+
+    parser.add_argument(
+        '--max-points',
+        type=int,
+        default=DEFAULT_MAX_POINTS,
+        metavar='N',
+        help='Downsample each graph line to at most N points with LTTB; 0 plots every sample '
+             f'(default: {DEFAULT_MAX_POINTS})'
+    )
+
+    parser.add_argument(
+        '--envelope',
+        action='store_true',
+        help='Shade the min/max range of each downsampled bucket behind the line'
+    )
+
+    parser.add_argument(
+        '--vector-graphs',
+        action='store_true',
+        help='Render graphs as SVG and embed them in the PDF as vector drawings; '
+             'dense lines are rasterised (requires svglib)'
     )
 
+    if report:
+        parser.add_argument(
+            '--in-memory-graphs',
+            action='store_true',
+            help='Render graphs into memory and embed them directly in the PDF without writing PNG files'
+        )
+
+
+def add_output_argument(parser: argparse.ArgumentParser):
+    """출력 디렉토리 옵션 추가"""
     parser.add_argument(
         '-o', '--output',
         type=str,
         default='output',
-        help='Output directory for reports and graphs (default: output)'
+        help='Output directory for reports, graphs and run files (default: output)'
     )
 
-    args = parser.parse_args()
 
-    # 입력 검증
+def suppress_defaults(parser: argparse.ArgumentParser):
+    """
+    하위 명령 파서의 옵션 기본값 제거
+
+    argparse는 하위 명령의 기본값을 상위 파서 결과 위에 덮어쓰므로, 기본값을 없애
+    'monitor.py -d 10 collect'처럼 하위 명령 앞에 지정한 값이 유지되도록 합니다.
+    (지정하지 않은 옵션은 같은 옵션을 가진 상위 파서의 기본값을 사용)
+    """
+    for action in parser._actions:
+        if action.option_strings:
+            action.default = argparse.SUPPRESS
+
+
+def validate_collection_args(args: argparse.Namespace) -> Tuple[Optional[float], Optional[float]]:
+    """
+    수집 옵션 검증 (잘못된 값이면 오류 출력 후 종료)
+
+    Returns:
+        적응형 수집의 (최소 간격, 최대 간격), 적응형이 아니면 (None, None)
+    """
     if args.duration <= 0:
         print("Error: Duration must be greater than 0")
         sys.exit(1)
@@ -192,17 +744,161 @@ Examples:
         print("Error: Interval must be greater than 0")
         sys.exit(1)
 
+    if args.interval < MIN_INTERVAL:
+        print(f"Error: Interval must be at least {MIN_INTERVAL:g} seconds")
+        sys.exit(1)
+
+    if args.interval < 1 and args.cpu_sampling == CPU_SAMPLING_BLOCKING and not args.high_frequency:
+        print("Error: Sub-second intervals require --high-frequency or --cpu-sampling delta")
+        sys.exit(1)
+
+    if args.adaptive:
+        min_interval = args.min_interval if args.min_interval is not None else args.interval / 5
+        max_interval = args.max_interval if args.max_interval is not None else args.interval * 5
+        if args.min_interval is None and args.cpu_sampling == CPU_SAMPLING_BLOCKING and not args.high_frequency:
+            # blocking 방식은 수집에 1초가 걸리므로 기본 최소 간격도 1초 이상으로 제한
+            min_interval = max(min_interval, 1.0)
+        if not MIN_INTERVAL <= min_interval <= max_interval:
+            print(f"Error: Adaptive intervals must satisfy {MIN_INTERVAL:g} <= min-interval <= max-interval")
+            sys.exit(1)
+        if min_interval < 1 and args.cpu_sampling == CPU_SAMPLING_BLOCKING and not args.high_frequency:
+            print("Error: Sub-second intervals require --high-frequency or --cpu-sampling delta")
+            sys.exit(1)
+    else:
+        min_interval = max_interval = None
+
+    if args.expensive_interval < 0:
+        print("Error: Expensive collector interval cannot be negative")
+        sys.exit(1)
+
+    if args.cpu_budget <= 0:
+        print("Error: CPU budget must be greater than 0")
+        sys.exit(1)
+
+    if args.top_processes < 0:
+        print("Error: Top process count cannot be negative")
+        sys.exit(1)
+
     if args.interval > args.duration * 60:
         print("Error: Interval cannot be greater than total duration")
         sys.exit(1)
 
-    # 모니터링 실행
+    return min_interval, max_interval
+
+
+def validate_graph_args(args: argparse.Namespace):
+    """그래프 옵션 검증 (잘못된 값이면 오류 출력 후 종료)"""
+    if args.max_points != 0 and args.max_points < 3:
+        print("Error: Max points must be 0 (disabled) or at least 3")
+        sys.exit(1)
+
+
+def collect_options(args: argparse.Namespace) -> Dict:
+    """검증된 옵션에서 collect_data() 인자 생성"""
+    min_interval, max_interval = validate_collection_args(args)
+    return dict(
+        duration_minutes=args.duration,
+        interval_seconds=args.interval,
+        output_dir=args.output,
+        cpu_sampling=args.cpu_sampling,
+        parallel=args.parallel,
+        backend=args.backend,
+        gpu_backend=args.gpu_backend,
+        nvidia_smi_command=args.nvidia_smi,
+        top_processes=args.top_processes,
+        high_frequency=args.high_frequency,
+        cpu_budget=args.cpu_budget,
+        adaptive=args.adaptive,
+        min_interval=min_interval,
+        max_interval=max_interval,
+        expensive_interval=args.expensive_interval
+    )
+
+
+def graph_options(args: argparse.Namespace, report: bool = True) -> Dict:
+    """검증된 옵션에서 그래프 관련 인자 생성"""
+    validate_graph_args(args)
+    options = dict(
+        parallel_graphs=args.parallel_graphs,
+        max_points=args.max_points,
+        envelope=args.envelope,
+        vector_graphs=args.vector_graphs
+    )
+    if report:
+        options.update(in_memory_graphs=args.in_memory_graphs, chart_engine=args.chart_engine)
+    return options
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(
+        description='System Resource Monitoring Tool',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Monitor for 5 minutes (default)
+  python monitor.py
+
+  # Monitor for 10 minutes with 10-second intervals
+  python monitor.py -d 10 -i 10
+
+  # Non-blocking CPU sampling (no 1-second wait per sample)
+  python monitor.py -i 1 --cpu-sampling delta
+
+  # High-frequency sampling every 50 ms for 1 minute
+  python monitor.py -d 1 -i 0.05 --high-frequency
+
+  # Adaptive interval between 1 and 30 seconds
+  python monitor.py -i 5 --adaptive --min-interval 1 --max-interval 30
+
+  # Specify custom output directory
+  python monitor.py -o /path/to/output
+
+  # Collect into a run file, then render graphs or a report from it later
+  python monitor.py collect -d 10 --run-file run.zip
+  python monitor.py render run.zip --envelope
+  python monitor.py report run.zip --chart-engine reportlab
+        """
+    )
+    # 하위 명령 없이 실행하면 수집, 그래프, 리포트를 한 번에 실행
+    add_collection_arguments(parser)
+    add_graph_arguments(parser)
+    add_output_argument(parser)
+
+    subparsers = parser.add_subparsers(dest='command', title='commands')
+    collect_parser = subparsers.add_parser('collect', help='Collect samples and save them to a run file only')
+    add_collection_arguments(collect_parser)
+    add_output_argument(collect_parser)
+    suppress_defaults(collect_parser)
+
+    render_parser = subparsers.add_parser('render', help='Render graph files from a saved run file')
+    render_parser.add_argument('run_file', metavar='RUN_FILE', help='Run file written by collect')
+    add_graph_arguments(render_parser, report=False)
+    add_output_argument(render_parser)
+    suppress_defaults(render_parser)
+
+    report_parser = subparsers.add_parser('report', help='Generate graphs and a PDF report from a saved run file')
+    report_parser.add_argument('run_file', metavar='RUN_FILE', help='Run file written by collect')
+    add_graph_arguments(report_parser)
+    add_output_argument(report_parser)
+    suppress_defaults(report_parser)
+
+    args = parser.parse_args()
+
+    if args.command in ('render', 'report') and not os.path.isfile(args.run_file):
+        print(f"Error: Run file not found: {args.run_file}")
+        sys.exit(1)
+
     try:
-        monitor_system(
-            duration_minutes=args.duration,
-            interval_seconds=args.interval,
-            output_dir=args.output
-        )
+        if args.command == 'collect':
+            collect_run(run_file=args.run_file, **collect_options(args))
+        elif args.command == 'render':
+            render_run(args.run_file, output_dir=args.output, **graph_options(args, report=False))
+        elif args.command == 'report':
+            report_run(args.run_file, output_dir=args.output, **graph_options(args))
+        else:
+            # 모니터링 실행
+            monitor_system(run_file=args.run_file, **collect_options(args), **graph_options(args))
     except Exception as e:
         print(f"\nFatal error: {e}")
         import traceback
@@ -5,14 +5,28 @@ PDF 리포트 생성 모듈
 
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak, Table, TableStyle, Flowable
+from reportlab.graphics.shapes import Drawing
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from datetime import datetime
-from typing import List, Dict
+from typing import BinaryIO, List, Dict, Optional, Union
+import importlib.util
 import os
 
+try:
+    from .metric_stats import MetricStats, REPORTED_METRICS
+except ImportError:
+    from metric_stats import MetricStats, REPORTED_METRICS
+
+# svglib은 SVG 그래프를 넣을 때만 불러옴 (import 비용이 큼)
+SVG_AVAILABLE = importlib.util.find_spec('svglib') is not None
+
+# 그래프: PNG/SVG 파일 경로, 메모리 버퍼 (GraphGenerator(in_memory=True)의 BytesIO)
+# 또는 reportlab 차트 (rl_charts.build_charts()의 Drawing)
+Graph = Union[str, BinaryIO, Drawing]
+
 
 class PDFReporter:
     """시스템 모니터링 데이터를 PDF 리포트로 생성하는 클래스"""
@@ -69,24 +83,79 @@ class PDFReporter:
             bytes_value /= 1024.0
         return f"{bytes_value:.2f} PB"
 
-    def _create_summary_table(self, data_history: List[Dict]) -> Table:
+    @staticmethod
+    def _is_svg(graph: Graph) -> bool:
+        """SVG 그래프인지 확인 (경로는 확장자, 버퍼는 내용으로 판단)"""
+        if isinstance(graph, str):
+            return graph.lower().endswith('.svg')
+        head = graph.read(256).lstrip()
+        graph.seek(0)
+        return head.startswith(b'<?xml') or head.startswith(b'<svg')
+
+    @staticmethod
+    def _fit_drawing(drawing: Drawing, width: float, height: float) -> Drawing:
+        """벡터 도형을 지정한 크기로 맞춤"""
+        if (drawing.width, drawing.height) != (width, height):
+            drawing.scale(width / drawing.width, height / drawing.height)
+            drawing.width = width
+            drawing.height = height
+        return drawing
+
+    def _svg_drawing(self, graph: Graph, width: float, height: float) -> Optional[Drawing]:
+        """SVG를 reportlab 벡터 도형으로 변환하여 지정한 크기로 맞춤"""
+        if not SVG_AVAILABLE:
+            print("SVG 그래프를 넣으려면 svglib이 필요합니다: pip install svglib")
+            return None
+
+        from svglib.svglib import svg2rlg
+        drawing = svg2rlg(graph)
+        if drawing is None or not drawing.width or not drawing.height:
+            return None
+        return self._fit_drawing(drawing, width, height)
+
+    def _graph_image(self, graph: Optional[Graph], height: float) -> Optional[Flowable]:
+        """
+        그래프 이미지 플로어블 생성
+
+        PNG는 Image로, SVG와 reportlab 차트는 벡터 도형(Drawing)으로 넣습니다.
+
+        Args:
+            graph: PNG/SVG 파일 경로, 버퍼 또는 Drawing (없거나 파일이 없으면 None 반환)
+            height: 이미지 높이 (인치)
+        """
+        if graph is None:
+            return None
+        if isinstance(graph, Drawing):
+            return self._fit_drawing(graph, 6*inch, height*inch)
+        if isinstance(graph, str):
+            if not os.path.exists(graph):
+                return None
+        else:
+            # 같은 버퍼로 여러 리포트를 만들 수 있도록 처음부터 읽음
+            graph.seek(0)
+
+        if self._is_svg(graph):
+            return self._svg_drawing(graph, 6*inch, height*inch)
+        return Image(graph, width=6*inch, height=height*inch)
+
+    def _create_summary_table(self, data_history: List[Dict], stats: MetricStats) -> Table:
         """요약 테이블 생성"""
         if not data_history:
             return None
 
-        first_data = data_history[0]
         last_data = data_history[-1]
 
+        # 수집 간격이 일정하지 않을 수 있으므로 평균은 시간 가중 평균 사용
         # CPU 통계
-        cpu_values = [entry['cpu']['percent'] for entry in data_history]
-        cpu_avg = sum(cpu_values) / len(cpu_values)
-        cpu_max = max(cpu_values)
-        cpu_min = min(cpu_values)
+        cpu = stats['cpu.percent']
+        cpu_avg = cpu.time_weighted_mean
+        cpu_max = cpu.max
+        cpu_min = cpu.min
 
         # 메모리 통계
-        mem_values = [entry['memory']['percent'] for entry in data_history]
-        mem_avg = sum(mem_values) / len(mem_values)
-        mem_max = max(mem_values)
+        memory = stats['memory.percent']
+        mem_avg = memory.time_weighted_mean
+        mem_max = memory.max
 
         # 디스크 통계
         disk_percent = last_data['disk']['percent']
@@ -109,7 +178,8 @@ class PDFReporter:
         # GPU 정보 추가
         if last_data['gpu'] and last_data['gpu']['gpus']:
             for gpu in last_data['gpu']['gpus']:
-                gpu_info = f"GPU {gpu['id']} ({gpu['name']}): {gpu['load']:.1f}% | Temp: {gpu['temperature']}°C"
+                load = f"{gpu['load']:.1f}%" if gpu['load'] is not None else 'N/A'
+                gpu_info = f"GPU {gpu['id']} ({gpu['name']}): {load} | Temp: {gpu['temperature']}°C"
                 data.append(['GPU', gpu_info])
 
         table = Table(data, colWidths=[2*inch, 4*inch])
@@ -129,19 +199,33 @@ class PDFReporter:
 
         return table
 
-    def generate_report(self, data_history: List[Dict], graph_paths: Dict[str, str],
-                        monitoring_duration: int) -> str:
+    def generate_report(self, data_history: List[Dict], graph_paths: Optional[Dict[str, Graph]],
+                        monitoring_duration: int, stats: Optional[MetricStats] = None,
+                        chart_points: Optional[int] = None) -> str:
         """
         PDF 리포트 생성
 
         Args:
             data_history: 수집된 데이터 히스토리
-            graph_paths: 생성된 그래프 파일 경로들
+            graph_paths: 생성된 그래프 파일 경로 또는 BytesIO 버퍼 (버퍼는 디스크를 거치지 않고 바로 삽입,
+                SVG는 벡터 도형으로 삽입). None이면 matplotlib 없이 reportlab 차트를 직접 그림
             monitoring_duration: 모니터링 시간 (분)
+            stats: 수집 중 계산된 지표 통계 (없으면 data_history에서 한 번 계산)
+            chart_points: reportlab 차트에서 선마다 그릴 최대 점 개수 (기본값: rl_charts.DEFAULT_CHART_POINTS)
 
         Returns:
             생성된 PDF 파일 경로
         """
+        if stats is None:
+            stats = MetricStats.from_history(data_history, paths=REPORTED_METRICS)
+        if graph_paths is None:
+            # 차트를 그릴 때만 numpy를 불러옴
+            try:
+                from .rl_charts import DEFAULT_CHART_POINTS, build_charts
+            except ImportError:
+                from rl_charts import DEFAULT_CHART_POINTS, build_charts
+            graph_paths = build_charts(data_history, chart_points or DEFAULT_CHART_POINTS)
+
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         pdf_filename = f"system_monitor_report_{timestamp}.pdf"
         pdf_path = os.path.join(self.output_dir, pdf_filename)
@@ -174,7 +258,7 @@ class PDFReporter:
 
         # 요약 테이블
         story.append(Paragraph("Executive Summary", self.section_style))
-        summary_table = self._create_summary_table(data_history)
+        summary_table = self._create_summary_table(data_history, stats)
         if summary_table:
             story.append(summary_table)
         story.append(Spacer(1, 0.3*inch))
@@ -184,15 +268,15 @@ class PDFReporter:
 
         # CPU 그래프
         story.append(Paragraph("CPU Usage and Temperature", self.section_style))
-        if os.path.exists(graph_paths['cpu']):
-            cpu_img = Image(graph_paths['cpu'], width=6*inch, height=4*inch)
+        cpu_img = self._graph_image(graph_paths.get('cpu'), 4)
+        if cpu_img:
             story.append(cpu_img)
         story.append(Spacer(1, 0.2*inch))
 
         # 메모리 그래프
         story.append(Paragraph("Memory and Swap Usage", self.section_style))
-        if os.path.exists(graph_paths['memory']):
-            mem_img = Image(graph_paths['memory'], width=6*inch, height=3*inch)
+        mem_img = self._graph_image(graph_paths.get('memory'), 3)
+        if mem_img:
             story.append(mem_img)
         story.append(Spacer(1, 0.2*inch))
 
@@ -201,51 +285,58 @@ class PDFReporter:
 
         # 디스크 그래프
         story.append(Paragraph("Disk Usage", self.section_style))
-        if os.path.exists(graph_paths['disk']):
-            disk_img = Image(graph_paths['disk'], width=6*inch, height=3*inch)
+        disk_img = self._graph_image(graph_paths.get('disk'), 3)
+        if disk_img:
             story.append(disk_img)
         story.append(Spacer(1, 0.2*inch))
 
+        # 디스크 I/O 그래프
+        disk_io_img = self._graph_image(graph_paths.get('disk_io'), 4)
+        if disk_io_img:
+            story.append(PageBreak())
+            story.append(Paragraph("Disk I/O Throughput", self.section_style))
+            story.append(disk_io_img)
+            story.append(Spacer(1, 0.2*inch))
+
         # 네트워크 그래프
         story.append(Paragraph("Network Traffic", self.section_style))
-        if os.path.exists(graph_paths['network']):
-            net_img = Image(graph_paths['network'], width=6*inch, height=3*inch)
+        net_img = self._graph_image(graph_paths.get('network'), 4)
+        if net_img:
             story.append(net_img)
         story.append(Spacer(1, 0.2*inch))
 
         # GPU 그래프 (있는 경우)
-        if os.path.exists(graph_paths['gpu']):
+        gpu_img = self._graph_image(graph_paths.get('gpu'), 4)
+        if gpu_img:
             story.append(PageBreak())
             story.append(Paragraph("GPU Usage and Temperature", self.section_style))
-            gpu_img = Image(graph_paths['gpu'], width=6*inch, height=4*inch)
             story.append(gpu_img)
 
         # 페이지 나누기 및 상세 데이터
         story.append(PageBreak())
         story.append(Paragraph("Detailed Statistics", self.section_style))
 
-        # 상세 통계 테이블
-        cpu_values = [entry['cpu']['percent'] for entry in data_history]
-        mem_values = [entry['memory']['percent'] for entry in data_history]
-        disk_values = [entry['disk']['percent'] for entry in data_history]
-
-        detailed_data = [
-            ['Metric', 'Average', 'Minimum', 'Maximum'],
-            ['CPU Usage (%)', f'{sum(cpu_values)/len(cpu_values):.2f}',
-             f'{min(cpu_values):.2f}', f'{max(cpu_values):.2f}'],
-            ['Memory Usage (%)', f'{sum(mem_values)/len(mem_values):.2f}',
-             f'{min(mem_values):.2f}', f'{max(mem_values):.2f}'],
-            ['Disk Usage (%)', f'{sum(disk_values)/len(disk_values):.2f}',
-             f'{min(disk_values):.2f}', f'{max(disk_values):.2f}'],
-        ]
-
-        detailed_table = Table(detailed_data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1.5*inch])
+        # 상세 통계 테이블 (평균은 시간 가중 평균, 백분위수는 스케치 추정값)
+        detailed_data = [['Metric', 'Average', 'Std Dev', 'Min', 'P50', 'P95', 'P99', 'Max']]
+        for label, name in (('CPU Usage (%)', 'cpu.percent'),
+                            ('Memory Usage (%)', 'memory.percent'),
+                            ('Disk Usage (%)', 'disk.percent'),
+                            ('Upload (Mbps)', 'network.upload_speed_mbps'),
+                            ('Download (Mbps)', 'network.download_speed_mbps')):
+            metric = stats.get(name)
+            if metric is None:
+                continue
+            detailed_data.append([label] + [f'{value:.2f}' for value in (
+                metric.time_weighted_mean, metric.std, metric.min, metric.percentile(50),
+                metric.percentile(95), metric.percentile(99), metric.max)])
+
+        detailed_table = Table(detailed_data, colWidths=[1.5*inch] + [0.7*inch] * 7)
         detailed_table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2e5c8a')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
             ('BACKGROUND', (0, 1), (-1, -1), colors.white),
             ('GRID', (0, 0), (-1, -1), 1, colors.black),
@@ -0,0 +1,140 @@
+"""
+프로세스 수집 모듈
+CPU, 메모리, 디스크 I/O 사용량 상위 N개 프로세스를 수집합니다.
+"""
+
+import heapq
+import time
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+
+# 상위 프로세스 기본 개수
+DEFAULT_TOP_N = 5
+
+
+class ProcessSampler:
+    """
+    상위 N개 프로세스 수집기
+
+    pid별 psutil.Process 객체를 테이블에 캐시하고 pid 목록이 바뀐 부분만
+    추가/제거합니다. 각 프로세스는 oneshot()으로 한 번에 읽으며, CPU 사용률과
+    I/O 속도는 이전 수집 대비 차이로 계산합니다. pid가 다른 프로세스에 재사용되면
+    (생성 시각이 바뀌면) 캐시된 이름과 이전 값을 버리고 새 프로세스로 교체합니다.
+    """
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N):
+        """
+        초기화
+
+        Args:
+            top_n: 항목별로 보관할 상위 프로세스 개수
+        """
+        self.top_n = top_n
+        self._processes: Dict[int, psutil.Process] = {}
+        self._names: Dict[int, str] = {}
+        # pid별 이전 (CPU 시간 합계, I/O 바이트 합계)
+        self._last: Dict[int, Tuple[float, Optional[int]]] = {}
+        self._last_time = time.monotonic()
+
+    def _refresh_table(self):
+        """pid 목록의 변경 부분만 프로세스 테이블에 반영"""
+        pids = set(psutil.pids())
+        known = set(self._processes)
+
+        for pid in known - pids:
+            self._forget(pid)
+        for pid in pids - known:
+            try:
+                self._processes[pid] = psutil.Process(pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+    def _forget(self, pid: int):
+        """종료된 프로세스를 테이블에서 제거"""
+        self._processes.pop(pid, None)
+        self._names.pop(pid, None)
+        self._last.pop(pid, None)
+
+    def _name(self, pid: int) -> str:
+        """프로세스 이름 (최초 조회 후 캐시)"""
+        name = self._names.get(pid)
+        if name is None:
+            try:
+                name = self._processes[pid].name()
+            except (psutil.Error, KeyError):
+                name = ''
+            self._names[pid] = name
+        return name
+
+    def sample(self) -> Dict[str, List[Dict]]:
+        """
+        상위 프로세스 수집
+
+        Returns:
+            top_cpu, top_memory, top_io: 항목별 상위 N개 프로세스 목록
+        """
+        current_time = time.monotonic()
+        time_delta = current_time - self._last_time
+        self._last_time = current_time
+        self._refresh_table()
+
+        rows = []
+        for pid, process in list(self._processes.items()):
+            # is_running()은 pid와 생성 시각을 함께 비교하므로 pid 재사용을 감지함
+            if not process.is_running():
+                self._forget(pid)
+                try:
+                    process = self._processes[pid] = psutil.Process(pid)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            try:
+                with process.oneshot():
+                    cpu_times = process.cpu_times()
+                    rss = process.memory_info().rss
+                    try:
+                        io = process.io_counters()
+                        io_total = io.read_bytes + io.write_bytes
+                    except (psutil.AccessDenied, AttributeError):
+                        io_total = None
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                self._forget(pid)
+                continue
+            except psutil.AccessDenied:
+                continue
+
+            cpu_total = cpu_times.user + cpu_times.system
+            last = self._last.get(pid)
+            cpu_percent = 0.0
+            io_rate = 0.0
+            if last is not None and time_delta > 0:
+                cpu_percent = max(0.0, cpu_total - last[0]) / time_delta * 100
+                if io_total is not None and last[1] is not None:
+                    io_rate = max(0, io_total - last[1]) / time_delta
+            self._last[pid] = (cpu_total, io_total)
+            rows.append((pid, cpu_percent, rss, io_rate))
+
+        def top(index: int) -> List[Dict]:
+            return [{'pid': pid, 'name': self._name(pid), 'cpu_percent': cpu_percent,
+                     'memory_rss': rss, 'io_bytes_per_sec': io_rate}
+                    for pid, cpu_percent, rss, io_rate in heapq.nlargest(self.top_n, rows,
+                                                                         key=lambda row: row[index])]
+
+        return {
+            'count': len(rows),
+            'top_cpu': top(1),
+            'top_memory': top(2),
+            'top_io': top(3)
+        }
+
+
+if __name__ == "__main__":
+    # 테스트 코드
+    sampler = ProcessSampler()
+    sampler.sample()
+    time.sleep(1)
+    start = time.perf_counter()
+    result = sampler.sample()
+    print(f"프로세스 {result['count']}개 수집: {(time.perf_counter() - start) * 1000:.1f} ms")
+    for process in result['top_cpu']:
+        print(f"  {process['pid']:>7} {process['name']:<20} CPU {process['cpu_percent']:.1f}%")
@@ -0,0 +1,360 @@
+"""
+procfs/sysfs 직접 읽기 수집 백엔드 (Linux 전용)
+psutil과 같은 형식의 값을 반환하되, 필요한 파일을 열어 둔 채로 pread로 다시 읽어
+매 수집마다 파일을 열고 전체를 파싱하는 비용을 줄입니다.
+"""
+
+import os
+from collections import namedtuple
+from typing import Dict, List, Optional, Tuple
+
+# psutil과 같은 필드 이름을 사용하는 결과 타입
+scputimes = namedtuple('scputimes', ['user', 'nice', 'system', 'idle', 'iowait', 'irq',
+                                     'softirq', 'steal', 'guest', 'guest_nice'])
+scpufreq = namedtuple('scpufreq', ['current', 'min', 'max'])
+svmem = namedtuple('svmem', ['total', 'available', 'percent', 'used', 'free',
+                             'buffers', 'cached'])
+sswap = namedtuple('sswap', ['total', 'used', 'free', 'percent'])
+sdiskusage = namedtuple('sdiskusage', ['total', 'used', 'free', 'percent'])
+sdiskio = namedtuple('sdiskio', ['read_count', 'write_count', 'read_bytes', 'write_bytes',
+                                 'read_time', 'write_time', 'read_merged_count',
+                                 'write_merged_count', 'busy_time'])
+snetio = namedtuple('snetio', ['bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+                               'errin', 'errout', 'dropin', 'dropout'])
+
+# /proc/diskstats의 섹터 크기는 장치와 관계없이 항상 512바이트
+DISK_SECTOR_SIZE = 512
+
+# /proc/meminfo에서 사용하는 필드
+_MEMINFO_FIELDS = (b'MemTotal:', b'MemFree:', b'MemAvailable:', b'Buffers:', b'Cached:',
+                   b'SReclaimable:', b'SwapTotal:', b'SwapFree:')
+
+
+def _usage_percent(used: float, total: float) -> float:
+    """사용률 계산 (psutil과 같이 소수점 첫째 자리에서 반올림)"""
+    try:
+        return round(used / total * 100, 1)
+    except ZeroDivisionError:
+        return 0.0
+
+
+class PreadFile:
+    """한 번 열어 둔 파일을 재사용 버퍼로 반복해서 읽는 헬퍼"""
+
+    def __init__(self, path: str, buffer_size: int = 4096):
+        self.path = path
+        self.fd = os.open(path, os.O_RDONLY)
+        self.buffer = bytearray(buffer_size)
+
+    def read(self) -> bytes:
+        """
+        파일 전체를 오프셋 0부터 다시 읽음
+
+        procfs의 seq_file은 한 번에 약 한 페이지만 반환하므로 짧게 읽혀도 끝이 아닙니다.
+        pread가 0을 반환할 때까지 오프셋을 옮겨 가며 이어서 읽고, 버퍼가 차면 늘립니다.
+        """
+        offset = 0
+        while True:
+            if offset == len(self.buffer):
+                self.buffer.extend(bytes(len(self.buffer)))
+            with memoryview(self.buffer) as view:
+                n = os.preadv(self.fd, [view[offset:]], offset)
+            if n == 0:
+                return bytes(self.buffer[:offset])
+            offset += n
+
+    def close(self):
+        """파일 닫기"""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class ProcfsBackend:
+    """
+    /proc, /sys를 직접 읽는 psutil 호환 수집 백엔드
+
+    ResourceCollector가 사용하는 psutil 함수(cpu_times, virtual_memory, ...)와
+    같은 이름과 반환 형식을 제공합니다. proc_root, sys_root를 바꾸면 기록해 둔
+    fixture 디렉토리를 대상으로 실행할 수 있습니다.
+    """
+
+    def __init__(self, proc_root: str = '/proc', sys_root: str = '/sys'):
+        """
+        초기화
+
+        Args:
+            proc_root: procfs 경로
+            sys_root: sysfs 경로
+        """
+        self.proc_root = proc_root
+        self.sys_root = sys_root
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self._files: Dict[str, PreadFile] = {}
+        self._storage_devices: Dict[str, bool] = {}
+        self._cpu_count: Optional[int] = None
+        # cpufreq 정책별 (현재, 최소, 최대 클럭 파일 경로)
+        self._cpufreq_paths: Optional[List[Tuple[str, str, str]]] = None
+        # virtual_memory()가 파싱하여 다음 swap_memory()가 재사용할 /proc/meminfo 값
+        self._pending_meminfo: Optional[Dict[bytes, int]] = None
+
+    def _read(self, path: str) -> bytes:
+        """캐시된 파일 핸들로 파일 내용 읽기 (최초 호출 시 열기)"""
+        handle = self._files.get(path)
+        if handle is None:
+            handle = self._files[path] = PreadFile(path)
+        return handle.read()
+
+    def _read_optional(self, path: str) -> Optional[bytes]:
+        """파일이 없으면 None을 반환하는 _read"""
+        try:
+            return self._read(path)
+        except OSError:
+            return None
+
+    def close(self):
+        """열어 둔 파일 모두 닫기"""
+        for handle in self._files.values():
+            handle.close()
+        self._files.clear()
+
+    # ----- CPU -----
+
+    def cpu_times(self) -> scputimes:
+        """시스템 전체 CPU 시간 (/proc/stat 첫 줄)"""
+        content = self._read(os.path.join(self.proc_root, 'stat'))
+        values = content[:content.index(b'\n')].split()[1:]
+        fields = [int(value) / self.clock_ticks for value in values[:len(scputimes._fields)]]
+        fields.extend([0.0] * (len(scputimes._fields) - len(fields)))
+        return scputimes(*fields)
+
+    def cpu_count(self) -> Optional[int]:
+        """논리 CPU 개수 (/proc/stat의 cpuN 줄 수)"""
+        if self._cpu_count is None:
+            content = self._read(os.path.join(self.proc_root, 'stat'))
+            count = sum(1 for line in content.splitlines()
+                        if line.startswith(b'cpu') and line[3:4].isdigit())
+            self._cpu_count = count or None
+        return self._cpu_count
+
+    def cpu_freq(self) -> Optional[scpufreq]:
+        """평균 CPU 클럭 (MHz). 열어 둔 sysfs cpufreq 파일을 읽고, 없으면 /proc/cpuinfo 사용"""
+        if self._cpufreq_paths is None:
+            self._cpufreq_paths = self._cpufreq_files()
+        policies = self._cpufreq_paths
+        if not policies:
+            return self._cpuinfo_freq()
+
+        currents, mins, maxes = [], [], []
+        for current_path, min_path, max_path in policies:
+            currents.append(int(self._read(current_path)) / 1000)
+            mins.append(int(self._read(min_path)) / 1000)
+            maxes.append(int(self._read(max_path)) / 1000)
+
+        count = len(policies)
+        return scpufreq(sum(currents) / count, sum(mins) / count, sum(maxes) / count)
+
+    def _cpuinfo_freq(self) -> Optional[scpufreq]:
+        """/proc/cpuinfo의 'cpu MHz' 평균 (sysfs cpufreq가 없는 경우)"""
+        cpuinfo = self._read_optional(os.path.join(self.proc_root, 'cpuinfo'))
+        if not cpuinfo:
+            return None
+        freqs = [float(line.split(b':', 1)[1]) for line in cpuinfo.splitlines()
+                 if line.lower().startswith(b'cpu mhz')]
+        if not freqs:
+            return None
+        return scpufreq(sum(freqs) / len(freqs), 0.0, 0.0)
+
+    def _cpufreq_files(self) -> List[Tuple[str, str, str]]:
+        """정책별 현재/최소/최대 클럭 파일 (하나라도 없으면 빈 목록으로 cpuinfo 사용)"""
+        files = []
+        for policy in self._cpufreq_policies():
+            current = next((os.path.join(policy, name) for name in ('scaling_cur_freq', 'cpuinfo_cur_freq')
+                            if os.path.exists(os.path.join(policy, name))), None)
+            paths = (current, os.path.join(policy, 'scaling_min_freq'), os.path.join(policy, 'scaling_max_freq'))
+            if current is None or not all(os.path.exists(path) for path in paths[1:]):
+                return []
+            files.append(paths)
+        return files
+
+    def _cpufreq_policies(self) -> List[str]:
+        """cpufreq 디렉토리 목록 (cpufreq/policyN 또는 cpuN/cpufreq, 번호 순)"""
+        base = os.path.join(self.sys_root, 'devices', 'system', 'cpu')
+        for parent, prefix, child in (('cpufreq', 'policy', ''), ('', 'cpu', 'cpufreq')):
+            directory = os.path.join(base, parent)
+            try:
+                numbers = sorted(int(name[len(prefix):]) for name in os.listdir(directory)
+                                 if name.startswith(prefix) and name[len(prefix):].isdigit())
+            except OSError:
+                continue
+            paths = [os.path.join(directory, f'{prefix}{number}', child) for number in numbers]
+            paths = [path for path in paths if os.path.isdir(path)]
+            if paths:
+                return paths
+        return []
+
+    # ----- 메모리 -----
+
+    def _meminfo(self) -> Dict[bytes, int]:
+        """필요한 /proc/meminfo 필드만 바이트 단위로 파싱"""
+        values = {}
+        for line in self._read(os.path.join(self.proc_root, 'meminfo')).splitlines():
+            key, _, rest = line.partition(b' ')
+            if key in _MEMINFO_FIELDS:
+                values[key] = int(rest.split()[0]) * 1024
+        return values
+
+    def virtual_memory(self) -> svmem:
+        """가상 메모리 사용량 (psutil 5.9의 계산 방식과 동일)"""
+        mems = self._pending_meminfo = self._meminfo()
+        total = mems[b'MemTotal:']
+        free = mems[b'MemFree:']
+        buffers = mems.get(b'Buffers:', 0)
+        cached = mems.get(b'Cached:', 0) + mems.get(b'SReclaimable:', 0)
+
+        used = total - free - cached - buffers
+        if used < 0:
+            used = total - free
+
+        avail = mems.get(b'MemAvailable:', free + buffers + cached)
+        if avail < 0:
+            avail = 0
+        elif avail > total:
+            avail = free
+
+        return svmem(total, avail, _usage_percent(total - avail, total), used, free, buffers, cached)
+
+    def swap_memory(self) -> sswap:
+        """스왑 메모리 사용량 (바로 앞의 virtual_memory()가 파싱한 값이 있으면 한 번 재사용)"""
+        mems = self._pending_meminfo
+        self._pending_meminfo = None
+        if mems is None:
+            mems = self._meminfo()
+        total = mems.get(b'SwapTotal:', 0)
+        free = mems.get(b'SwapFree:', 0)
+        used = total - free
+        return sswap(total, used, free, _usage_percent(used, total))
+
+    # ----- 디스크 -----
+
+    @staticmethod
+    def disk_usage(path: str) -> sdiskusage:
+        """파일 시스템 사용량 (statvfs)"""
+        st = os.statvfs(path)
+        total = st.f_blocks * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        # 일반 사용자 기준 사용률 (df와 동일)
+        return sdiskusage(total, used, free, _usage_percent(used, used + free))
+
+    def _is_storage_device(self, name: str) -> bool:
+        """파티션이 아닌 블록 장치인지 확인 (/sys/block/<name> 존재 여부, 결과 캐시)"""
+        result = self._storage_devices.get(name)
+        if result is None:
+            result = os.path.exists(os.path.join(self.sys_root, 'block', name.replace('/', '!')))
+            self._storage_devices[name] = result
+        return result
+
+    def disk_io_counters(self, perdisk: bool = False):
+        """
+        디스크 I/O 누적 카운터 (/proc/diskstats)
+
+        Args:
+            perdisk: True이면 장치 이름별 딕셔너리, False이면 파티션을 제외한 합계
+        """
+        devices = {}
+        for line in self._read(os.path.join(self.proc_root, 'diskstats')).splitlines():
+            fields = line.split()
+            if len(fields) == 14 or len(fields) >= 18:
+                name = fields[2].decode()
+                (reads, reads_merged, rsectors, rtime, writes, writes_merged,
+                 wsectors, wtime, _, busy_time) = map(int, fields[3:13])
+            elif len(fields) == 7:
+                name = fields[2].decode()
+                reads, rsectors, writes, wsectors = map(int, fields[3:7])
+                rtime = wtime = reads_merged = writes_merged = busy_time = 0
+            else:
+                continue
+            if not perdisk and not self._is_storage_device(name):
+                continue
+            devices[name] = sdiskio(reads, writes, rsectors * DISK_SECTOR_SIZE,
+                                    wsectors * DISK_SECTOR_SIZE, rtime, wtime,
+                                    reads_merged, writes_merged, busy_time)
+
+        if perdisk:
+            return devices
+        if not devices:
+            return None
+        return sdiskio(*[sum(values) for values in zip(*devices.values())])
+
+    # ----- 네트워크 -----
+
+    def net_io_counters(self, pernic: bool = False):
+        """
+        네트워크 I/O 누적 카운터 (/proc/net/dev)
+
+        Args:
+            pernic: True이면 인터페이스별 딕셔너리, False이면 전체 합계
+        """
+        interfaces = {}
+        for line in self._read(os.path.join(self.proc_root, 'net', 'dev')).splitlines()[2:]:
+            colon = line.rfind(b':')
+            if colon <= 0:
+                continue
+            fields = line[colon + 1:].split()
+            interfaces[line[:colon].strip().decode()] = snetio(
+                int(fields[8]), int(fields[0]), int(fields[9]), int(fields[1]),
+                int(fields[2]), int(fields[10]), int(fields[3]), int(fields[11]))
+
+        if pernic:
+            return interfaces
+        return snetio(*[sum(values) for values in zip(*interfaces.values())]) if interfaces \
+            else snetio(0, 0, 0, 0, 0, 0, 0, 0)
+
+
+if __name__ == "__main__":
+    # psutil과 결과 및 수집 시간 비교
+    import time
+    import psutil
+
+    backend = ProcfsBackend()
+    checks = [
+        ('virtual_memory', lambda m: m.virtual_memory()),
+        ('swap_memory', lambda m: m.swap_memory()),
+        ('disk_usage', lambda m: m.disk_usage('/')),
+        ('disk_io_counters', lambda m: m.disk_io_counters()),
+        ('net_io_counters', lambda m: m.net_io_counters()),
+        ('cpu_freq', lambda m: m.cpu_freq()),
+        ('cpu_count', lambda m: m.cpu_count()),
+    ]
+
+    # 한 페이지보다 긴 seq_file이 잘리지 않는지 확인 (일반 read와 줄 수 비교)
+    print("PreadFile 전체 읽기 확인...")
+    for path in ('/proc/self/maps', '/proc/self/smaps', '/proc/net/dev', '/proc/diskstats',
+                 '/proc/cpuinfo', '/proc/stat'):
+        if not os.path.exists(path):
+            continue
+        handle = PreadFile(path)
+        pread_lines = handle.read().count(b'\n')
+        handle.close()
+        with open(path, 'rb') as f:
+            read_lines = f.read().count(b'\n')
+        # /proc/self/* 는 읽는 사이 매핑이 조금 바뀔 수 있으므로 줄 수 차이를 약간 허용
+        tolerance = 5 if path.startswith('/proc/self/') else 0
+        status = 'OK' if abs(pread_lines - read_lines) <= tolerance else 'MISMATCH'
+        print(f"  {path}: pread {pread_lines} lines / read {read_lines} lines [{status}]")
+
+    print("\nprocfs 백엔드와 psutil 비교...")
+    for name, func in checks:
+        timings = {}
+        for label, module in (('psutil', psutil), ('procfs', backend)):
+            start = time.perf_counter()
+            for _ in range(1000):
+                result = func(module)
+            timings[label] = (time.perf_counter() - start) * 1000
+        print(f"\n{name}")
+        print(f"  psutil: {func(psutil)}")
+        print(f"  procfs: {func(backend)}")
+        print(f"  1000회 수집 시간: psutil {timings['psutil']:.1f} ms / procfs {timings['procfs']:.1f} ms")
+
+    backend.close()
@@ -3,65 +3,195 @@
 CPU, 메모리, 디스크, 네트워크, GPU 온도 등을 수집합니다.
 """
 
+import importlib.util
+import os
 import psutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 try:
-    import GPUtil
-    GPU_AVAILABLE = True
+    from .history_store import DEFAULT_CAPACITY, HistoryStore, HistoryView, column_name
+    from .metric_stats import MetricStats, REPORTED_METRICS
+    from .procfs_backend import ProcfsBackend
+    from .temperature_sensors import TemperatureSensors
+    from .gpu_monitor import NvidiaSmiStream
+    from .process_sampler import ProcessSampler
+    from .collector_registry import (COST_CHEAP, COST_EXPENSIVE, DEFAULT_EXPENSIVE_INTERVAL, CollectorRegistry,
+                                     CollectorSpec)
+    from .sampling_session import SamplingSession
 except ImportError:
-    GPU_AVAILABLE = False
+    from history_store import DEFAULT_CAPACITY, HistoryStore, HistoryView, column_name
+    from metric_stats import MetricStats, REPORTED_METRICS
+    from procfs_backend import ProcfsBackend
+    from temperature_sensors import TemperatureSensors
+    from gpu_monitor import NvidiaSmiStream
+    from process_sampler import ProcessSampler
+    from collector_registry import (COST_CHEAP, COST_EXPENSIVE, DEFAULT_EXPENSIVE_INTERVAL, CollectorRegistry,
+                                    CollectorSpec)
+    from sampling_session import SamplingSession
+
+# GPUtil은 설치 여부만 확인하고 처음 GPU를 조회할 때 불러옴 (시작 시간 단축)
+GPU_AVAILABLE = importlib.util.find_spec('GPUtil') is not None
+
+
+@lru_cache(maxsize=None)
+def _gputil():
+    """GPUtil 모듈 (불러올 수 없으면 None)"""
+    try:
+        import GPUtil
+    except ImportError:
+        return None
+    return GPUtil
+
+# CPU 사용률 측정 방식
+CPU_SAMPLING_BLOCKING = 'blocking'  # 1초 동안 대기하며 측정
+CPU_SAMPLING_DELTA = 'delta'        # 이전 샘플과의 CPU 시간 차이로 계산 (비차단)
+CPU_SAMPLING_MODES = (CPU_SAMPLING_BLOCKING, CPU_SAMPLING_DELTA)
+
+# 수집 백엔드
+BACKEND_PSUTIL = 'psutil'  # psutil 함수 호출
+BACKEND_PROCFS = 'procfs'  # /proc, /sys 파일을 직접 읽음 (Linux 전용)
+BACKENDS = (BACKEND_PSUTIL, BACKEND_PROCFS)
+
+# GPU 수집 방식
+GPU_BACKEND_GPUTIL = 'gputil'          # 매 수집마다 GPUtil.getGPUs() (nvidia-smi 실행)
+GPU_BACKEND_NVIDIA_SMI = 'nvidia-smi'  # 루프 모드 nvidia-smi 프로세스를 상주시켜 읽음
+GPU_BACKENDS = (GPU_BACKEND_GPUTIL, GPU_BACKEND_NVIDIA_SMI)
+
+# 네트워크 카운터 최댓값 (32비트 카운터를 쓰는 드라이버의 wraparound 처리용)
+COUNTER_32BIT_MAX = 2 ** 32
+
+# 장치별 디스크 I/O 집계에서 제외할 가상 장치 접두어
+VIRTUAL_DISK_PREFIXES = ('loop', 'ram')
+
+# 파일시스템 용량 수집 간격 기본값 (초, 용량은 거의 변하지 않음)
+DISK_USAGE_INTERVAL = 60.0
 
 
 class ResourceCollector:
     """시스템 리소스를 수집하는 클래스"""
 
-    def __init__(self):
-        """초기화"""
-        self.data_history: List[Dict] = []
-        self.network_last = psutil.net_io_counters()
-        self.last_time = time.time()
+    def __init__(self, cpu_sampling: str = CPU_SAMPLING_BLOCKING, parallel: bool = False,
+                 history_capacity: int = DEFAULT_CAPACITY, backend: str = BACKEND_PSUTIL,
+                 proc_root: str = '/proc', sys_root: str = '/sys',
+                 gpu_backend: str = GPU_BACKEND_GPUTIL, nvidia_smi_command: str = 'nvidia-smi',
+                 gpu_query_interval_ms: int = 1000, process_top_n: int = 0,
+                 expensive_interval: float = DEFAULT_EXPENSIVE_INTERVAL,
+                 collector_intervals: Optional[Dict[str, float]] = None,
+                 stats_paths: Optional[Iterable[str]] = REPORTED_METRICS):
+        """
+        초기화
+
+        Args:
+            cpu_sampling: CPU 사용률 측정 방식
+                'blocking' - interval=1로 1초 동안 대기하며 측정
+                'delta' - 이전 샘플의 CPU 시간과의 차이로 계산 (대기 없음)
+            parallel: True이면 각 수집기를 스레드 풀에서 동시에 실행
+            history_capacity: 보관할 최대 샘플 수 (초과 시 오래된 샘플부터 제거)
+            backend: 수집 백엔드 ('psutil' 또는 'procfs')
+            proc_root: procfs 백엔드가 읽을 procfs 경로
+            sys_root: procfs 백엔드와 온도 센서가 읽을 sysfs 경로
+            gpu_backend: GPU 수집 방식 ('gputil' 또는 'nvidia-smi')
+            nvidia_smi_command: 'nvidia-smi' 방식에서 실행할 nvidia-smi 경로
+            gpu_query_interval_ms: 'nvidia-smi' 방식의 측정 간격 (밀리초)
+            process_top_n: CPU, 메모리, I/O별로 수집할 상위 프로세스 개수 (0이면 수집 안 함)
+            expensive_interval: 비싼 수집기(GPUtil, 프로세스)의 수집 간격 (초, 0이면 매번)
+            collector_intervals: 수집기 이름별 수집 간격 지정 (초, 예: {'disk_usage': 30})
+            stats_paths: 수집 중 누적 통계를 계산할 지표 이름 목록 (None이면 모든 숫자 지표,
+                         기본값은 리포트와 요약에서 사용하는 지표)
+        """
+        if cpu_sampling not in CPU_SAMPLING_MODES:
+            raise ValueError(f"지원하지 않는 CPU 측정 방식입니다: {cpu_sampling}")
+        if backend not in BACKENDS:
+            raise ValueError(f"지원하지 않는 수집 백엔드입니다: {backend}")
+        if gpu_backend not in GPU_BACKENDS:
+            raise ValueError(f"지원하지 않는 GPU 수집 방식입니다: {gpu_backend}")
+
+        # procfs 백엔드는 psutil과 같은 이름의 함수를 제공하므로 그대로 교체해서 사용
+        self.backend = ProcfsBackend(proc_root, sys_root) if backend == BACKEND_PROCFS else psutil
+
+        self.cpu_sampling = cpu_sampling
+        self.parallel = parallel
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.last_collection_time: Dict[str, float] = {}
+        self.history = HistoryStore(history_capacity)
+        self.stats = MetricStats(paths=stats_paths)
+        self.sys_root = sys_root
+        self.network_last = self._read_net_io_counters()
+        self.last_time = time.monotonic()
+        self._disk_devices: Dict[str, bool] = {}
+        self._stacked_devices: Dict[str, bool] = {}
+        self.disk_io_last = self._read_disk_io_counters()
+        self.disk_last_time = time.monotonic()
+        self.cpu_times_last = self.backend.cpu_times()
+        self.temperature_sensors = TemperatureSensors(sys_root)
+        self.gpu_stream: Optional[NvidiaSmiStream] = None
+        if gpu_backend == GPU_BACKEND_NVIDIA_SMI:
+            self.gpu_stream = NvidiaSmiStream(nvidia_smi_command, gpu_query_interval_ms)
+        self.process_sampler = ProcessSampler(process_top_n) if process_top_n > 0 else None
+        self.registry = CollectorRegistry(expensive_interval)
+        self._register_default_collectors(collector_intervals or {})
+
+    @staticmethod
+    def _calculate_cpu_percent(times_before, times_after) -> float:
+        """두 시점의 CPU 시간으로 사용률 계산 (psutil.cpu_percent와 동일한 방식)"""
+        deltas = {field: max(0.0, getattr(times_after, field) - getattr(times_before, field))
+                  for field in times_after._fields}
+
+        # Linux의 guest 시간은 user/nice에 이미 포함되어 있으므로 제외
+        total = sum(deltas.values()) - deltas.get('guest', 0) - deltas.get('guest_nice', 0)
+        # iowait는 idle에 포함되지 않으므로 함께 유휴 시간으로 처리
+        busy = total - deltas['idle'] - deltas.get('iowait', 0)
+
+        if total <= 0:
+            return 0.0
+        return round(min(100.0, max(0.0, busy / total * 100)), 1)
+
+    def _cpu_percent_delta(self) -> float:
+        """이전 샘플 이후의 CPU 사용률 계산 (비차단)"""
+        cpu_times = self.backend.cpu_times()
+        cpu_percent = self._calculate_cpu_percent(self.cpu_times_last, cpu_times)
+        self.cpu_times_last = cpu_times
+        return cpu_percent
 
     def collect_cpu_info(self) -> Dict:
         """CPU 정보 수집"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1, percpu=False)
-            cpu_count = psutil.cpu_count()
-            cpu_freq = psutil.cpu_freq()
+            if self.cpu_sampling == CPU_SAMPLING_DELTA:
+                cpu_percent = self._cpu_percent_delta()
+            else:
+                # psutil.cpu_percent(interval=1)과 같이 1초 간격의 CPU 시간 차이로 계산
+                cpu_times = self.backend.cpu_times()
+                time.sleep(1)
+                cpu_percent = self._calculate_cpu_percent(cpu_times, self.backend.cpu_times())
+            cpu_count = self.backend.cpu_count()
+            cpu_freq = self.backend.cpu_freq()
 
-            # CPU 온도 수집 (Linux의 경우)
-            cpu_temp = None
-            try:
-                temps = psutil.sensors_temperatures()
-                if 'coretemp' in temps:
-                    cpu_temp = temps['coretemp'][0].current
-                elif 'cpu_thermal' in temps:
-                    cpu_temp = temps['cpu_thermal'][0].current
-                elif temps:
-                    # 첫 번째 사용 가능한 온도 센서 사용
-                    first_sensor = list(temps.keys())[0]
-                    cpu_temp = temps[first_sensor][0].current
-            except (AttributeError, KeyError, IndexError):
-                cpu_temp = None
+            # CPU 온도 수집 (센서 탐색 결과를 캐시하고 선택된 센서 파일만 읽음)
+            temperatures = self.temperature_sensors.read()
 
             return {
                 'percent': cpu_percent,
                 'count': cpu_count,
                 'freq_current': cpu_freq.current if cpu_freq else None,
                 'freq_max': cpu_freq.max if cpu_freq else None,
-                'temperature': cpu_temp
+                'temperature': temperatures['temperature'],
+                'temperature_package': temperatures['temperature_package'],
+                'temperature_cores': temperatures['temperature_cores']
             }
         except Exception as e:
             print(f"CPU 정보 수집 오류: {e}")
-            return {'percent': 0, 'count': 0, 'freq_current': None, 'freq_max': None, 'temperature': None}
+            return {'percent': 0, 'count': 0, 'freq_current': None, 'freq_max': None, 'temperature': None,
+                    'temperature_package': None, 'temperature_cores': []}
 
     def collect_memory_info(self) -> Dict:
         """메모리 정보 수집"""
         try:
-            mem = psutil.virtual_memory()
-            swap = psutil.swap_memory()
+            mem = self.backend.virtual_memory()
+            swap = self.backend.swap_memory()
 
             return {
                 'total': mem.total,
@@ -77,66 +207,220 @@ class ResourceCollector:
             return {'total': 0, 'available': 0, 'used': 0, 'percent': 0,
                     'swap_total': 0, 'swap_used': 0, 'swap_percent': 0}
 
-    def collect_disk_info(self) -> Dict:
-        """디스크 정보 수집"""
+    def _is_disk_device(self, name: str) -> bool:
+        """파티션이나 loop 장치가 아닌 디스크 장치인지 확인 (결과 캐시)"""
+        result = self._disk_devices.get(name)
+        if result is None:
+            block_dir = os.path.join(self.sys_root, 'block')
+            if name.startswith(VIRTUAL_DISK_PREFIXES):
+                result = False
+            elif os.path.isdir(block_dir):
+                result = os.path.exists(os.path.join(block_dir, name.replace('/', '!')))
+            else:
+                # /sys/block이 없는 플랫폼에서는 psutil이 반환한 장치를 모두 사용
+                result = True
+            self._disk_devices[name] = result
+        return result
+
+    def _is_stacked_device(self, name: str) -> bool:
+        """다른 디스크 위에 만든 장치(dm-*, md* 등, slaves가 있는 장치)인지 확인 (결과 캐시)"""
+        result = self._stacked_devices.get(name)
+        if result is None:
+            slaves_dir = os.path.join(self.sys_root, 'block', name.replace('/', '!'), 'slaves')
+            try:
+                result = bool(os.listdir(slaves_dir))
+            except OSError:
+                result = False
+            self._stacked_devices[name] = result
+        return result
+
+    def _read_disk_io_counters(self) -> Dict:
+        """디스크 장치별 I/O 누적 카운터"""
         try:
-            disk = psutil.disk_usage('/')
-            disk_io = psutil.disk_io_counters()
+            counters = self.backend.disk_io_counters(perdisk=True) or {}
+        except Exception:
+            return {}
+        return {name: io for name, io in counters.items() if self._is_disk_device(name)}
+
+    def collect_disk_io_rates(self, counters: Optional[Dict] = None) -> Dict:
+        """
+        디스크 장치별 I/O 속도 계산 (이전 수집 대비 /proc/diskstats 차이)
+
+        Args:
+            counters: 이미 읽은 장치별 누적 카운터 (None이면 새로 읽음)
 
+        Returns:
+            장치 이름별 처리량(bytes/s), IOPS, 평균 대기 시간(ms), 사용률(%)
+        """
+        current_time = time.monotonic()
+        if counters is None:
+            counters = self._read_disk_io_counters()
+        time_delta = current_time - self.disk_last_time
+
+        devices = {}
+        for name, io in counters.items():
+            last = self.disk_io_last.get(name)
+            if last is None or time_delta <= 0:
+                # 새로 나타난 장치는 다음 수집부터 속도 계산
+                devices[name] = {'read_bytes_per_sec': 0.0, 'write_bytes_per_sec': 0.0,
+                                 'read_iops': 0.0, 'write_iops': 0.0,
+                                 'await_ms': 0.0, 'util_percent': 0.0}
+                continue
+
+            # 카운터가 초기화된 경우를 대비해 음수 차이는 0으로 처리
+            reads = max(0, io.read_count - last.read_count)
+            writes = max(0, io.write_count - last.write_count)
+            io_time = max(0, io.read_time - last.read_time) + max(0, io.write_time - last.write_time)
+            busy_time = max(0, getattr(io, 'busy_time', 0) - getattr(last, 'busy_time', 0))
+
+            devices[name] = {
+                'read_bytes_per_sec': max(0, io.read_bytes - last.read_bytes) / time_delta,
+                'write_bytes_per_sec': max(0, io.write_bytes - last.write_bytes) / time_delta,
+                'read_iops': reads / time_delta,
+                'write_iops': writes / time_delta,
+                'await_ms': io_time / (reads + writes) if reads + writes > 0 else 0.0,
+                'util_percent': min(100.0, busy_time / (time_delta * 1000) * 100)
+            }
+
+        self.disk_io_last = counters
+        self.disk_last_time = current_time
+        return devices
+
+    def collect_disk_usage(self) -> Dict:
+        """파일시스템 용량 수집"""
+        try:
+            disk = self.backend.disk_usage('/')
             return {
                 'total': disk.total,
                 'used': disk.used,
                 'free': disk.free,
-                'percent': disk.percent,
-                'read_bytes': disk_io.read_bytes if disk_io else 0,
-                'write_bytes': disk_io.write_bytes if disk_io else 0
+                'percent': disk.percent
             }
         except Exception as e:
-            print(f"디스크 정보 수집 오류: {e}")
-            return {'total': 0, 'used': 0, 'free': 0, 'percent': 0,
-                    'read_bytes': 0, 'write_bytes': 0}
+            print(f"디스크 용량 수집 오류: {e}")
+            return {'total': 0, 'used': 0, 'free': 0, 'percent': 0}
+
+    def collect_disk_io(self) -> Dict:
+        """
+        디스크 I/O 수집 (장치별 I/O 속도 포함)
+
+        장치별 카운터를 한 번만 읽어 합계와 장치별 속도를 모두 계산합니다.
+        dm-*, md* 처럼 다른 디스크 위에 만든 장치는 아래 디스크와 중복되므로
+        장치별 값에만 포함하고 합계에서는 제외합니다.
+        """
+        try:
+            counters = self._read_disk_io_counters()
+            devices = self.collect_disk_io_rates(counters)
+            physical = [name for name in counters if not self._is_stacked_device(name)]
+
+            return {
+                'read_bytes': sum(counters[name].read_bytes for name in physical),
+                'write_bytes': sum(counters[name].write_bytes for name in physical),
+                'read_bytes_per_sec': sum(devices[name]['read_bytes_per_sec'] for name in physical),
+                'write_bytes_per_sec': sum(devices[name]['write_bytes_per_sec'] for name in physical),
+                'read_iops': sum(devices[name]['read_iops'] for name in physical),
+                'write_iops': sum(devices[name]['write_iops'] for name in physical),
+                'devices': devices
+            }
+        except Exception as e:
+            print(f"디스크 I/O 수집 오류: {e}")
+            return {'read_bytes': 0, 'write_bytes': 0,
+                    'read_bytes_per_sec': 0, 'write_bytes_per_sec': 0,
+                    'read_iops': 0, 'write_iops': 0, 'devices': {}}
+
+    def collect_disk_info(self) -> Dict:
+        """디스크 정보 수집 (용량과 장치별 I/O 속도)"""
+        return {**self.collect_disk_usage(), **self.collect_disk_io()}
+
+    def _read_net_io_counters(self) -> Dict:
+        """네트워크 인터페이스별 I/O 누적 카운터"""
+        try:
+            return self.backend.net_io_counters(pernic=True) or {}
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _counter_delta(current: int, last: int) -> int:
+        """
+        누적 카운터 차이 계산 (wraparound 처리)
+
+        카운터 폭은 플랫폼이 아니라 값으로 판단합니다. 이전 값이 32비트 범위이면
+        32비트 카운터가 한 바퀴 돈 것으로 보고, 64비트 범위의 카운터가 줄어든 경우는
+        인터페이스 재생성, 핫플러그, 드라이버 재시작 등으로 초기화된 것으로 보아 0을
+        반환합니다. (다음 수집은 현재 값을 기준으로 계산)
+        """
+        if current >= last:
+            return current - last
+        if last < COUNTER_32BIT_MAX:
+            return current + COUNTER_32BIT_MAX - last
+        return 0
 
     def collect_network_info(self) -> Dict:
-        """네트워크 정보 수집 (속도 계산 포함)"""
+        """네트워크 정보 수집 (인터페이스별 속도 계산 포함)"""
         try:
-            current_time = time.time()
-            network_current = psutil.net_io_counters()
+            current_time = time.monotonic()
+            counters = self._read_net_io_counters()
 
-            # 시간 간격 계산
+            # 시간 간격 계산 (시스템 시각 변경에 영향받지 않는 monotonic 시계 사용)
             time_delta = current_time - self.last_time
 
-            # 전송량 차이 계산
-            bytes_sent_diff = network_current.bytes_sent - self.network_last.bytes_sent
-            bytes_recv_diff = network_current.bytes_recv - self.network_last.bytes_recv
+            interfaces = {}
+            for name, io in counters.items():
+                last = self.network_last.get(name)
+                if last is None or time_delta <= 0:
+                    # 새로 연결된 인터페이스는 다음 수집부터 속도 계산
+                    interfaces[name] = {'upload_speed_mbps': 0.0, 'download_speed_mbps': 0.0,
+                                        'packets_sent_per_sec': 0.0, 'packets_recv_per_sec': 0.0,
+                                        'errin_per_sec': 0.0, 'errout_per_sec': 0.0,
+                                        'dropin_per_sec': 0.0, 'dropout_per_sec': 0.0}
+                    continue
+
+                rates = {field: self._counter_delta(getattr(io, field), getattr(last, field)) / time_delta
+                         for field in io._fields}
 
-            # 초당 속도 계산 (Mbps)
-            upload_speed = (bytes_sent_diff / time_delta) * 8 / 1_000_000 if time_delta > 0 else 0
-            download_speed = (bytes_recv_diff / time_delta) * 8 / 1_000_000 if time_delta > 0 else 0
+                # 초당 속도 계산 (Mbps)
+                interfaces[name] = {
+                    'upload_speed_mbps': rates['bytes_sent'] * 8 / 1_000_000,
+                    'download_speed_mbps': rates['bytes_recv'] * 8 / 1_000_000,
+                    'packets_sent_per_sec': rates['packets_sent'],
+                    'packets_recv_per_sec': rates['packets_recv'],
+                    'errin_per_sec': rates['errin'],
+                    'errout_per_sec': rates['errout'],
+                    'dropin_per_sec': rates['dropin'],
+                    'dropout_per_sec': rates['dropout']
+                }
 
-            # 다음 계산을 위해 저장
-            self.network_last = network_current
+            # 다음 계산을 위해 저장 (사라진 인터페이스는 자동으로 제외됨)
+            self.network_last = counters
             self.last_time = current_time
 
             return {
-                'bytes_sent': network_current.bytes_sent,
-                'bytes_recv': network_current.bytes_recv,
-                'packets_sent': network_current.packets_sent,
-                'packets_recv': network_current.packets_recv,
-                'upload_speed_mbps': upload_speed,
-                'download_speed_mbps': download_speed
+                'bytes_sent': sum(io.bytes_sent for io in counters.values()),
+                'bytes_recv': sum(io.bytes_recv for io in counters.values()),
+                'packets_sent': sum(io.packets_sent for io in counters.values()),
+                'packets_recv': sum(io.packets_recv for io in counters.values()),
+                'upload_speed_mbps': sum(nic['upload_speed_mbps'] for nic in interfaces.values()),
+                'download_speed_mbps': sum(nic['download_speed_mbps'] for nic in interfaces.values()),
+                'interfaces': interfaces
             }
         except Exception as e:
             print(f"네트워크 정보 수집 오류: {e}")
             return {'bytes_sent': 0, 'bytes_recv': 0, 'packets_sent': 0,
-                    'packets_recv': 0, 'upload_speed_mbps': 0, 'download_speed_mbps': 0}
+                    'packets_recv': 0, 'upload_speed_mbps': 0, 'download_speed_mbps': 0,
+                    'interfaces': {}}
 
     def collect_gpu_info(self) -> Optional[Dict]:
         """GPU 정보 수집"""
-        if not GPU_AVAILABLE:
+        if self.gpu_stream is not None:
+            gpu_data = self.gpu_stream.read()
+            return {'gpus': gpu_data} if gpu_data else None
+
+        gputil = _gputil() if GPU_AVAILABLE else None
+        if gputil is None:
             return None
 
         try:
-            gpus = GPUtil.getGPUs()
+            gpus = gputil.getGPUs()
             if not gpus:
                 return None
 
@@ -157,29 +441,172 @@ class ResourceCollector:
             print(f"GPU 정보 수집 오류: {e}")
             return None
 
+    def collect_process_info(self) -> Optional[Dict]:
+        """CPU, 메모리, I/O 사용량 상위 프로세스 수집"""
+        if self.process_sampler is None:
+            return None
+
+        try:
+            return self.process_sampler.sample()
+        except Exception as e:
+            print(f"프로세스 정보 수집 오류: {e}")
+            return None
+
+    def _register_default_collectors(self, intervals: Dict[str, float]):
+        """기본 수집기 등록 (디스크는 용량과 I/O로 나누어 'disk' 키에 병합)"""
+        # nvidia-smi 상주 방식은 최신 값만 읽으므로 매번 수집해도 비용이 작음
+        gpu_cost = COST_CHEAP if self.gpu_stream is not None else COST_EXPENSIVE
+        collectors = [
+            ('cpu', self.collect_cpu_info, 'cpu', COST_CHEAP, None),
+            ('memory', self.collect_memory_info, 'memory', COST_CHEAP, None),
+            ('disk_usage', self.collect_disk_usage, 'disk', COST_EXPENSIVE, DISK_USAGE_INTERVAL),
+            ('disk_io', self.collect_disk_io, 'disk', COST_CHEAP, None),
+            ('network', self.collect_network_info, 'network', COST_CHEAP, None),
+            ('gpu', self.collect_gpu_info, 'gpu', gpu_cost, None),
+        ]
+        if self.process_sampler is not None:
+            collectors.append(('processes', self.collect_process_info, 'processes', COST_EXPENSIVE, None))
+
+        for name, func, key, cost, interval in collectors:
+            self.registry.register(name, func, key=key, interval=intervals.get(name, interval), cost=cost)
+
+    def register_collector(self, name: str, func: Callable, key: Optional[str] = None,
+                           interval: Optional[float] = None, cost: str = COST_CHEAP):
+        """
+        사용자 수집기 등록
+
+        Args:
+            name: 수집기 이름 (기본 수집기와 같은 이름이면 교체)
+            func: 인자 없이 호출되어 결과를 반환하는 함수
+            key: 결과를 저장할 데이터 키 (기본값: name)
+            interval: 수집 간격 (초, None이면 비용 등급에 따라 결정)
+            cost: 비용 등급 ('cheap' 또는 'expensive')
+        """
+        self.registry.register(name, func, key=key, interval=interval, cost=cost)
+
+    @staticmethod
+    def _timed_call(func: Callable) -> Tuple[object, float]:
+        """수집 함수를 실행하고 (결과, 소요 시간(초))를 반환"""
+        start = time.perf_counter()
+        result = func()
+        return result, time.perf_counter() - start
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """병렬 수집용 스레드 풀 반환 (최초 호출 시 생성)"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(self.registry),
+                                                thread_name_prefix='collector')
+        return self._executor
+
+    def _result_prefixes(self, spec: CollectorSpec,
+                         exclude: Set[Tuple[str, ...]] = frozenset()) -> List[Tuple[str, ...]]:
+        """수집기 결과가 차지하는 데이터 경로 접두어 (여러 수집기가 같은 키를 쓰면 하위 키 단위)"""
+        if sum(1 for other in self.registry.specs() if other.key == spec.key) == 1:
+            return [(spec.key,)]
+        if isinstance(spec.last_result, dict):
+            return [(spec.key, str(sub)) for sub in spec.last_result if (spec.key, str(sub)) not in exclude]
+        return []
+
+    def _stale_prefixes(self, due: List[CollectorSpec]) -> Set[Tuple[str, ...]]:
+        """이번 수집에서 실행되지 않아 마지막 결과를 다시 사용하는 항목의 경로 접두어"""
+        ran = {spec.name for spec in due}
+        fresh = set()
+        for spec in due:
+            if isinstance(spec.last_result, dict):
+                fresh.update((spec.key, str(sub)) for sub in spec.last_result)
+        stale = set()
+        for spec in self.registry.specs():
+            if spec.name not in ran and spec.last_result is not None:
+                stale.update(self._result_prefixes(spec, fresh))
+        return stale
+
+    def interval_sources(self) -> Dict[str, List[str]]:
+        """
+        매번 실행되지 않는 수집기별 결과 경로
+
+        히스토리에는 실행되지 않은 수집기의 마지막 결과가 반복 기록되므로, 런 파일에서
+        통계를 다시 계산할 때 collection_time.<수집기>가 있는 샘플만 사용하도록 저장합니다.
+        """
+        return {spec.name: [column_name(prefix) for prefix in self._result_prefixes(spec)]
+                for spec in self.registry.specs() if self.registry.interval_of(spec) > 0}
+
     def collect_all(self) -> Dict:
-        """모든 시스템 리소스 정보 수집"""
+        """
+        모든 시스템 리소스 정보 수집
+
+        수집 간격이 된 수집기만 실행하고, 나머지 항목은 각 수집기의 마지막 결과를
+        사용합니다. collection_time에는 이번에 실행된 수집기만 기록됩니다.
+        히스토리에는 마지막 결과를 포함한 전체 항목을 기록하지만, 누적 통계에는
+        이번에 실제로 수집한 항목만 반영하여 반복된 값이 통계를 치우치지 않게 합니다.
+        parallel 모드에서는 각 수집기를 동시에 실행하므로 한 번의 수집 시간이
+        가장 느린 수집기의 시간으로 제한됩니다. 모든 항목은 수집 시작 시점의
+        동일한 타임스탬프를 가집니다.
+        """
         timestamp = datetime.now()
+        now = time.monotonic()
+        start = time.perf_counter()
+        due = self.registry.due(now)
+
+        if self.parallel:
+            executor = self._get_executor()
+            futures = [(spec, executor.submit(self._timed_call, spec.func)) for spec in due]
+            results = [(spec, future.result()) for spec, future in futures]
+        else:
+            results = [(spec, self._timed_call(spec.func)) for spec in due]
+
+        collection_time = {}
+        for spec, (result, elapsed) in results:
+            self.registry.record(spec, result, now)
+            collection_time[spec.name] = elapsed
+        collection_time['total'] = time.perf_counter() - start
+
+        data = {'timestamp': timestamp}
+        data.update(self.registry.merged_results())
 
-        data = {
-            'timestamp': timestamp,
-            'cpu': self.collect_cpu_info(),
-            'memory': self.collect_memory_info(),
-            'disk': self.collect_disk_info(),
-            'network': self.collect_network_info(),
-            'gpu': self.collect_gpu_info()
-        }
+        self.last_collection_time = collection_time
+        data['collection_time'] = collection_time
 
-        self.data_history.append(data)
+        fields = self.history.append(data)
+        stale = self._stale_prefixes(due)
+        if stale:
+            fields = [field for field in fields if field[0][:1] not in stale and field[0][:2] not in stale]
+        self.stats.update(timestamp, fields)
         return data
 
-    def get_history(self) -> List[Dict]:
-        """수집된 데이터 히스토리 반환"""
-        return self.data_history
+    def session(self, interval: float = 1.0, duration: Optional[float] = None) -> SamplingSession:
+        """
+        백그라운드 샘플링 세션 생성 (with 블록 동안 별도 스레드에서 수집)
+
+        Args:
+            interval: 수집 간격 (초)
+            duration: 최대 수집 시간 (초, None이면 with 블록이 끝날 때까지)
+        """
+        return SamplingSession(self, interval, duration)
+
+    def close(self):
+        """병렬 수집용 스레드 풀, 열어 둔 procfs/센서 파일, nvidia-smi 프로세스 정리"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if isinstance(self.backend, ProcfsBackend):
+            self.backend.close()
+        self.temperature_sensors.close()
+        if self.gpu_stream is not None:
+            self.gpu_stream.close()
+
+    @property
+    def data_history(self) -> HistoryView:
+        """수집된 데이터 히스토리 (리스트 호환 뷰)"""
+        return self.history.view()
+
+    def get_history(self) -> HistoryView:
+        """수집된 데이터 히스토리 반환 (딕셔너리 리스트와 같은 방식으로 읽을 수 있는 뷰)"""
+        return self.history.view()
 
     def clear_history(self):
-        """히스토리 초기화"""
-        self.data_history = []
+        """히스토리 및 통계 초기화"""
+        self.history.clear()
+        self.stats.clear()
 
 
 if __name__ == "__main__":
@@ -197,5 +624,6 @@ if __name__ == "__main__":
         print(f"네트워크 다운로드: {data['network']['download_speed_mbps']:.2f} Mbps")
         if data['gpu']:
             for gpu in data['gpu']['gpus']:
-                print(f"GPU {gpu['id']} ({gpu['name']}): {gpu['load']:.1f}%, 온도: {gpu['temperature']}°C")
+                load = f"{gpu['load']:.1f}%" if gpu['load'] is not None else 'N/A'
+                print(f"GPU {gpu['id']} ({gpu['name']}): {load}, 온도: {gpu['temperature']}°C")
         time.sleep(2)
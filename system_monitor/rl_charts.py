@@ -0,0 +1,271 @@
+"""
+reportlab 차트 모듈
+matplotlib 없이 reportlab.graphics로 리포트용 차트를 그립니다.
+"""
+
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from reportlab.graphics.charts.legends import Legend
+from reportlab.graphics.charts.lineplots import LinePlot
+from reportlab.graphics.shapes import Drawing, Group, String
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+
+try:
+    from .metric_series import MetricSeries
+    from .downsampling import downsample
+except ImportError:
+    from metric_series import MetricSeries
+    from downsampling import downsample
+
+# 선마다 그릴 최대 점 개수 (차트 너비 6인치 = 432pt에 약 1점)
+DEFAULT_CHART_POINTS = 450
+
+CHART_WIDTH = 6 * inch
+
+COLORS = [colors.blue, colors.red, colors.green, colors.orange, colors.purple]
+
+# 패널 여백 (pt)
+MARGIN_LEFT = 45
+MARGIN_RIGHT = 95
+MARGIN_BOTTOM = 28
+MARGIN_TOP = 20
+
+# 선 하나: (범례 이름, 색, 점선 여부, y 값 배열)
+Line = Tuple[str, colors.Color, bool, np.ndarray]
+
+
+def _segments(x: np.ndarray, y: np.ndarray) -> List[List[Tuple[float, float]]]:
+    """NaN에서 끊어진 (x, y) 점 목록들 (값이 없는 구간은 선을 잇지 않음)"""
+    finite = np.isfinite(y)
+    if not finite.any():
+        return []
+    breaks = np.flatnonzero(np.diff(finite.astype(np.int8))) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(y)]))
+    return [list(zip(x[start:end].tolist(), y[start:end].tolist()))
+            for start, end in zip(starts, ends) if finite[start]]
+
+
+def _message(drawing: Drawing, x: float, y: float, width: float, height: float, title: str, message: str):
+    """데이터가 없는 패널"""
+    drawing.add(String(x + width / 2, y + height - 14, title, fontName='Helvetica-Bold',
+                       fontSize=11, textAnchor='middle'))
+    drawing.add(String(x + width / 2, y + height / 2, message, fontName='Helvetica',
+                       fontSize=10, textAnchor='middle', fillColor=colors.grey))
+
+
+def _panel(drawing: Drawing, y: float, height: float, series: MetricSeries, title: str, y_label: str,
+           lines: Sequence[Line], max_points: int, y_max: Optional[float] = None):
+    """
+    선 그래프 패널 하나를 그림
+
+    Args:
+        drawing: 그릴 Drawing
+        y: 패널 아래쪽 위치 (pt)
+        height: 패널 높이 (pt)
+        series: 시계열 (x축 시각)
+        title: 패널 제목
+        y_label: y축 이름
+        lines: 그릴 선 목록
+        max_points: 선마다 남길 최대 점 개수 (LTTB 다운샘플링)
+        y_max: y축 최댓값 (None이면 자동)
+    """
+    timestamps = series.timestamps
+    width = drawing.width
+    plot_width = width - MARGIN_LEFT - MARGIN_RIGHT
+    plot_height = height - MARGIN_BOTTOM - MARGIN_TOP
+
+    seconds = (timestamps - timestamps[0]) / np.timedelta64(1, 's') if len(timestamps) else timestamps
+    data = []
+    styles = []
+    pairs = []
+    for label, color, dashed, values in lines:
+        x, values = downsample(seconds, values, max_points)
+        segments = _segments(x, values)
+        if not segments:
+            continue
+        data.extend(segments)
+        styles.extend([(color, dashed)] * len(segments))
+        pairs.append((color, label))
+
+    if not data:
+        _message(drawing, 0, y, width, height, title, f'{title} Data Not Available')
+        return
+
+    plot = LinePlot()
+    plot.x = MARGIN_LEFT
+    plot.y = y + MARGIN_BOTTOM
+    plot.width = plot_width
+    plot.height = plot_height
+    plot.data = data
+    plot.joinedLines = 1
+    for index, (color, dashed) in enumerate(styles):
+        plot.lines[index].strokeColor = color
+        plot.lines[index].strokeWidth = 1.2
+        if dashed:
+            plot.lines[index].strokeDashArray = (4, 2)
+
+    plot.xValueAxis.valueMin = 0
+    plot.xValueAxis.valueMax = max(float(seconds[-1]), 1.0)
+    plot.xValueAxis.labels.fontSize = 7
+    start = timestamps[0].astype(datetime)
+    plot.xValueAxis.labelTextFormat = lambda value: (start + timedelta(seconds=value)).strftime('%H:%M:%S')
+    plot.yValueAxis.labels.fontSize = 7
+    plot.yValueAxis.valueMin = 0
+    if y_max is not None:
+        plot.yValueAxis.valueMax = y_max
+    plot.yValueAxis.visibleGrid = 1
+    plot.yValueAxis.gridStrokeColor = colors.lightgrey
+    drawing.add(plot)
+
+    drawing.add(String(MARGIN_LEFT + plot_width / 2, y + height - 14, title, fontName='Helvetica-Bold',
+                       fontSize=11, textAnchor='middle'))
+    drawing.add(_rotated(String(0, 0, y_label, fontName='Helvetica', fontSize=8, textAnchor='middle'),
+                         12, plot.y + plot_height / 2))
+
+    legend = Legend()
+    legend.x = MARGIN_LEFT + plot_width + 10
+    legend.y = plot.y + plot_height
+    legend.fontSize = 7
+    legend.boxAnchor = 'nw'
+    legend.columnMaximum = 10
+    legend.dx = 8
+    legend.dy = 6
+    legend.colorNamePairs = pairs
+    drawing.add(legend)
+
+
+def _rotated(string: String, x: float, y: float) -> Group:
+    """(x, y)에 90도 회전하여 놓은 문자열 (세로 축 이름)"""
+    group = Group(string)
+    group.transform = (0, 1, -1, 0, x, y)
+    return group
+
+
+def _drawing(height_inches: float) -> Drawing:
+    """차트 너비의 빈 Drawing"""
+    return Drawing(CHART_WIDTH, height_inches * inch)
+
+
+def chart_cpu(series: MetricSeries, max_points: int = DEFAULT_CHART_POINTS) -> Drawing:
+    """CPU 사용률 및 온도 차트"""
+    drawing = _drawing(4)
+    half = drawing.height / 2
+    _panel(drawing, half, half, series, 'CPU Usage Over Time', 'CPU Usage (%)',
+           [('CPU Usage', colors.blue, False, series.get('cpu', 'percent'))], max_points, y_max=100)
+    _panel(drawing, 0, half, series, 'CPU Temperature Over Time', 'Temperature (°C)',
+           [('CPU Temperature', colors.red, False, series.get('cpu', 'temperature'))], max_points)
+    return drawing
+
+
+def chart_memory(series: MetricSeries, max_points: int = DEFAULT_CHART_POINTS) -> Drawing:
+    """메모리 및 스왑 사용률 차트"""
+    drawing = _drawing(3)
+    _panel(drawing, 0, drawing.height, series, 'Memory and Swap Usage Over Time', 'Usage (%)',
+           [('Memory Usage', colors.blue, False, series.get('memory', 'percent')),
+            ('Swap Usage', colors.orange, False, series.get('memory', 'swap_percent'))],
+           max_points, y_max=100)
+    return drawing
+
+
+def chart_disk(series: MetricSeries, max_points: int = DEFAULT_CHART_POINTS) -> Drawing:
+    """디스크 사용률 차트"""
+    drawing = _drawing(3)
+    _panel(drawing, 0, drawing.height, series, 'Disk Usage Over Time', 'Usage (%)',
+           [('Disk Usage', colors.green, False, series.get('disk', 'percent'))], max_points, y_max=100)
+    return drawing
+
+
+def chart_disk_io(series: MetricSeries, max_points: int = DEFAULT_CHART_POINTS) -> Drawing:
+    """디스크 장치별 I/O 처리량 및 사용률 차트"""
+    drawing = _drawing(4)
+    half = drawing.height / 2
+    devices = series.children('disk', 'devices')
+    throughput = []
+    util = []
+    for index, name in enumerate(devices):
+        color = COLORS[index % len(COLORS)]
+        throughput.append((f'{name} Read', color, False,
+                           series.get('disk', 'devices', name, 'read_bytes_per_sec') / 1_000_000))
+        throughput.append((f'{name} Write', color, True,
+                           series.get('disk', 'devices', name, 'write_bytes_per_sec') / 1_000_000))
+        util.append((name, color, False, series.get('disk', 'devices', name, 'util_percent')))
+
+    _panel(drawing, half, half, series, 'Disk I/O Throughput Over Time', 'Throughput (MB/s)',
+           throughput, max_points)
+    _panel(drawing, 0, half, series, 'Disk Utilization Over Time', 'Utilization (%)', util, max_points, y_max=100)
+    return drawing
+
+
+def chart_network(series: MetricSeries, max_points: int = DEFAULT_CHART_POINTS) -> Drawing:
+    """인터페이스별 네트워크 업로드/다운로드 속도 차트"""
+    drawing = _drawing(4)
+    half = drawing.height / 2
+    interfaces = [name for name in series.children('network', 'interfaces') if name != 'lo']
+    if interfaces:
+        upload = [(name, COLORS[index % len(COLORS)], False,
+                   series.get('network', 'interfaces', name, 'upload_speed_mbps'))
+                  for index, name in enumerate(interfaces)]
+        download = [(name, COLORS[index % len(COLORS)], False,
+                     series.get('network', 'interfaces', name, 'download_speed_mbps'))
+                    for index, name in enumerate(interfaces)]
+    else:
+        # 인터페이스별 데이터가 없는 경우 전체 합계 사용
+        upload = [('Total', colors.red, False, series.get('network', 'upload_speed_mbps'))]
+        download = [('Total', colors.blue, False, series.get('network', 'download_speed_mbps'))]
+
+    _panel(drawing, half, half, series, 'Network Upload Speed by Interface', 'Upload (Mbps)', upload, max_points)
+    _panel(drawing, 0, half, series, 'Network Download Speed by Interface', 'Download (Mbps)', download, max_points)
+    return drawing
+
+
+def chart_gpu(series: MetricSeries, max_points: int = DEFAULT_CHART_POINTS) -> Drawing:
+    """GPU 사용률 및 온도 차트"""
+    drawing = _drawing(4)
+    gpu_ids = sorted(series.children('gpu', 'gpus'), key=int)
+    if not gpu_ids:
+        message = 'No GPU Detected' if series.children('gpu') else 'GPU Not Available or No Data'
+        _message(drawing, 0, 0, drawing.width, drawing.height, 'GPU Usage and Temperature', message)
+        return drawing
+
+    half = drawing.height / 2
+    load = []
+    temperature = []
+    for index, gpu_id in enumerate(gpu_ids):
+        color = COLORS[index % len(COLORS)]
+        label = f"GPU {gpu_id} ({series.text('gpu', 'gpus', gpu_id, 'name')})"
+        load.append((label, color, False, series.get('gpu', 'gpus', gpu_id, 'load')))
+        temperature.append((label, color, False, series.get('gpu', 'gpus', gpu_id, 'temperature')))
+
+    _panel(drawing, half, half, series, 'GPU Usage Over Time', 'GPU Load (%)', load, max_points, y_max=100)
+    _panel(drawing, 0, half, series, 'GPU Temperature Over Time', 'Temperature (°C)', temperature, max_points)
+    return drawing
+
+
+# 차트 이름: 그리기 함수 (GraphGenerator.generate_all_graphs()와 같은 이름)
+CHARTS: Dict[str, Callable[[MetricSeries, int], Drawing]] = {
+    'cpu': chart_cpu,
+    'memory': chart_memory,
+    'disk': chart_disk,
+    'disk_io': chart_disk_io,
+    'network': chart_network,
+    'gpu': chart_gpu,
+}
+
+
+def build_charts(data_history, max_points: int = DEFAULT_CHART_POINTS) -> Dict[str, Drawing]:
+    """
+    모든 차트 생성 (matplotlib을 사용하지 않음)
+
+    Args:
+        data_history: 수집 히스토리 (딕셔너리 목록, HistoryView 또는 MetricSeries)
+        max_points: 선마다 남길 최대 점 개수
+
+    Returns:
+        차트 이름별 Drawing (PDFReporter.generate_report()의 graph_paths로 전달 가능)
+    """
+    series = MetricSeries.from_history(data_history)
+    return {name: chart(series, max_points) for name, chart in CHARTS.items()}
@@ -0,0 +1,136 @@
+"""
+백그라운드 샘플링 세션 모듈
+with 블록 동안 별도 스레드에서 일정 간격으로 시스템 리소스를 수집합니다.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+try:
+    from .scheduler import SamplingScheduler
+except ImportError:
+    from scheduler import SamplingScheduler
+
+
+class _StoppableScheduler(SamplingScheduler):
+    """종료 요청 시 대기를 바로 끝내는 스케줄러"""
+
+    def __init__(self, interval: float, stop_event: threading.Event):
+        super().__init__(interval)
+        self.stop_event = stop_event
+
+    def _sleep_until(self, deadline: float):
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            self.stop_event.wait(remaining)
+
+    def _record_jitter(self, lateness: float):
+        # 종료 요청으로 대기가 끝난 시점은 수집하지 않으므로 기록하지 않음
+        if not self.stop_event.is_set():
+            super()._record_jitter(lateness)
+
+
+class SamplingSession:
+    """
+    백그라운드 샘플링 세션
+
+    Example:
+        with collector.session(interval=0.5) as session:
+            run_workload()
+            print(session.latest['cpu']['percent'])
+        graph_generator.generate_all_graphs(session.history)
+
+    세션 스레드가 collect_all()을 호출하므로 세션 중에는 같은 수집기를 다른 곳에서
+    수집하지 않아야 합니다. latest는 스레드가 새 결과로 참조만 바꾸므로 잠금 없이
+    읽을 수 있으며, with 블록이 끝나면 세션 동안의 샘플이 history로 넘겨집니다.
+    """
+
+    def __init__(self, collector, interval: float = 1.0, duration: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            collector: ResourceCollector
+            interval: 수집 간격 (초)
+            duration: 최대 수집 시간 (초, None이면 종료할 때까지)
+        """
+        if interval <= 0:
+            raise ValueError("수집 간격은 0보다 커야 합니다.")
+
+        self.collector = collector
+        self.interval = interval
+        self.duration = duration
+        self.samples = 0
+        self.error: Optional[Exception] = None
+        self.history: List[Dict] = []
+        self._latest: Optional[Dict] = None
+        self._stop_event = threading.Event()
+        self.scheduler = _StoppableScheduler(interval, self._stop_event)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def latest(self) -> Optional[Dict]:
+        """가장 최근 수집 결과 (아직 없으면 None)"""
+        return self._latest
+
+    @property
+    def running(self) -> bool:
+        """수집 스레드 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        """수집 스레드 본체"""
+        try:
+            for _ in self.scheduler.ticks(duration=self.duration if self.duration is not None else float('inf')):
+                if self._stop_event.is_set():
+                    break
+                self._latest = self.collector.collect_all()
+                self.samples += 1
+        except Exception as e:
+            print(f"백그라운드 수집 오류: {e}")
+            self.error = e
+
+    def start(self) -> 'SamplingSession':
+        """수집 스레드 시작 (첫 수집은 바로 실행)"""
+        if self.running:
+            raise RuntimeError("이미 실행 중인 세션입니다.")
+
+        self._stop_event.clear()
+        self.samples = 0
+        self.history = []
+        self.error = None
+        self.scheduler.reset_stats()
+        self._thread = threading.Thread(target=self._run, name='sampling-session', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> List[Dict]:
+        """
+        수집 스레드를 종료하고 세션 동안 수집된 히스토리 반환
+
+        진행 중인 수집은 끝날 때까지 기다립니다.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        # 수집기 히스토리에서 이 세션의 샘플만 가져옴 (용량을 넘은 오래된 샘플은 제외)
+        history = self.collector.get_history()
+        count = min(self.samples, len(history))
+        self.history = history[len(history) - count:] if count else []
+        return self.history
+
+    def get_stats(self) -> Dict:
+        """스케줄러 통계 (수집 횟수, 누락, jitter)"""
+        stats = self.scheduler.get_stats()
+        # 종료 요청과 겹친 시점은 수집하지 않았으므로 실제 수집 횟수로 표시
+        stats['ticks'] = self.samples
+        return stats
+
+    def __enter__(self) -> 'SamplingSession':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,326 @@
+"""
+샘플링 스케줄러 모듈
+monotonic 시계의 절대 시각(deadline)에 맞춰 수집 시점을 정합니다.
+"""
+
+import math
+import os
+import time
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+
+class SamplingScheduler:
+    """
+    드리프트 없는 deadline 기반 샘플링 스케줄러
+
+    i번째 수집 시점을 '시작 시각 + i * interval'로 고정하므로 수집에 걸린 시간이
+    누적되지 않습니다. 수집이 늦어져 지나가 버린 시점은 건너뛰고 그 개수를
+    missed_ticks에 세며, 각 수집이 예정 시각보다 늦은 정도(jitter)의 통계를 집계합니다.
+    """
+
+    def __init__(self, interval: float):
+        """
+        초기화
+
+        Args:
+            interval: 수집 간격 (초)
+        """
+        if interval <= 0:
+            raise ValueError("수집 간격은 0보다 커야 합니다.")
+
+        self.interval = interval
+        # 간격이 바뀐 시점의 기준 시각과 시점 번호 (deadline = 기준 시각 + (i - 기준 번호) * interval)
+        self._base_time = 0.0
+        self._base_tick = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """이전 실행의 수집 횟수, 누락, jitter, 시작/종료 시각 초기화"""
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+        self.missed_ticks = 0
+        self.current_tick = 0
+        self._jitter_count = 0
+        self._jitter_sum = 0.0
+        self._jitter_sum_sq = 0.0
+        self._jitter_max = 0.0
+
+    def _record_jitter(self, lateness: float):
+        """예정 시각 대비 지연 시간 기록"""
+        self._jitter_count += 1
+        self._jitter_sum += lateness
+        self._jitter_sum_sq += lateness * lateness
+        self._jitter_max = max(self._jitter_max, lateness)
+
+    def _sleep_until(self, deadline: float):
+        """deadline까지 대기"""
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _deadline(self, tick: int) -> float:
+        """시점 번호의 예정 시각"""
+        return self._base_time + (tick - self._base_tick) * self.interval
+
+    def set_interval(self, interval: float, tick: int):
+        """
+        수집 간격 변경 (다음 시점은 지금부터 새 간격 뒤에 실행)
+
+        Args:
+            interval: 새 수집 간격 (초)
+            tick: 다음 시점 번호
+        """
+        if interval <= 0:
+            raise ValueError("수집 간격은 0보다 커야 합니다.")
+        self._base_time = time.monotonic() + interval
+        self._base_tick = tick
+        self.interval = interval
+
+    def _start(self, count: Optional[int], duration: Optional[float]) -> Optional[float]:
+        """시작 시각 기록 후 종료 시각 반환 (duration이 없으면 None)"""
+        if count is None and duration is None:
+            raise ValueError("count 또는 duration을 지정해야 합니다.")
+
+        self.start_time = time.monotonic()
+        self.end_time = None
+        self._base_time = self.start_time
+        self._base_tick = 0
+        return self.start_time + duration if duration is not None else None
+
+    def _next_tick(self, tick: int, count: Optional[int]) -> int:
+        """다음 시점 번호 계산 (이미 지나간 시점은 누락으로 기록)"""
+        next_tick = tick + 1
+        now = time.monotonic()
+        if next_tick > self._base_tick:
+            latest_due = self._base_tick + math.floor((now - self._base_time) / self.interval)
+            limit = latest_due if count is None else min(latest_due, count)
+            if next_tick < limit:
+                self.missed_ticks += limit - next_tick
+                next_tick = limit
+        return next_tick
+
+    def ticks(self, count: Optional[int] = None, duration: Optional[float] = None) -> Iterator[int]:
+        """
+        수집 시점마다 시점 번호(0부터)를 반환하는 이터레이터
+
+        이전 수집이 길어져 다음 시점을 이미 지난 경우 그 시점들은 건너뜁니다.
+        count와 duration 중 먼저 도달하는 조건에서 종료합니다.
+
+        Args:
+            count: 전체 수집 시점 수
+            duration: 최대 수집 시간 (초, 이 시간을 넘는 시점은 실행하지 않음)
+        """
+        end_time = self._start(count, duration)
+        tick = 0
+        try:
+            while count is None or tick < count:
+                deadline = self._deadline(tick)
+                if end_time is not None and deadline > end_time:
+                    break
+                self._sleep_until(deadline)
+                self._record_jitter(time.monotonic() - deadline)
+
+                self.current_tick = tick
+                yield tick
+                tick = self._next_tick(tick, count)
+        finally:
+            self.end_time = time.monotonic()
+
+    async def aticks(self, count: Optional[int] = None, duration: Optional[float] = None) -> AsyncIterator[int]:
+        """
+        ticks()의 asyncio 버전 (대기 중에는 이벤트 루프에 양보)
+
+        Args:
+            count: 전체 수집 시점 수 (None이면 duration까지, 둘 다 None이면 취소될 때까지)
+            duration: 최대 수집 시간 (초)
+        """
+        # 동기 수집만 쓰는 경우 asyncio를 불러오지 않도록 사용할 때 불러옴
+        import asyncio
+
+        if count is None and duration is None:
+            duration = math.inf
+        end_time = self._start(count, duration)
+        tick = 0
+        try:
+            while count is None or tick < count:
+                deadline = self._deadline(tick)
+                if end_time is not None and deadline > end_time:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                self._record_jitter(time.monotonic() - deadline)
+
+                self.current_tick = tick
+                yield tick
+                tick = self._next_tick(tick, count)
+        finally:
+            self.end_time = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """스케줄러 시작부터 종료(또는 현재)까지의 시간 (초)"""
+        if self.start_time is None:
+            return 0.0
+        end = self.end_time if self.end_time is not None else time.monotonic()
+        return end - self.start_time
+
+    def get_stats(self) -> Dict:
+        """수집 횟수, 누락된 시점 수, jitter 통계 (밀리초) 반환"""
+        count = self._jitter_count
+        mean = self._jitter_sum / count if count else 0.0
+        variance = max(0.0, self._jitter_sum_sq / count - mean * mean) if count else 0.0
+        return {
+            'ticks': count,
+            'missed_ticks': self.missed_ticks,
+            'interval': self.interval,
+            'jitter_mean_ms': mean * 1000,
+            'jitter_std_ms': math.sqrt(variance) * 1000,
+            'jitter_max_ms': self._jitter_max * 1000,
+            'elapsed_seconds': self.elapsed
+        }
+
+
+class AdaptiveScheduler(SamplingScheduler):
+    """
+    지표 변화량에 따라 수집 간격을 조절하는 스케줄러
+
+    observe()로 받은 수집 결과를 직전 결과와 비교하여 CPU, 메모리, 네트워크 중
+    하나라도 크게 변하면 간격을 줄이고, 모두 안정적이면 간격을 늘립니다.
+    간격은 항상 min_interval과 max_interval 사이로 유지됩니다.
+    """
+
+    # 지표별 '크게 변했다'고 보는 수집 간 변화량 (CPU/메모리: %p, 네트워크: Mbps)
+    THRESHOLDS = {
+        'cpu': 10.0,
+        'memory': 2.0,
+        'network': 1.0,
+    }
+
+    # 변화량이 임계값의 이 비율 미만이면 안정적인 것으로 판단
+    STABLE_RATIO = 0.25
+
+    # 간격을 줄이고 늘리는 배율
+    SHRINK_FACTOR = 0.5
+    GROW_FACTOR = 1.25
+
+    def __init__(self, interval: float, min_interval: float, max_interval: float):
+        """
+        초기화
+
+        Args:
+            interval: 시작 수집 간격 (초)
+            min_interval: 최소 수집 간격 (초)
+            max_interval: 최대 수집 간격 (초)
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("0 < 최소 간격 <= 최대 간격이어야 합니다.")
+
+        super().__init__(min(max(interval, min_interval), max_interval))
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval_changes = 0
+        self._last_metrics: Optional[Dict[str, float]] = None
+
+    @staticmethod
+    def _metrics(data: Dict) -> Dict[str, float]:
+        """수집 결과에서 변화량을 볼 지표 추출"""
+        network = data.get('network', {})
+        return {
+            'cpu': data.get('cpu', {}).get('percent', 0.0),
+            'memory': data.get('memory', {}).get('percent', 0.0),
+            'network': network.get('upload_speed_mbps', 0.0) + network.get('download_speed_mbps', 0.0),
+        }
+
+    def volatility(self, data: Dict) -> float:
+        """직전 수집 대비 변화량 (임계값 대비 비율의 최댓값)"""
+        metrics = self._metrics(data)
+        last = self._last_metrics
+        self._last_metrics = metrics
+        if last is None:
+            return 0.0
+        return max(abs(metrics[name] - last[name]) / threshold
+                   for name, threshold in self.THRESHOLDS.items())
+
+    def observe(self, data: Dict):
+        """
+        수집 결과를 반영하여 다음 수집 간격 결정
+
+        Args:
+            data: collect_all() 결과
+        """
+        score = self.volatility(data)
+        if score >= 1.0:
+            interval = self.interval * self.SHRINK_FACTOR
+        elif score < self.STABLE_RATIO:
+            interval = self.interval * self.GROW_FACTOR
+        else:
+            return
+
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        if interval != self.interval:
+            self.set_interval(interval, self.current_tick + 1)
+            self.interval_changes += 1
+
+    def get_stats(self) -> Dict:
+        """기본 통계에 간격 범위와 변경 횟수 추가"""
+        stats = super().get_stats()
+        stats['min_interval'] = self.min_interval
+        stats['max_interval'] = self.max_interval
+        stats['interval_changes'] = self.interval_changes
+        return stats
+
+
+class CpuBudget:
+    """
+    모니터링 프로세스 자체의 CPU 사용률 측정
+
+    os.times()의 user + system 시간을 경과 시간과 비교하여, window 초마다
+    최근 구간의 CPU 사용률(%)을 계산합니다.
+    """
+
+    def __init__(self, budget_percent: float, window: float = 1.0):
+        """
+        초기화
+
+        Args:
+            budget_percent: 허용하는 CPU 사용률 (%, 코어 1개 기준)
+            window: CPU 사용률을 계산하는 구간 길이 (초)
+        """
+        self.budget_percent = budget_percent
+        self.window = window
+        self._start_wall = time.monotonic()
+        self._start_cpu = self._cpu_time()
+        self._window_wall = self._start_wall
+        self._window_cpu = self._start_cpu
+        self.last_percent = 0.0
+
+    @staticmethod
+    def _cpu_time() -> float:
+        """현재 프로세스의 누적 CPU 시간 (초)"""
+        times = os.times()
+        return times.user + times.system
+
+    def update(self) -> Optional[float]:
+        """구간이 끝났으면 그 구간의 CPU 사용률(%)을 반환, 아니면 None"""
+        now = time.monotonic()
+        if now - self._window_wall < self.window:
+            return None
+
+        cpu = self._cpu_time()
+        self.last_percent = (cpu - self._window_cpu) / (now - self._window_wall) * 100
+        self._window_wall = now
+        self._window_cpu = cpu
+        return self.last_percent
+
+    @property
+    def exceeded(self) -> bool:
+        """최근 구간의 CPU 사용률이 허용치를 넘었는지 여부"""
+        return self.last_percent > self.budget_percent
+
+    def overall_percent(self) -> float:
+        """측정 시작부터 현재까지의 평균 CPU 사용률 (%)"""
+        elapsed = time.monotonic() - self._start_wall
+        if elapsed <= 0:
+            return 0.0
+        return (self._cpu_time() - self._start_cpu) / elapsed * 100
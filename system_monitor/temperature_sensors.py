@@ -0,0 +1,208 @@
+"""
+CPU 온도 센서 모듈
+sysfs hwmon 센서를 한 번만 탐색하고 선택된 입력 파일만 반복해서 읽습니다.
+"""
+
+import errno
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+
+try:
+    from .procfs_backend import PreadFile
+except ImportError:
+    from procfs_backend import PreadFile
+
+# CPU 온도로 우선 사용할 센서 칩 이름 (앞쪽일수록 우선)
+PREFERRED_CHIPS = ('coretemp', 'k10temp', 'zenpower', 'cpu_thermal', 'cpu-thermal', 'soc_thermal')
+
+# 패키지 전체 온도를 나타내는 라벨 접두어
+PACKAGE_LABEL_PREFIXES = ('Package id', 'Physical id', 'Tdie', 'Tctl')
+
+# 센서 재탐색 주기 기본값 (초)
+DEFAULT_REFRESH_INTERVAL = 300.0
+
+
+class TemperatureSensors:
+    """
+    캐시된 CPU 온도 센서 리더
+
+    최초 호출과 refresh_interval마다 {sys_root}/class/hwmon을 탐색하여 CPU 칩의
+    temp*_input 파일을 고르고, 그 사이에는 열어 둔 파일만 다시 읽습니다.
+    """
+
+    def __init__(self, sys_root: str = '/sys', refresh_interval: float = DEFAULT_REFRESH_INTERVAL):
+        """
+        초기화
+
+        Args:
+            sys_root: sysfs 경로
+            refresh_interval: 센서 재탐색 주기 (초)
+        """
+        self.sys_root = sys_root
+        self.refresh_interval = refresh_interval
+        self.chip: Optional[str] = None
+        # (라벨, 입력 파일) 목록. 첫 번째 항목이 대표 CPU 온도
+        self._inputs: List[Tuple[str, PreadFile]] = []
+        self._next_discovery = 0.0
+
+    def _list_hwmon_chips(self) -> Dict[str, List[Tuple[int, str, str]]]:
+        """hwmon 칩 이름별 (번호, 라벨, 입력 파일 경로) 목록"""
+        chips: Dict[str, List[Tuple[int, str, str]]] = {}
+        hwmon_root = os.path.join(self.sys_root, 'class', 'hwmon')
+        try:
+            hwmons = sorted(os.listdir(hwmon_root))
+        except OSError:
+            return chips
+
+        for hwmon in hwmons:
+            hwmon_dir = os.path.join(hwmon_root, hwmon)
+            chip = self._read_chip_name(hwmon_dir)
+            if chip is None:
+                continue
+            # 오래된 드라이버는 temp*_input을 hwmon*/device/ 아래에 둠 (psutil과 같은 순서로 탐색)
+            for directory in (hwmon_dir, os.path.join(hwmon_dir, 'device')):
+                try:
+                    names = os.listdir(directory)
+                except OSError:
+                    continue
+                inputs = []
+                for name in names:
+                    if not (name.startswith('temp') and name.endswith('_input')):
+                        continue
+                    number = name[4:-len('_input')]
+                    if not number.isdigit():
+                        continue
+                    try:
+                        with open(os.path.join(directory, f'temp{number}_label')) as f:
+                            label = f.read().strip()
+                    except OSError:
+                        label = ''
+                    inputs.append((int(number), label, os.path.join(directory, name)))
+                if inputs:
+                    chips.setdefault(chip, []).extend(inputs)
+                    break
+
+        for inputs in chips.values():
+            inputs.sort()
+        return chips
+
+    @staticmethod
+    def _read_chip_name(hwmon_dir: str) -> Optional[str]:
+        """hwmon 칩 이름 (hwmon*/name, 없으면 hwmon*/device/name)"""
+        for path in (os.path.join(hwmon_dir, 'name'), os.path.join(hwmon_dir, 'device', 'name')):
+            try:
+                with open(path) as f:
+                    return f.read().strip()
+            except OSError:
+                continue
+        return None
+
+    def _list_thermal_zones(self) -> Dict[str, List[Tuple[int, str, str]]]:
+        """hwmon이 없을 때 사용할 thermal_zone 센서 목록"""
+        chips: Dict[str, List[Tuple[int, str, str]]] = {}
+        thermal_root = os.path.join(self.sys_root, 'class', 'thermal')
+        try:
+            zones = sorted(name for name in os.listdir(thermal_root) if name.startswith('thermal_zone'))
+        except OSError:
+            return chips
+
+        for zone in zones:
+            try:
+                with open(os.path.join(thermal_root, zone, 'type')) as f:
+                    chip = f.read().strip()
+            except OSError:
+                continue
+            number = zone[len('thermal_zone'):]
+            chips.setdefault(chip, []).append((int(number) if number.isdigit() else 0, '',
+                                               os.path.join(thermal_root, zone, 'temp')))
+        return chips
+
+    def discover(self):
+        """센서 탐색 및 CPU 칩의 입력 파일 캐시"""
+        self.close()
+        self._next_discovery = time.monotonic() + self.refresh_interval
+
+        chips = self._list_hwmon_chips() or self._list_thermal_zones()
+        if not chips:
+            self.chip = None
+            return
+
+        self.chip = next((name for name in PREFERRED_CHIPS if name in chips), next(iter(chips)))
+        for _, label, path in chips[self.chip]:
+            try:
+                self._inputs.append((label, PreadFile(path, buffer_size=64)))
+            except OSError:
+                continue
+
+    def _drop_input(self, label: str, handle: PreadFile):
+        """읽을 수 없는 입력 파일을 다음 탐색까지 목록에서 제외"""
+        handle.close()
+        self._inputs.remove((label, handle))
+
+    def close(self):
+        """열어 둔 센서 파일 닫기"""
+        for _, handle in self._inputs:
+            handle.close()
+        self._inputs = []
+
+    def read(self) -> Dict:
+        """
+        CPU 온도 읽기 (°C)
+
+        Returns:
+            temperature: 대표 CPU 온도 (칩의 첫 번째 센서)
+            temperature_package: 패키지 온도 (여러 패키지인 경우 최댓값)
+            temperature_cores: 코어별 온도 목록
+        """
+        if not sys.platform.startswith('linux'):
+            return self._read_psutil()
+
+        if time.monotonic() >= self._next_discovery:
+            self.discover()
+
+        temperature = None
+        packages = []
+        cores = []
+        for label, handle in list(self._inputs):
+            try:
+                value = int(handle.read()) / 1000.0
+            except OSError as e:
+                if e.errno in (errno.ENOENT, errno.ENODEV):
+                    # 센서가 사라진 경우 다음 수집에서 다시 탐색
+                    self._next_discovery = 0.0
+                else:
+                    # 계속 실패하는 센서(EIO, ENODATA 등)는 다음 정기 탐색까지 제외
+                    self._drop_input(label, handle)
+                continue
+            except ValueError:
+                self._drop_input(label, handle)
+                continue
+            if temperature is None:
+                temperature = value
+            if label.startswith(PACKAGE_LABEL_PREFIXES):
+                packages.append(value)
+            elif label.startswith('Core'):
+                cores.append(value)
+
+        return {
+            'temperature': temperature,
+            'temperature_package': max(packages) if packages else None,
+            'temperature_cores': cores,
+        }
+
+    @staticmethod
+    def _read_psutil() -> Dict:
+        """sysfs가 없는 플랫폼에서 psutil로 온도 읽기"""
+        temperature = None
+        try:
+            temps = psutil.sensors_temperatures()
+            chip = next((name for name in PREFERRED_CHIPS if name in temps), next(iter(temps), None))
+            if chip and temps[chip]:
+                temperature = temps[chip][0].current
+        except (AttributeError, KeyError, IndexError):
+            temperature = None
+        return {'temperature': temperature, 'temperature_package': None, 'temperature_cores': []}